@@ -1,21 +1,51 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, date, timedelta
 import json
 import os
 import sys
-import re
+from concurrent.futures import ThreadPoolExecutor
 
 # 상위 디렉토리의 모듈 import를 위해 경로 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Supabase 클라이언트 import
-from supabase_client import supabase_client
+from supabase_client import get_supabase_client
+from company_directory import CompanyDirectory, get_company_directory, LOADED, EMPTY, CONNECTION_FAILED, SAMPLE
+from period_parser import first_date, parse_period
+from company_snapshot import CompanySnapshot
+from recommendation_view import (
+    count_high_score, recommendation_frame, sort_recommendations, display_frame, summarize_recommendations,
+)
+from metrics import get_client_metrics, start_exporters
+from tracing import bind, span, traced
 
 # Supabase 기반 추천 시스템 사용
 
+# 처음 실행 시 기본으로 선택하는 회사
+DEFAULT_COMPANY_NAME = "대박드림스"
+# 세션마다 탭 데이터를 미리 조회하는 스레드 수 (0이면 미리 조회하지 않고 탭 직전에 조회)
+# 재실행마다 미리 조회하는 작업은 하나(회사 스냅샷)이므로 1이면 충분함
+TAB_PREFETCH_WORKERS = int(os.environ.get("TAB_PREFETCH_WORKERS", "1"))
+# 회사 검색 결과를 드롭다운에 표시하는 최대 개수
+COMPANY_SEARCH_LIMIT = 200
+# 1이면 사이드바에 Supabase 조회 지표(관리자 패널)를 표시
+ADMIN_PANEL = os.environ.get("ADMIN_PANEL") == "1"
+# 조회 지표 요약 컬럼 -> 관리자 패널 표 컬럼
+METRIC_COLUMN_NAMES = {
+    'method': '메서드',
+    'table': '테이블',
+    'requests': '조회 수',
+    'errors': '오류',
+    'rows': '행 수',
+    'response_bytes': '응답 바이트',
+    'cache_hits': '캐시 적중',
+    'cache_misses': '캐시 미스',
+    'mean_ms': '평균(ms)',
+    'p50_ms': 'p50(ms)',
+    'p95_ms': 'p95(ms)',
+}
+
 # 페이지 설정
 st.set_page_config(
     page_title="스타트업 정부지원사업 추천 시스템",
@@ -70,28 +100,100 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 def load_company_list():
-    """Supabase에서 회사 목록을 로드하는 함수"""
-    try:
-        # Supabase 연결 테스트
-        if hasattr(supabase_client, 'test_connection'):
-            connection_ok = supabase_client.test_connection()
-            if not connection_ok:
-                st.warning("⚠️ Supabase 연결에 실패했습니다. 샘플 데이터를 사용합니다.")
-                return get_sample_companies()
-        
-        # Supabase에서 회사 목록 가져오기
-        companies = supabase_client.get_companies()
-        
-        if companies:
-            st.success(f"✅ {len(companies)}개 회사 데이터를 Supabase에서 로드했습니다.")
-            return companies
+    """프로세스 공용 회사 목록을 가져옵니다.
+    
+    모든 세션이 같은 목록(company_directory)을 함께 쓰므로, Supabase 조회는 처음 또는
+    COMPANY_DIRECTORY_TTL이 지난 뒤 한 세션에서만 일어납니다. 조회하는 세션에만 진행 상황을 표시합니다.
+    """
+    progress = st.empty()
+    directory = get_company_directory(
+        on_progress=lambda count: progress.caption(f"⏳ 회사 데이터를 불러오는 중... ({count}개)")
+    )
+    progress.empty()
+    return directory
+
+@st.cache_resource
+def get_sample_directory():
+    """Supabase에서 회사 목록을 가져오지 못했을 때 쓰는 샘플 회사 목록"""
+    return CompanyDirectory(get_sample_companies(), status=SAMPLE)
+
+def get_selected_company():
+    """세션에 저장된 선택 회사 id로 회사 정보를 찾습니다. 선택하지 않았거나 회사 목록에 없으면 None입니다."""
+    company_id = st.session_state.get('selected_company')
+    directory = st.session_state.get('company_directory')
+    if company_id is None or directory is None:
+        return None
+    return directory.get(company_id)
+
+def show_company_directory_status(directory):
+    """회사 목록 조회 결과 안내 (세션의 첫 실행에서만 표시)"""
+    if directory.status == LOADED:
+        st.success(f"✅ {len(directory)}개 회사 데이터를 Supabase에서 로드했습니다.")
+    elif directory.status == EMPTY:
+        st.warning("⚠️ Supabase에서 회사 데이터를 가져올 수 없습니다. 샘플 데이터를 사용합니다.")
+    elif directory.status == CONNECTION_FAILED:
+        st.warning("⚠️ Supabase 연결에 실패했습니다. 샘플 데이터를 사용합니다.")
+    else:
+        st.error(f"회사 목록 로드 중 오류: {directory.error}")
+
+def get_prefetch_pool():
+    """이 세션의 탭 데이터 조회용 스레드 풀 (재실행끼리 함께 사용)
+
+    프로세스 공용 풀을 쓰면 동시 세션이 많을 때 한 세션의 미리 조회가 다른 세션들의 조회 뒤에 줄을 서므로
+    세션마다 따로 둡니다. 세션이 끝나 세션 상태가 사라지면 풀도 정리되어 유휴 스레드가 종료됩니다.
+    """
+    if 'prefetch_pool' not in st.session_state:
+        st.session_state.prefetch_pool = ThreadPoolExecutor(max_workers=TAB_PREFETCH_WORKERS,
+                                                            thread_name_prefix='tab-prefetch')
+    return st.session_state.prefetch_pool
+
+def prefetch_tab_data(company_name):
+    """탭들이 사용할 데이터를 스레드 풀에서 미리 조회하기 시작하고 {이름: future}를 반환합니다.
+    
+    작업 스레드에서는 st.* 를 호출하지 않으므로 세션 상태는 여기(스크립트 스레드)에서 읽어 넘깁니다.
+    """
+    if TAB_PREFETCH_WORKERS <= 0:
+        return {}
+    return {
+        # 클라이언트도 작업 스레드에서 처음 사용할 때 만들어 스크립트 스레드의 첫 화면 출력을 막지 않음
+        'company_snapshot': get_prefetch_pool().submit(
+            bind(lambda previous: CompanySnapshot.fetch(get_supabase_client(), company_name, previous=previous)),
+            st.session_state.get('company_snapshot')
+        ),
+    }
+
+def resolve_company_snapshot(prefetched, prefetched_company, company_name):
+    """미리 조회한 스냅샷을 꺼냅니다. 이번 실행에서 선택 회사가 바뀌었으면 새로 조회합니다."""
+    future = prefetched.get('company_snapshot')
+    if future is not None and prefetched_company == company_name:
+        return future.result()
+    if future is not None:
+        future.cancel()
+    return CompanySnapshot.fetch(
+        get_supabase_client(), company_name,
+        previous=st.session_state.get('company_snapshot')
+    )
+
+def show_admin_panel():
+    """관리자 패널: 프로세스 공용 Supabase 조회 지표와 결과 캐시 통계 (ADMIN_PANEL=1일 때만 표시)"""
+    metrics = get_client_metrics()
+    with st.sidebar.expander("📈 Supabase 조회 지표", expanded=False):
+        if not metrics.enabled:
+            st.info("SUPABASE_METRICS=0으로 지표 기록이 꺼져 있습니다.")
+            return
+        summary = metrics.summary()
+        if summary:
+            summary_df = pd.DataFrame(summary).rename(columns=METRIC_COLUMN_NAMES)
+            st.dataframe(summary_df.round(1), width='stretch', hide_index=True)
         else:
-            st.warning("⚠️ Supabase에서 회사 데이터를 가져올 수 없습니다. 샘플 데이터를 사용합니다.")
-            return get_sample_companies()
-            
-    except Exception as e:
-        st.error(f"회사 목록 로드 중 오류: {str(e)}")
-        return get_sample_companies()
+            st.caption("아직 기록된 조회가 없습니다.")
+        
+        cache_stats = get_supabase_client().cache_stats()
+        if cache_stats:
+            st.caption(f"결과 캐시: 적중률 {cache_stats['hit_rate']:.0%}, 항목 {cache_stats['entries']}개, "
+                       f"{cache_stats['bytes'] / 1024:.0f}KB / {cache_stats['max_bytes'] / 1024:.0f}KB")
+        st.download_button("Prometheus 텍스트 받기", metrics.render(),
+                           file_name="supabase_metrics.prom", mime="text/plain")
 
 def get_sample_companies():
     """샘플 회사 목록 반환"""
@@ -137,79 +239,84 @@ def get_company_info_for_recommendation(selected_company):
         'certifications': selected_company['certifications']
     }
 
+@traced('rerun')
 def main():
+    # 이번 실행에서 선택될 회사의 탭 데이터를 회사 목록 로드/사이드바 렌더링과 동시에 미리 조회
+    # (처음 실행이면 기본 회사, 이후에는 세션에 저장된 선택 회사)
+    if 'selected_company' in st.session_state:
+        selected_company = get_selected_company()
+        prefetched_company = selected_company['name'] if selected_company else None
+    else:
+        prefetched_company = DEFAULT_COMPANY_NAME
+    prefetched = prefetch_tab_data(prefetched_company)
+    # SUPABASE_METRICS_PORT/FILE이 설정되어 있으면 조회 지표 내보내기 시작 (프로세스당 한 번)
+    start_exporters()
+    
     # 메인 헤더
     st.markdown('<h1 class="main-header">🚀 스타트업 정부지원사업 추천 시스템</h1>', unsafe_allow_html=True)
     
-    # 회사 목록 로드
-    if 'company_list' not in st.session_state:
-        st.session_state.company_list = load_company_list()
-    
-    # 선택된 회사 정보 (세션 상태에 저장)
+    # 회사 목록 로드 (프로세스 공용 목록을 참조만 하며, 조회에 실패했으면 샘플 데이터 사용)
+    with span('load_company_list'):
+        directory = load_company_list()
+    if 'company_directory' not in st.session_state:
+        show_company_directory_status(directory)
+    if not directory.companies:
+        directory = get_sample_directory()
+    st.session_state.company_directory = directory
+    default_company_id = directory.id_for_name(DEFAULT_COMPANY_NAME)
+    
+    # 선택된 회사 (세션 상태에는 회사 id만 저장)
     if 'selected_company' not in st.session_state:
-        st.session_state.selected_company = None
-        
-        # 처음 실행 시 "대박드림스"를 기본으로 선택
-        if st.session_state.company_list:
-            default_company = next(
-                (company for company in st.session_state.company_list 
-                 if company['name'] == "대박드림스"), 
-                None
-            )
-            if default_company:
-                st.session_state.selected_company = default_company
+        # 처음 실행 시 DEFAULT_COMPANY_NAME("대박드림스")을 기본으로 선택
+        st.session_state.selected_company = default_company_id
     
     # 사이드바에 회사 선택 폼
-    with st.sidebar:
+    with st.sidebar, span('sidebar'):
         st.markdown("### 🏢 회사 선택")
         
         # 회사 검색 및 선택
         search_term = st.text_input("🔍 회사명 검색", placeholder="회사명을 입력하세요...")
         
-        # 검색 결과 필터링
+        # 검색 결과 필터링 (회사 목록의 검색 색인 사용, 초성 검색 지원)
+        search_index = directory.search_index
         if search_term:
-            filtered_companies = [company for company in st.session_state.company_list 
-                                if search_term.lower() in company['name'].lower()]
+            matches = search_index.search(search_term, limit=COMPANY_SEARCH_LIMIT)
+            if len(matches) == COMPANY_SEARCH_LIMIT:
+                st.caption(f"검색 결과 중 {COMPANY_SEARCH_LIMIT}개만 표시합니다. 검색어를 더 입력해주세요.")
+            elif not matches:
+                # 포함하는 회사가 없으면 오타를 허용해 비슷한 이름을 가까운 순으로 표시
+                matches = [i for i, _ in search_index.fuzzy_search(search_term, limit=COMPANY_SEARCH_LIMIT)]
+                if matches:
+                    st.caption("일치하는 회사가 없어 비슷한 이름의 회사를 표시합니다.")
         else:
-            filtered_companies = st.session_state.company_list[:20]  # 처음 20개만 표시
+            matches = range(min(20, len(search_index)))  # 처음 20개만 표시
         
-        # 회사 선택 드롭다운
-        if filtered_companies:
-            company_options = [f"{company['name']} ({company['industry']}, {company['region']})" 
-                             for company in filtered_companies]
+        # 회사 선택 드롭다운 (선택지는 회사 id, 화면에는 미리 계산한 표시 문자열)
+        if matches:
+            labels = {search_index.companies[i]['id']: search_index.labels[i] for i in matches}
+            company_options = list(labels)
             
-            # "대박드림스"를 기본값으로 설정
+            # DEFAULT_COMPANY_NAME을 기본값으로 설정
             default_index = 0
-            if not search_term:  # 검색 중이 아닐 때만 기본값 적용
-                for i, option in enumerate(company_options):
-                    if "대박드림스" in option:
-                        default_index = i + 1  # +1 because of "회사를 선택하세요..." option
-                        break
+            if not search_term and default_company_id in labels:  # 검색 중이 아닐 때만 기본값 적용
+                default_index = company_options.index(default_company_id) + 1  # +1 because of "회사를 선택하세요..." option
             
-            selected_option = st.selectbox(
+            selected_id = st.selectbox(
                 "회사 선택",
-                ["회사를 선택하세요..."] + company_options,
-                index=default_index
+                [None] + company_options,
+                index=default_index,
+                format_func=lambda company_id: "회사를 선택하세요..." if company_id is None else labels[company_id]
             )
             
-            if selected_option != "회사를 선택하세요...":
-                # 선택된 회사 정보 추출
-                selected_company_name = selected_option.split(" (")[0]
-                selected_company = next(
-                    (company for company in filtered_companies 
-                     if company['name'] == selected_company_name), 
-                    None
-                )
-                
-                if selected_company:
-                    st.session_state.selected_company = selected_company
-                    st.success(f"✅ {selected_company_name} 선택됨")
+            if selected_id is not None:
+                st.session_state.selected_company = selected_id
+                st.success(f"✅ {directory.get(selected_id)['name']} 선택됨")
         else:
             st.info("검색 결과가 없습니다.")
         
         # 선택된 회사 정보 표시
-        if st.session_state.selected_company:
-            company = st.session_state.selected_company
+        company = get_selected_company()
+        if company:
             st.markdown("---")
             st.markdown("#### 📋 선택된 회사 정보")
             st.markdown(f"**회사명**: {company['name']}")
@@ -224,6 +331,13 @@ def main():
                 st.session_state.selected_company = None
                 st.rerun()
     
+    # 선택된 회사의 추천 공고를 이번 실행에서 한 번만 조회해 모든 탭이 함께 사용 (미리 조회한 결과를 꺼냄)
+    selected_company = get_selected_company()
+    with span('resolve_company_snapshot'):
+        st.session_state.company_snapshot = resolve_company_snapshot(
+            prefetched, prefetched_company, selected_company['name'] if selected_company else None
+        )
+    
     # 메인 탭 구성
     tab1, tab2, tab3 = st.tabs(["🎯 맞춤 추천", "🔔 신규 공고 알림", "🗺️ 로드맵 생성"])
     
@@ -235,7 +349,12 @@ def main():
     
     with tab3:
         show_roadmap_tab()
+    
+    # 관리자 패널은 이번 실행의 조회까지 포함하도록 탭을 그린 뒤 표시
+    if ADMIN_PANEL:
+        show_admin_panel()
 
+@traced()
 def show_recommendation_tab():
     """맞춤 추천 탭"""
     st.markdown('<h2 class="sub-header">🎯 맞춤 추천</h2>', unsafe_allow_html=True)
@@ -293,11 +412,12 @@ def show_recommendation_tab():
             max_results = st.number_input("최대 결과 수", min_value=10, max_value=500, value=50)
     
     # 추천 결과 자동 생성 및 표시
-    if st.session_state.selected_company:
+    selected_company = get_selected_company()
+    if selected_company:
         with st.spinner("추천을 생성하는 중..."):
             try:
                 # 선택된 회사 정보를 추천 시스템 형식으로 변환
-                company_info = get_company_info_for_recommendation(st.session_state.selected_company)
+                company_info = get_company_info_for_recommendation(selected_company)
                 
                 # 추천 실행
                 recommendations = get_recommendations(
@@ -324,6 +444,7 @@ def show_recommendation_tab():
         # 샘플 데이터 표시
         display_sample_recommendations()
 
+@traced()
 def show_notification_tab():
     """신규 공고 알림 탭"""
     st.markdown('<h2 class="sub-header">🔔 신규 공고 알림</h2>', unsafe_allow_html=True)
@@ -332,57 +453,18 @@ def show_notification_tab():
     st.markdown("### 📊 알림 현황")
     
     try:
-        # 실제 데이터 가져오기
-        # 선택된 회사가 있으면 해당 회사의 추천을, 없으면 빈 리스트 반환
-        selected_company_name = st.session_state.selected_company['name'] if st.session_state.selected_company else None
-        
-        if selected_company_name:
-            all_recommendations = supabase_client.get_recommendations(company_name=selected_company_name, is_active_only=False)
-            new_announcements = supabase_client.get_recommendations(company_name=selected_company_name, is_new_announcements=True)
-        else:
-            all_recommendations = []
-            new_announcements = []
+        # 선택된 회사의 추천 공고 스냅샷 (회사가 없으면 빈 스냅샷)
+        snapshot = st.session_state.company_snapshot
         
         # 이번 주 신규 공고 수
-        new_count = len(new_announcements) if new_announcements else 0
-        
-        # 마감 임박 공고 수 (7일 이내) 및 이번 달 공고 수
-        today = datetime.now().date()
-        current_month = today.month
-        current_year = today.year
-        urgent_count = 0
-        high_score_count = 0
-        this_month_count = 0
-        
-        if all_recommendations:
-            for item in all_recommendations:
-                period_str = item.get('사업 연도', '')
-                if period_str:
-                    # 마감일 추출
-                    end_date_match = re.search(r'~\s*(\d{8})', period_str)
-                    if end_date_match:
-                        try:
-                            end_date = datetime.strptime(end_date_match.group(1), '%Y%m%d').date()
-                            days_left = (end_date - today).days
-                            if 0 <= days_left <= 7:
-                                urgent_count += 1
-                        except ValueError:
-                            pass
-                    
-                    # 이번 달 공고 수 계산 (시작일 기준)
-                    start_date_match = re.search(r'(\d{8})\s*~', period_str)
-                    if start_date_match:
-                        try:
-                            start_date = datetime.strptime(start_date_match.group(1), '%Y%m%d').date()
-                            if start_date.month == current_month and start_date.year == current_year:
-                                this_month_count += 1
-                        except ValueError:
-                            pass
-                
-                # 고점수 공고 (80점 이상)
-                score = item.get('최종 점수', 0)
-                if isinstance(score, (int, float)) and score >= 80:
-                    high_score_count += 1
+        new_count = len(snapshot.new)
+        
+        # 마감 임박 공고 수 (7일 이내) 및 이번 달 공고 수 (시작일 기준)
+        urgent_count = len(snapshot.urgent)
+        this_month_count = len(snapshot.this_month)
+        
+        # 고점수 공고 (80점 이상)
+        high_score_count = count_high_score(snapshot.records)
         
         col1, col2, col3, col4 = st.columns(4)
         
@@ -423,66 +505,34 @@ def show_notification_tab():
     st.markdown("### ⏰ 마감 임박 공고")
     display_deadline_announcements()
 
+@traced()
 def show_roadmap_tab():
     """로드맵 생성 탭"""
     st.markdown('<h2 class="sub-header">🗺️ 로드맵 생성</h2>', unsafe_allow_html=True)
     
     # 선택된 기업이 있는지 확인
-    if not st.session_state.get('selected_company'):
+    if not get_selected_company():
         st.warning("⚠️ 먼저 사이드바에서 기업을 선택해주세요.")
         return
     
     # 로드맵 표시
     display_roadmap()
 
+@traced()
 def get_recommendations(startup_info, recommendation_type, min_score, support_field, 
                        target_audience, region_filter, data_source, max_results):
     """Supabase에서 추천 공고 생성"""
     try:
-        # Supabase에서 추천 데이터 가져오기
-        is_active_only = (recommendation_type == "활성 공고만")
-        recommendations = supabase_client.get_recommendations(
-            company_name=startup_info['company_name'],
-            is_active_only=is_active_only
-        )
+        # 이번 실행에서 조회한 추천 공고 스냅샷 사용
+        snapshot = st.session_state.company_snapshot
+        recommendations = snapshot.active if recommendation_type == "활성 공고만" else snapshot.records
         
         if not recommendations:
             st.warning(f"⚠️ '{startup_info['company_name']}'에 대한 추천 공고가 없습니다.")
             return None
         
-        # DataFrame으로 변환
-        df = pd.DataFrame(recommendations)
-        
-        # 최종 점수 기준으로 정렬
-        df = df.sort_values('최종 점수', ascending=False)
-        
-        # 최소 점수 필터링
-        if min_score > 0:
-            df = df[df['최종 점수'] >= min_score]
-        
-        # 최대 결과 수 제한
-        if max_results > 0:
-            df = df.head(max_results)
-        
-        # 컬럼명을 기존 형식에 맞게 변경
-        df = df.rename(columns={
-            '사업명': '공고명',
-            '최종 점수': '총점수',
-            '지역': '지역명',
-            '사업 연도': '신청기간',
-            '상세페이지 URL': '공고URL'
-        })
-        
-        # 순위 추가
-        df['순위'] = range(1, len(df) + 1)
-        
-        # 데이터소스 컬럼 추가 (기본값)
-        df['데이터소스'] = 'recommend_final'
-        
-        # 지원분야, 지원대상, 소관기관 컬럼 추가 (기본값)
-        df['지원분야'] = '기타'
-        df['지원대상'] = '중소기업'
-        df['소관기관'] = '정부기관'
+        # 점수 순 추천 표로 변환 (최소 점수, 최대 결과 수 적용)
+        df = recommendation_frame(recommendations, min_score, max_results)
         
         st.success(f"✅ '{startup_info['company_name']}'에 대한 {len(df)}개 추천 공고를 찾았습니다!")
         
@@ -523,46 +573,30 @@ def apply_filters(recommendations, recommendation_type, support_field,
     
     return filtered
 
+@traced()
 def display_recommendations(recommendations, sort_option):
     """추천 결과 표시"""
     # 정렬 적용
-    if sort_option == "추천 점수 높은 순":
-        recommendations = recommendations.sort_values('총점수', ascending=False)
-    elif sort_option == "신청 마감일 빠른 순":
-        recommendations = recommendations.sort_values('신청기간', ascending=True)
-    elif sort_option == "공고 등록일 최신 순":
-        recommendations = recommendations.sort_values('공고명', ascending=False)
+    with span('sort_recommendations', rows=len(recommendations)):
+        recommendations = sort_recommendations(recommendations, sort_option)
     
     # 상세 결과 테이블 (위로 이동)
     st.markdown("### 📋 상세 추천 공고")
     
-    # 테이블 컬럼 선택
-    display_columns = [
-        '순위', '공고명', '지원분야', '지원대상', '지역명', 
-        '소관기관', '신청기간', '총점수', '데이터소스'
-    ]
-    
-    # URL 컬럼 추가 (클릭 가능한 링크로)
-    if '공고URL' in recommendations.columns:
-        display_columns.append('공고URL')
-    
-    # 테이블 표시
-    display_df = recommendations[display_columns].copy()
+    # 표시 컬럼 선택, URL을 클릭 가능한 링크로 변환
+    with span('display_frame'):
+        display_df = display_frame(recommendations)
     
-    # URL을 클릭 가능한 링크로 변환
-    if '공고URL' in display_df.columns:
-        display_df['공고URL'] = display_df['공고URL'].apply(
-            lambda x: f'<a href="{x}" target="_blank">🔗 링크</a>' if pd.notna(x) and x else ''
+    with span('st.dataframe'):
+        st.dataframe(
+            display_df,
+            width='stretch',
+            hide_index=True
         )
     
-    st.dataframe(
-        display_df,
-        width='stretch',
-        hide_index=True
-    )
-    
     # CSV 다운로드 버튼
-    csv = recommendations.to_csv(index=False, encoding='utf-8-sig')
+    with span('to_csv'):
+        csv = recommendations.to_csv(index=False, encoding='utf-8-sig')
     st.download_button(
         label="📥 추천 결과 CSV 다운로드",
         data=csv,
@@ -574,21 +608,20 @@ def display_recommendations(recommendations, sort_option):
     st.markdown("### 📊 추천 결과 요약")
     
     # 결과 요약
+    with span('summarize_recommendations'):
+        total_count, avg_score, high_score_count, unique_sources = summarize_recommendations(recommendations)
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("총 추천 수", len(recommendations))
+        st.metric("총 추천 수", total_count)
     
     with col2:
-        avg_score = recommendations['총점수'].mean()
         st.metric("평균 추천 점수", f"{avg_score:.1f}")
     
     with col3:
-        high_score_count = len(recommendations[recommendations['총점수'] >= 80])
         st.metric("고점수 공고 (80점 이상)", high_score_count)
     
     with col4:
-        unique_sources = recommendations['데이터소스'].nunique()
         st.metric("데이터 소스 수", unique_sources)
 
 def display_sample_recommendations():
@@ -623,17 +656,12 @@ def display_sample_recommendations():
     
     st.dataframe(sample_data, width='stretch', hide_index=True)
 
+@traced()
 def display_new_announcements():
     """Supabase에서 신규 공고 표시"""
     try:
-        # Supabase에서 신규 공고 데이터 가져오기
-        # 선택된 회사가 있으면 해당 회사의 신규 공고를, 없으면 빈 리스트 반환
-        selected_company_name = st.session_state.selected_company['name'] if st.session_state.selected_company else None
-        
-        if selected_company_name:
-            new_announcements = supabase_client.get_recommendations(company_name=selected_company_name, is_new_announcements=True)
-        else:
-            new_announcements = []
+        # 선택된 회사의 신규 공고 (회사가 없으면 빈 리스트)
+        new_announcements = st.session_state.company_snapshot.new
         
         if not new_announcements:
             st.info("신규 공고가 없습니다.")
@@ -668,8 +696,10 @@ def display_new_announcements():
             else:
                 return ['background-color: #ffffff; color: #000000'] * len(row)
         
-        styled_data = df.style.apply(highlight_high_score, axis=1)
-        st.dataframe(styled_data, width='stretch', hide_index=True)
+        # Styler.apply는 st.dataframe이 표를 직렬화할 때 실행되므로 두 단계를 한 span으로 잼
+        with span('st.dataframe (Styler)', rows=len(df)):
+            styled_data = df.style.apply(highlight_high_score, axis=1)
+            st.dataframe(styled_data, width='stretch', hide_index=True)
         
     except Exception as e:
         st.error(f"신규 공고 조회 중 오류: {str(e)}")
@@ -677,19 +707,10 @@ def display_new_announcements():
         display_sample_new_announcements()
 
 def extract_start_date(business_period):
-    """사업 연도에서 시작 날짜 추출"""
-    if not business_period:
-        return datetime.now().strftime('%Y-%m-%d')
-    
-    import re
-    date_match = re.search(r'(\d{8})', business_period)
-    if date_match:
-        try:
-            start_date_str = date_match.group(1)
-            start_date = datetime.strptime(start_date_str, '%Y%m%d')
-            return start_date.strftime('%Y-%m-%d')
-        except:
-            return datetime.now().strftime('%Y-%m-%d')
+    """사업 연도에서 시작 날짜 추출 ('yyyymmdd ~' 범위가 없으면 처음 나오는 yyyymmdd)"""
+    start_date = parse_period(business_period).start or first_date(business_period)
+    if start_date:
+        return start_date.strftime('%Y-%m-%d')
     
     return datetime.now().strftime('%Y-%m-%d')
 
@@ -745,66 +766,30 @@ def display_sample_new_announcements():
     styled_data = sample_new_announcements.style.apply(highlight_high_score, axis=1)
     st.dataframe(styled_data, width='stretch', hide_index=True)
 
+@traced()
 def display_deadline_announcements():
     """Supabase에서 마감 임박 공고 표시"""
     try:
-        # 선택된 회사가 있으면 해당 회사의 공고를, 없으면 모든 공고를 가져오기
-        selected_company_name = st.session_state.selected_company['name'] if st.session_state.selected_company else None
-        
-        if selected_company_name:
-            # 특정 회사의 모든 추천 공고 가져오기
-            all_recommendations = supabase_client.get_recommendations(company_name=selected_company_name, is_active_only=False)
-        else:
-            # 모든 공고 가져오기 (전체 데이터에서 마감 임박 공고만 필터링)
-            # 임시로 빈 리스트 반환 (전체 공고 조회는 성능상 권장하지 않음)
-            all_recommendations = []
+        # 선택된 회사의 공고 스냅샷 (회사가 없으면 빈 스냅샷)
+        snapshot = st.session_state.company_snapshot
         
-        if not all_recommendations:
+        if not snapshot.records:
             st.info("마감 임박 공고가 없습니다.")
             return
         
-        # 마감 임박 공고 필터링 (7일 이내 또는 상시)
-        today = datetime.now().date()
+        # 마감 임박 공고 (7일 이내 또는 상시/예산 소진시까지)
         deadline_announcements = []
-        
-        for item in all_recommendations:
-            period_str = item.get('사업 연도', '')
-            if not period_str:
-                continue
-            
-            # 마감일 추출
-            end_date_match = re.search(r'~\s*(\d{8})', period_str)
-            days_left = None
-            
-            if end_date_match:
-                try:
-                    end_date = datetime.strptime(end_date_match.group(1), '%Y%m%d').date()
-                    days_left = (end_date - today).days
-                except ValueError:
-                    pass
-            
-            # 마감 임박 공고 조건: 7일 이내 또는 상시/예산 소진시까지
-            is_urgent = False
-            remaining_days_str = '상시'
-            
-            if '예산 소진시까지' in period_str or '상시' in period_str:
-                is_urgent = True
-                remaining_days_str = '상시'
-            elif days_left is not None and 0 <= days_left <= 7:
-                is_urgent = True
-                remaining_days_str = str(days_left)
-            
-            if is_urgent:
-                deadline_announcements.append({
-                    '공고명': item.get('사업명', ''),
-                    '지원분야': '기타',  # 기본값
-                    '지원대상': '중소기업',  # 기본값
-                    '지역': item.get('지역', ''),
-                    '마감일': period_str,
-                    '남은일수': remaining_days_str,
-                    '추천점수': item.get('최종 점수', 0),
-                    '공고URL': item.get('상세페이지 URL', '')
-                })
+        for item, days_left in snapshot.deadline:
+            deadline_announcements.append({
+                '공고명': item.get('사업명', ''),
+                '지원분야': '기타',  # 기본값
+                '지원대상': '중소기업',  # 기본값
+                '지역': item.get('지역', ''),
+                '마감일': item.get('사업 연도', ''),
+                '남은일수': '상시' if days_left is None else str(days_left),
+                '추천점수': item.get('최종 점수', 0),
+                '공고URL': item.get('상세페이지 URL', '')
+            })
         
         if not deadline_announcements:
             st.info("마감 임박 공고가 없습니다.")
@@ -827,8 +812,9 @@ def display_deadline_announcements():
             else:
                 return ['background-color: #ffffff; color: #000000'] * len(row)
         
-        styled_data = deadline_data.style.apply(highlight_urgent, axis=1)
-        st.dataframe(styled_data, width='stretch', hide_index=True)
+        with span('st.dataframe (Styler)', rows=len(deadline_data)):
+            styled_data = deadline_data.style.apply(highlight_urgent, axis=1)
+            st.dataframe(styled_data, width='stretch', hide_index=True)
         
     except Exception as e:
         st.error(f"마감 임박 공고 조회 중 오류: {str(e)}")
@@ -877,21 +863,23 @@ def generate_roadmap(roadmap_type, time_horizon, priority_focus):
     }
     st.success("✅ 로드맵이 생성되었습니다!")
 
+@traced()
 def display_roadmap():
     """로드맵 표시 - 월별 공고 수 시각화 및 맞춤 추천 공고들"""
     st.markdown("### 🗺️ 맞춤 추천 공고 로드맵")
     
     try:
         # 선택된 기업 정보 가져오기
-        selected_company = st.session_state.get('selected_company')
+        selected_company = get_selected_company()
         if not selected_company:
             st.warning("⚠️ 먼저 사이드바에서 기업을 선택해주세요.")
             return
         
         # 월별 공고 수 시각화 먼저 표시
         
-        # Supabase에서 선택된 회사의 월별 데이터 가져오기
-        monthly_data = supabase_client.get_monthly_recommendations(company_name=selected_company['name'])
+        # 선택된 회사의 월별 공고 수 (이번 실행의 추천 공고 스냅샷에서 계산)
+        snapshot = st.session_state.company_snapshot
+        monthly_data = snapshot.monthly_counts
         
         # 월별 데이터를 DataFrame으로 변환
         months = ['1월', '2월', '3월', '4월', '5월', '6월', 
@@ -903,21 +891,23 @@ def display_roadmap():
             '공고 수': counts
         })
         
-        # 막대 그래프 생성
-        fig = px.bar(
-            monthly_df,
-            x='월',
-            y='공고 수',
-            title="월별 공고 수 분포",
-            color='공고 수',
-            color_continuous_scale='Blues'
-        )
-        fig.update_layout(
-            xaxis_title="월",
-            yaxis_title="공고 수",
-            showlegend=False
-        )
-        st.plotly_chart(fig, width='stretch')
+        # 막대 그래프 생성 (plotly는 import가 무거우므로 로드맵을 그릴 때 불러옴)
+        with span('plotly_chart'):
+            import plotly.express as px
+            fig = px.bar(
+                monthly_df,
+                x='월',
+                y='공고 수',
+                title="월별 공고 수 분포",
+                color='공고 수',
+                color_continuous_scale='Blues'
+            )
+            fig.update_layout(
+                xaxis_title="월",
+                yaxis_title="공고 수",
+                showlegend=False
+            )
+            st.plotly_chart(fig, width='stretch')
         
         # 월별 상세보기
         st.markdown("### 📋 월별 상세보기")
@@ -934,11 +924,13 @@ def display_roadmap():
         # 선택된 월의 상세 정보 표시
         if selected_month:
             st.markdown(f"### {months[selected_month-1]} 상세 공고")
-            monthly_details = supabase_client.get_monthly_details(selected_month, company_name=selected_company['name'])
+            with span('month_details', month=selected_month):
+                monthly_details = snapshot.month_details(selected_month)
             
             if monthly_details:
-                details_df = pd.DataFrame(monthly_details)
-                st.dataframe(details_df, width='stretch', hide_index=True)
+                with span('st.dataframe', rows=len(monthly_details)):
+                    details_df = pd.DataFrame(monthly_details)
+                    st.dataframe(details_df, width='stretch', hide_index=True)
             else:
                 st.info(f"{months[selected_month-1]}에는 공고가 없습니다.")
         
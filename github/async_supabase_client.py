@@ -0,0 +1,334 @@
+"""비동기 Supabase 클라이언트
+
+SupabaseClient와 같은 메서드(get_companies, get_recommendations, get_monthly_recommendations,
+get_monthly_details)를 supabase 비동기 클라이언트(acreate_client) 위에서 제공합니다.
+필터/집계 규칙은 supabase_client의 함수를 그대로 사용하므로 두 클라이언트의 결과는 같습니다.
+
+서로 독립적인 조회는 gather_limited로 동시에 보내고, Streamlit 스크립트 스레드처럼 실행 중인
+이벤트 루프가 없는 동기 코드에서는 run_sync로 백그라운드 이벤트 루프에서 실행한 결과를 받습니다.
+
+    client = AsyncSupabaseClient()
+    recommendations, monthly = run_sync(gather_limited(
+        client.get_recommendations('대박드림스'),
+        client.get_monthly_recommendations('대박드림스'),
+    ))
+"""
+import asyncio
+import threading
+from datetime import datetime
+
+from postgrest.exceptions import APIError
+from supabase import AsyncClient, AsyncClientOptions, acreate_client
+
+import supabase_client as base
+from company_normalizer import normalize_companies
+from http_policy import HttpPolicy, build_async_http_client
+from metrics import ClientMetrics, get_client_metrics
+from tracing import span
+from period_parser import parse_period
+from result_cache import ResultCache
+from supabase_client import (
+    COMPANY_PAGE_ORDER, COMPANY_PAGE_SIZE, COLUMN_MANIFESTS, MISSING_FUNCTION_CODES, MISSING_RELATION_CODES, MONTHLY_COUNTS_RPC,
+    PERIOD_VIEW, cache_key, count_months, filter_period_query, filter_periods, format_detail_records,
+    monthly_counts_args, monthly_counts_from_rpc, order_by_columns, select_clause,
+)
+
+# gather_limited가 한 번에 보내는 최대 요청 수
+DEFAULT_CONCURRENCY = 8
+
+
+def check_company_pages(rows, expected: int = None) -> bool:
+    """동시에 받은 range 페이지를 이어 붙인 회사 행에 중복 id가 없고 행 수가 expected(전체 행 수)와 같은지 확인합니다.
+
+    조회 중에 테이블이 바뀌어도 어긋날 수 있으므로 예외 대신 경고를 출력하고 False를 돌려줍니다.
+    """
+    ids = [row['id'] for row in rows if row.get('id') is not None]
+    duplicates = len(ids) - len(set(ids))
+    if duplicates:
+        print(f"⚠️ 회사 목록 페이지에 중복 id가 {duplicates}개 있습니다.")
+    if expected is not None and len(rows) != expected:
+        print(f"⚠️ 회사 목록 행 수({len(rows)})가 전체 행 수({expected})와 다릅니다.")
+    return not duplicates and (expected is None or len(rows) == expected)
+
+
+async def gather_limited(*aws, limit: int = DEFAULT_CONCURRENCY, return_exceptions: bool = False):
+    """코루틴을 동시에 실행하되 한 번에 limit개까지만 실행하고, 결과를 입력 순서대로 돌려줍니다."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=return_exceptions)
+
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop():
+    """프로세스에 하나뿐인 백그라운드 이벤트 루프 (처음 호출할 때 데몬 스레드로 시작)"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name='supabase-async-loop', daemon=True).start()
+        return _loop
+
+
+def run_sync(coroutine, timeout: float = None):
+    """코루틴을 백그라운드 이벤트 루프에서 실행하고 결과를 기다립니다.
+
+    비동기 클라이언트의 HTTP 연결은 만들어진 이벤트 루프에 묶이므로, Streamlit 재실행마다
+    asyncio.run으로 새 루프를 만드는 대신 항상 같은 루프에서 실행합니다.
+    """
+    loop = _background_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coroutine.close()
+        raise RuntimeError("run_sync는 백그라운드 이벤트 루프 안에서 호출할 수 없습니다. await를 사용하세요.")
+    return asyncio.run_coroutine_threadsafe(coroutine, loop).result(timeout)
+
+
+class AsyncSupabaseClient:
+    def __init__(self, url: str = None, key: str = None, result_cache: ResultCache = None,
+                 concurrency: int = DEFAULT_CONCURRENCY, http_policy: HttpPolicy = None,
+                 metrics: ClientMetrics = None):
+        self._url = url or base.SUPABASE_URL
+        self._key = key or base.SUPABASE_ANON_KEY
+        # 조회 결과 캐시 (None이면 매번 Supabase를 조회)
+        self._cache = result_cache
+        # 연결 풀/타임아웃/압축/재시도 정책 (http_policy.py)
+        self.http_policy = http_policy or HttpPolicy.from_env()
+        # 조회 지표 (metrics.py, 기본: 프로세스 공용)
+        self.metrics = metrics or get_client_metrics()
+        # 이 클라이언트의 gather와 get_companies가 한 번에 보내는 최대 요청 수
+        self.concurrency = concurrency
+        # 매니페스트 컬럼이 테이블에 없어 전체 컬럼으로 대체한 (table, method) 조합
+        self._select_fallbacks = set()
+        # get_companies가 페이지를 나눌 정렬 (id가 없으면 전체 컬럼으로 바뀜, SupabaseClient.iter_companies 참고)
+        self._company_order = COMPANY_PAGE_ORDER
+        # 기간 뷰 / 월별 집계 RPC가 없는 것으로 확인되면 False로 바꾸고 클라이언트에서 처리
+        self._period_view_available = True
+        self._monthly_rpc_available = True
+        # invalidate()마다 1씩 늘어나는 데이터 버전 (SupabaseClient.data_version과 같음)
+        self.data_version = 0
+        # 비동기 클라이언트는 처음 사용하는 이벤트 루프 안에서 만듦
+        self._client: AsyncClient = None
+        self._client_lock = None
+        if not self._url or not self._key:
+            print("⚠️ Supabase 환경변수가 설정되지 않았습니다. Streamlit Cloud에서 환경변수를 설정해주세요.")
+
+    async def _get_client(self):
+        if self._client is None and self._url and self._key:
+            if self._client_lock is None:
+                self._client_lock = asyncio.Lock()
+            async with self._client_lock:
+                if self._client is None:
+                    try:
+                        options = AsyncClientOptions(httpx_client=build_async_http_client(self.http_policy))
+                        self._client = await acreate_client(self._url, self._key, options)
+                        print("AsyncSupabaseClient initialized.")
+                    except Exception as e:
+                        print(f"❌ Supabase 연결 실패: {e}")
+                        self._url = None
+        return self._client
+
+    async def gather(self, *aws, return_exceptions: bool = False):
+        """이 클라이언트의 동시 요청 한도로 gather_limited를 실행합니다."""
+        return await gather_limited(*aws, limit=self.concurrency, return_exceptions=return_exceptions)
+
+    async def _select(self, table: str, method: str, build=None, count: str = None):
+        """SupabaseClient._select의 비동기 버전 (매니페스트 컬럼 조회, 42703이면 select('*')로 대체)
+
+        count='exact'이면 응답의 count에 범위를 적용하기 전의 전체 행 수가 들어 있습니다.
+        """
+        client = await self._get_client()
+        build = build or (lambda query: query)
+        if (table, method) in self._select_fallbacks:
+            return await self._execute(table, method, build(client.table(table).select('*', count=count)))
+        try:
+            query = client.table(table).select(select_clause(COLUMN_MANIFESTS[method]), count=count)
+            return await self._execute(table, method, build(query))
+        except APIError as e:
+            if e.code != '42703':
+                raise
+            message = e.message
+        response = await self._execute(table, method, build(client.table(table).select('*', count=count)))
+        print(f"⚠️ {table} 테이블에 없는 컬럼이 있어 전체 컬럼으로 조회합니다: {message}")
+        self._select_fallbacks.add((table, method))
+        return response
+
+    async def table_columns(self, table: str):
+        """SupabaseClient.table_columns의 비동기 버전"""
+        client = await self._get_client()
+        query = client.table(table).select('*').limit(1)
+        with self.metrics.track('table_columns', table) as call:
+            rows = call.response(await query.retry(False).execute()).data
+        return tuple(rows[0]) if rows else ()
+
+    async def _execute(self, table: str, method: str, query):
+        """SupabaseClient._execute의 비동기 버전 (결과 캐시, 조회 지표 기록, supabase.query span)"""
+        query = query.retry(False)
+        with span('supabase.query', method=method, table=table) as query_span, \
+                self.metrics.track(method, table) as call:
+            if self._cache is None:
+                response = await query.execute()
+            else:
+                key, company = cache_key(table, method, query)
+                hit, response = self._cache.get(key)
+                call.cache = 'hit' if hit else 'miss'
+                if not hit:
+                    response = await query.execute()
+                    self._cache.put(key, response, table, company)
+            call.response(response)
+            query_span.set_attributes({'rows': call.rows, 'cache': call.cache or 'none'})
+            return response
+
+    def invalidate(self, company: str = None, table: str = None):
+        """결과 캐시에서 회사/테이블에 해당하는 항목을 지웁니다. 둘 다 없으면 캐시 전체를 비웁니다."""
+        self.data_version += 1
+        if self._cache is None:
+            return 0
+        return self._cache.invalidate(company=company, table=table)
+
+    def cache_stats(self):
+        """결과 캐시 적중/미스/내보냄 통계. 캐시를 사용하지 않으면 None입니다."""
+        return self._cache.stats() if self._cache is not None else None
+
+    async def get_companies(self, page_size: int = COMPANY_PAGE_SIZE):
+        """alpha_companies_final 테이블에서 회사 목록을 가져옵니다.
+
+        첫 페이지가 page_size만큼 차 있으면(서버가 page_size를 그대로 허용) 이후 페이지는
+        concurrency개씩 동시에 요청하고, page_size보다 짧은 페이지가 나오면 멈춥니다.
+        첫 페이지가 짧으면 서버 max-rows에 잘린 것일 수 있으므로 SupabaseClient.iter_companies처럼
+        받은 행 수만큼 이어서 차례로 조회합니다.
+        동시에 받은 페이지가 겹치거나 빠지지 않도록 모든 페이지를 같은 고유 키(id, 없으면 전체 컬럼) 순으로 정렬하고,
+        이어 붙인 결과를 첫 페이지의 전체 행 수(count=exact)와 중복 id로 확인합니다 (check_company_pages).
+        """
+        if not await self._get_client():
+            print("❌ Supabase 클라이언트가 초기화되지 않았습니다.")
+            return []
+        try:
+            def page(start, size, count=None):
+                return self._select(
+                    'alpha_companies_final', 'get_companies',
+                    lambda query: order_by_columns(query, self._company_order).range(start, start + size - 1),
+                    count=count,
+                )
+
+            try:
+                first = await page(0, page_size, count='exact')
+            except APIError as e:
+                if e.code != '42703' or self._company_order != COMPANY_PAGE_ORDER:
+                    raise
+                print("⚠️ alpha_companies_final에 id 컬럼이 없어 전체 컬럼 순으로 나눠 조회합니다 "
+                      "(sql/mirror_sync_columns.sql 참고).")
+                columns = await self.table_columns('alpha_companies_final')
+                if not columns:
+                    return []
+                self._company_order = columns
+                first = await page(0, page_size, count='exact')
+            rows = first.data or []
+            companies = list(rows)
+            if len(rows) == page_size:
+                start = page_size
+                while True:
+                    starts = [start + i * page_size for i in range(self.concurrency)]
+                    pages = await self.gather(*(page(offset, page_size) for offset in starts))
+                    done = False
+                    for response in pages:
+                        companies.extend(response.data or [])
+                        if len(response.data or []) < page_size:
+                            done = True
+                            break
+                    if done:
+                        break
+                    start = starts[-1] + page_size
+            else:
+                start = len(rows)
+                while rows:
+                    rows = (await page(start, page_size)).data or []
+                    companies.extend(rows)
+                    start += len(rows)
+            check_company_pages(companies, first.count)
+            print(f"📊 조회 결과: {len(companies)}개 레코드")
+            return normalize_companies(companies)
+        except Exception as e:
+            print(f"❌ Supabase에서 회사 데이터 조회 실패: {e}")
+            return []
+
+    async def get_recommendations(self, company_name: str, is_active_only: bool = False,
+                                  is_new_announcements: bool = False):
+        """recommend_final 테이블에서 추천 공고를 가져옵니다."""
+        if not await self._get_client():
+            return []
+        try:
+            def build(query):
+                return query.eq('기업명', company_name)
+
+            if is_active_only or is_new_announcements:
+                today = datetime.now().date()
+                # 기간 뷰가 있으면 조건에 맞는 행만 서버에서 걸러서 받음
+                if self._period_view_available:
+                    try:
+                        response = await self._select(
+                            PERIOD_VIEW, 'get_recommendations',
+                            lambda query: filter_period_query(build(query), is_active_only, today)
+                        )
+                        return response.data
+                    except APIError as e:
+                        if e.code not in MISSING_RELATION_CODES:
+                            raise
+                        print(f"⚠️ {PERIOD_VIEW} 뷰가 없어 클라이언트에서 기간을 필터링합니다.")
+                        self._period_view_available = False
+
+                response = await self._select('recommend_final', 'get_recommendations', build)
+                return filter_periods(response.data, is_active_only, today)
+
+            response = await self._select('recommend_final', 'get_recommendations', build)
+            return response.data
+        except Exception as e:
+            print(f"Error fetching recommendations from Supabase: {e}")
+            return []
+
+    async def get_monthly_recommendations(self, company_name: str = None):
+        """월별 공고 수를 가져옵니다. 회사명이 지정되면 해당 회사의 추천 공고만 대상으로 합니다."""
+        client = await self._get_client()
+        if not client:
+            return {i: 0 for i in range(1, 13)}
+        try:
+            # 집계 RPC가 있으면 서버에서 월별로 센 결과(최대 12행)만 받음
+            if self._monthly_rpc_available:
+                try:
+                    response = await self._execute(MONTHLY_COUNTS_RPC, 'get_monthly_recommendations',
+                                                   client.rpc(MONTHLY_COUNTS_RPC, monthly_counts_args(company_name), get=True))
+                    return monthly_counts_from_rpc(response.data)
+                except APIError as e:
+                    if e.code not in MISSING_FUNCTION_CODES:
+                        raise
+                    print(f"⚠️ {MONTHLY_COUNTS_RPC} 함수가 없어 클라이언트에서 월별 공고 수를 집계합니다.")
+                    self._monthly_rpc_available = False
+
+            build = (lambda query: query.eq('기업명', company_name)) if company_name else None
+            response = await self._select('recommend_final', 'get_monthly_recommendations', build)
+            return count_months(response.data)
+        except Exception as e:
+            print(f"Error fetching monthly recommendations from Supabase: {e}")
+            return {i: 0 for i in range(1, 13)}
+
+    async def get_monthly_details(self, month: int, company_name: str = None):
+        """특정 월의 상세 공고 목록을 가져옵니다. 회사명이 지정되면 해당 회사의 추천 공고만 대상으로 합니다."""
+        if not await self._get_client():
+            return []
+        try:
+            build = (lambda query: query.eq('기업명', company_name)) if company_name else None
+            response = await self._select('recommend_final', 'get_monthly_details', build)
+            monthly_details = [item for item in response.data if parse_period(item.get('사업 연도')).month == month]
+            return format_detail_records(monthly_details)
+        except Exception as e:
+            print(f"Error fetching monthly details from Supabase: {e}")
+            return []
@@ -0,0 +1,221 @@
+"""추천 데이터 백엔드
+
+앱(app.py, company_directory.py, company_snapshot.py)은 get_supabase_client()가 돌려주는 백엔드의
+RecommendationBackend 메서드만 사용합니다. DATA_BACKEND 환경변수로 백엔드를 고릅니다.
+  - supabase (기본): SupabaseClient, Supabase(PostgREST)에서 직접 조회
+  - sqlite: local_mirror.MirrorClient, local_mirror.py로 동기화한 SQLite 미러에서 조회
+  - memory: InMemoryBackend, 행 전체를 메모리에 두고 조회 (MEMORY_BACKEND_PATH의 JSON 또는 SQLite 미러에서 불러옴)
+
+sqlite/memory 백엔드는 StoreBackend를 상속해 SupabaseClient와 같은 RecommendationClient의 필터링/집계 코드를
+그대로 쓰고, 쿼리 실행만 저장소의 select로 바꿉니다. 따라서 같은 행이면 세 백엔드의 결과가 같습니다.
+동기화 원본용 메서드(fetch_changes, fetch_rows)는 SupabaseClient에만 있습니다.
+
+    backend = InMemoryBackend({'alpha_companies_final': companies, 'recommend_final': recommendations})
+    backend.get_recommendations('대박드림스', is_active_only=True)
+"""
+import json
+import os
+import threading
+from typing import NamedTuple, Protocol, runtime_checkable
+
+from supabase_client import COLUMN_MANIFESTS, RecommendationClient, SupabaseClient, default_result_cache
+
+# 백엔드 종류: supabase / sqlite / memory ('mirror'는 sqlite와 같음)
+DATA_BACKEND = os.environ.get("DATA_BACKEND", "supabase").lower()
+# memory 백엔드가 불러올 {테이블명: 행 목록} JSON 파일 (없으면 SQLite 미러에서 불러옴)
+MEMORY_BACKEND_PATH = os.environ.get("MEMORY_BACKEND_PATH")
+BACKEND_ALIASES = {'mirror': 'sqlite'}
+
+
+@runtime_checkable
+class RecommendationBackend(Protocol):
+    """앱이 사용하는 추천 데이터 조회 메서드 (SupabaseClient와 같은 시그니처/반환 형식)"""
+
+    def test_connection(self) -> bool: ...
+
+    def get_companies(self) -> list: ...
+
+    def iter_companies(self, page_size: int = ..., order_by: str = None): ...
+
+    def get_recommendations(self, company_name: str, is_active_only: bool = False,
+                            is_new_announcements: bool = False) -> list: ...
+
+    def get_monthly_recommendations(self, company_name: str = None) -> dict: ...
+
+    def get_monthly_details(self, month: int, company_name: str = None) -> list: ...
+
+    def invalidate(self, company: str = None, table: str = None) -> int: ...
+
+    def cache_stats(self): ...
+
+
+class _StoreResponse(NamedTuple):
+    data: list
+
+
+class StoreQuery:
+    """StoreBackend._select가 build 함수에 넘기는 쿼리 빌더 (SupabaseClient가 쓰는 eq/range/order/limit만 지원)"""
+
+    def __init__(self, store, table: str, columns):
+        self._store = store
+        self._table = table
+        self._columns = columns
+        self._filters = []
+        # 'column.asc|desc' 목록 (order()를 여러 번 부르면 앞의 정렬이 우선, PostgREST와 같음)
+        self._order = []
+        self._offset = 0
+        self._limit = None
+
+    def eq(self, column, value):
+        self._filters.append((column, value))
+        return self
+
+    def range(self, start, end):
+        self._offset, self._limit = start, end - start + 1
+        return self
+
+    def order(self, column, desc=False):
+        # order_by_columns가 공백 있는 컬럼명에 씌운 따옴표는 떼고 저장소 컬럼명으로 씀
+        column = column.strip('"')
+        self._order.append(f"{column}.{'desc' if desc else 'asc'}")
+        return self
+
+    def limit(self, size):
+        self._limit = size
+        return self
+
+    def retry(self, enabled=True):
+        return self
+
+    def execute(self):
+        return _StoreResponse(self._store.select(
+            self._table, self._columns, filters=self._filters, order=self._order,
+            offset=self._offset, limit=self._limit,
+        ))
+
+
+class StoreBackend(RecommendationClient):
+    """select(table, columns, filters, order, offset, limit)를 제공하는 저장소에서 읽는 백엔드
+
+    기간 뷰와 월별 집계 RPC는 저장소에 없으므로 RecommendationClient의 클라이언트 필터링/집계 경로를 사용합니다.
+    결과 캐시는 쓰지 않습니다 (저장소 조회가 캐시만큼 빠름).
+    """
+
+    def __init__(self, store):
+        self._store = store
+        super().__init__()
+        self.http_policy = None
+        self._period_view_available = False
+        self._monthly_rpc_available = False
+
+    def _connect(self):
+        # RecommendationClient 메서드가 확인하는 self._client (네트워크 클라이언트 대신 저장소)
+        return self._store
+
+    def _select(self, table: str, method: str, build=None):
+        build = build or (lambda query: query)
+        return self._execute(table, method, build(StoreQuery(self._store, table, COLUMN_MANIFESTS[method])))
+
+    def table_columns(self, table: str):
+        """저장소 테이블 첫 행의 키로 컬럼 목록을 돌려줍니다. 행이 없으면 빈 튜플입니다."""
+        rows = self._store.select(table, limit=1)
+        return tuple(rows[0]) if rows else ()
+
+
+def _sort_key(value):
+    # SQLite 미러(json_extract 정렬)처럼 NULL을 맨 앞에 둠
+    return (value is not None, value)
+
+
+class InMemoryStore:
+    """{테이블명: 행 목록}을 메모리에 두는 저장소. 같음 조건에 쓰인 컬럼은 처음 조회할 때 색인합니다."""
+
+    def __init__(self, tables=None):
+        self.tables = {name: list(rows) for name, rows in (tables or {}).items()}
+        # (테이블, 컬럼) -> {값: 행 목록}
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_json(cls, path: str):
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @classmethod
+    def from_mirror(cls, mirror):
+        """local_mirror.LocalMirror의 모든 테이블을 메모리로 불러옵니다."""
+        return cls({table: mirror.select(table) for table in mirror.tables})
+
+    def replace(self, table: str, rows):
+        """테이블 행을 통째로 바꿉니다."""
+        with self._lock:
+            self.tables[table] = list(rows)
+            self._indexes = {key: index for key, index in self._indexes.items() if key[0] != table}
+
+    def _index(self, table: str, column: str):
+        key = (table, column)
+        index = self._indexes.get(key)
+        if index is None:
+            with self._lock:
+                index = self._indexes.get(key)
+                if index is None:
+                    index = {}
+                    for row in self.tables.get(table, ()):
+                        index.setdefault(row.get(column), []).append(row)
+                    self._indexes[key] = index
+        return index
+
+    def select(self, table: str, columns=None, filters=(), order=(), offset: int = 0, limit: int = None):
+        """LocalMirror.select와 같은 규칙으로 행(dict) 목록을 돌려줍니다."""
+        if filters:
+            (column, value), rest = filters[0], filters[1:]
+            rows = self._index(table, column).get(value, [])
+            rows = [row for row in rows if all(row.get(c) == v for c, v in rest)]
+        else:
+            rows = self.tables.get(table, [])
+        # 안정 정렬이므로 마지막 정렬 키부터 차례로 정렬하면 order 순서대로 우선함 (같으면 넣은 순서)
+        for spec in reversed(order):
+            column, _, direction = spec.rpartition('.')
+            rows = sorted(rows, key=lambda row: _sort_key(row.get(column)), reverse=direction == 'desc')
+        if limit is not None or offset:
+            rows = rows[offset:None if limit is None else offset + limit]
+        if columns:
+            return [{column: row.get(column) for column in columns} for row in rows]
+        return [dict(row) for row in rows]
+
+
+class InMemoryBackend(StoreBackend):
+    """메모리의 행으로 SupabaseClient와 같은 결과를 돌려주는 백엔드 (네트워크 없이 벤치마크/부하 테스트용)"""
+
+    def __init__(self, tables=None):
+        super().__init__(tables if isinstance(tables, InMemoryStore) else InMemoryStore(tables))
+        print("InMemoryBackend initialized.")
+
+
+def create_backend(kind: str = None):
+    """kind(기본: DATA_BACKEND) 백엔드를 만듭니다. 로컬 데이터가 없으면 경고하고 SupabaseClient를 돌려줍니다.
+
+    만든 백엔드가 RecommendationBackend 메서드를 모두 갖추지 않았으면 TypeError를 냅니다.
+    """
+    backend = _build_backend(kind)
+    if not isinstance(backend, RecommendationBackend):
+        raise TypeError(f"{type(backend).__name__}는 RecommendationBackend 메서드를 모두 제공하지 않습니다.")
+    return backend
+
+
+def _build_backend(kind: str = None):
+    kind = (kind or DATA_BACKEND).lower()
+    kind = BACKEND_ALIASES.get(kind, kind)
+    if kind in ('sqlite', 'memory'):
+        from local_mirror import MIRROR_PATH, LocalMirror, MirrorClient
+        if kind == 'memory' and MEMORY_BACKEND_PATH:
+            print(f"📦 메모리 백엔드로 데이터를 불러옵니다: {MEMORY_BACKEND_PATH}")
+            return InMemoryBackend(InMemoryStore.from_json(MEMORY_BACKEND_PATH))
+        if os.path.exists(MIRROR_PATH):
+            print(f"📦 로컬 미러에서 데이터를 읽습니다 ({kind}): {MIRROR_PATH}")
+            mirror = LocalMirror(MIRROR_PATH)
+            return MirrorClient(mirror) if kind == 'sqlite' else InMemoryBackend(InMemoryStore.from_mirror(mirror))
+        print(f"⚠️ 로컬 미러({MIRROR_PATH})가 없어 Supabase에서 읽습니다. `python local_mirror.py`로 동기화하세요.")
+    elif kind != 'supabase':
+        print(f"⚠️ 알 수 없는 DATA_BACKEND '{kind}'입니다. Supabase에서 읽습니다.")
+    return SupabaseClient(result_cache=default_result_cache())
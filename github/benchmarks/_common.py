@@ -0,0 +1,109 @@
+"""벤치마크 스크립트 공용 도우미"""
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# benchmarks/ 상위 디렉토리(app.py, supabase_client.py 위치)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def setup_path():
+    """ROOT를 import 경로 맨 앞에 추가합니다 (여러 번 호출해도 한 번만 추가)."""
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+
+
+# _common의 도우미를 쓰는 스크립트는 import만으로 경로가 잡힘
+setup_path()
+
+
+@contextmanager
+def temp_path(name: str):
+    """새 임시 디렉토리 안의 name 파일 경로. 블록이 끝나면 디렉토리째 지웁니다 (SQLite -wal/-shm 파일 포함)."""
+    with tempfile.TemporaryDirectory(prefix='bench-') as directory:
+        yield os.path.join(directory, name)
+
+
+def timed(fn, repeat=5):
+    """fn을 repeat번 실행해 가장 빠른 실행 시간(초)과 마지막 반환값을 돌려줍니다."""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def load_baseline(path):
+    """기준값 파일의 {항목: {변형: ms}} (파일이 없으면 빈 dict)"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f).get('results', {})
+
+
+def save_baseline(path, results):
+    """results({항목: {변형: ms}})를 기준값 파일의 기존 값에 덮어써 저장합니다."""
+    merged = load_baseline(path)
+    for name, variants in results.items():
+        merged.setdefault(name, {}).update(variants)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'python': platform.python_version(), 'machine': platform.machine(),
+                   'saved_at': datetime.now().isoformat(timespec='seconds'), 'results': merged},
+                  f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def make_wide_recommendations(count, extra_columns=30, seed=0):
+    """recommend_final과 같은 모양에 본문/메타 컬럼을 덧붙인 넓은 추천 행을 만듭니다."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        start = f"2025{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}"
+        row = {
+            '기업명': f"회사{i % 500}",
+            '사업명': f"2025년 {i}차 창업지원사업 모집 공고",
+            '최종 점수': round(rng.uniform(30, 100), 2),
+            '지역': rng.choice(['서울특별시', '경기도', '부산광역시', '전국']),
+            '사업 연도': f"{start} ~ 2025{rng.randint(1, 12):02d}28",
+            '상세페이지 URL': f"https://www.bizinfo.go.kr/web/lay1/bbs/S1T122C128/AS/74/view.do?pblancId=PBLN_{i:09d}",
+        }
+        for c in range(extra_columns):
+            row[f"부가정보_{c}"] = '사업 개요 및 지원 내용 안내 ' * rng.randint(1, 6)
+        rows.append(row)
+    return rows
+
+
+FOUNDING_SAMPLES = ['2020.01.01.', '2015', '4', '', None, '2019-03-02', '2018.1.1.', '2021.12.31.', 2017, '０']
+EMPLOYEE_SAMPLES = ['6명', '0명', '12명', ' 75 명', '150명', '301명', '5명', '미상', '', None, '10명', '50명']
+STAGE_SAMPLES = ['3년 미만', '초기 단계', '3-7년', '성장기', '7년 이상', '성숙', '예비창업', '기타', '', None]
+LIST_SAMPLES = ['AI, 바이오', '', None, ' , 데이터분석,', '특허1,특허2,특허3', '벤처기업확인서', ' ']
+
+
+def make_company_records(count, seed=0):
+    """alpha_companies_final 모양의 회사 레코드를 만듭니다. 정규화 분기를 모두 거치도록 값을 섞습니다."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        row = {
+            '기업명': f"회사{i}",
+            '기업형태': rng.choice(['법인사업자', '개인사업자', None]),
+            '업종': rng.choice(['IT/소프트웨어', '바이오/헬스케어', '제조', None]),
+            '지역': rng.choice(['서울특별시', '경기도', '부산광역시', None]),
+            '설립일': rng.choice(FOUNDING_SAMPLES),
+            '고용': rng.choice(EMPLOYEE_SAMPLES),
+            '업력': rng.choice(STAGE_SAMPLES),
+            '기술특허': rng.choice(LIST_SAMPLES),
+            '기업인증': rng.choice(LIST_SAMPLES),
+        }
+        if i % 7 == 0:
+            del row['업종']
+        rows.append(row)
+    return rows
@@ -0,0 +1,92 @@
+"""SupabaseClient(순차) 대비 AsyncSupabaseClient(gather_limited 동시 실행)
+
+지연을 준 PostgREST 스텁에 대해 세 가지 작업을 비교합니다.
+  1. 화면 하나: 한 회사의 전체/활성/신규 추천, 월별 공고 수, 월별 상세 3개월 (서로 독립적인 조회 7개)
+  2. 여러 회사: 회사 N곳의 추천 공고
+  3. 회사 목록: alpha_companies_final 전체 페이지
+비동기 쪽은 Streamlit 스크립트 스레드와 같은 방식으로 run_sync를 통해 호출하고, 결과가 같은지도 확인합니다.
+
+    python benchmarks/bench_async_client.py [--latency 0.05] [--concurrency 8]
+"""
+import argparse
+import time
+from datetime import datetime
+
+import _common
+from postgrest_stub import PostgrestStub
+from validate_period_view import make_period_rows
+
+
+def elapsed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--latency', type=float, default=0.05, help='요청당 지연(초)')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--companies', type=int, default=20)
+    parser.add_argument('--company-rows', type=int, default=10000)
+    args = parser.parse_args()
+
+    rows = make_period_rows(args.companies * 50, datetime.now().date())
+    companies = _common.make_company_records(args.company_rows)
+    # 회사 목록 페이지는 id 순으로 나눠 받음 (get_companies가 중복 id/전체 행 수를 확인)
+    for i, company in enumerate(companies):
+        company['id'] = i + 1
+    names = sorted({row['기업명'] for row in rows})[:args.companies]
+
+    import supabase_client as module
+    from async_supabase_client import AsyncSupabaseClient, gather_limited, run_sync
+
+    with PostgrestStub({'recommend_final': rows, 'alpha_companies_final': companies}, latency=args.latency) as stub:
+        module.SUPABASE_URL, module.SUPABASE_ANON_KEY = stub.url, 'stub-anon-key'
+        sync = module.SupabaseClient()
+        client = AsyncSupabaseClient(concurrency=args.concurrency)
+        company = names[0]
+
+        def page_sync():
+            return [
+                sync.get_recommendations(company),
+                sync.get_recommendations(company, is_active_only=True),
+                sync.get_recommendations(company, is_new_announcements=True),
+                sync.get_monthly_recommendations(company),
+            ] + [sync.get_monthly_details(month, company) for month in (1, 2, 3)]
+
+        def page_async():
+            return run_sync(client.gather(
+                client.get_recommendations(company),
+                client.get_recommendations(company, is_active_only=True),
+                client.get_recommendations(company, is_new_announcements=True),
+                client.get_monthly_recommendations(company),
+                *(client.get_monthly_details(month, company) for month in (1, 2, 3)),
+            ))
+
+        def companies_sync():
+            return [sync.get_recommendations(name) for name in names]
+
+        def companies_async():
+            return run_sync(gather_limited(*(client.get_recommendations(name) for name in names),
+                                           limit=args.concurrency))
+
+        # 뷰/RPC 없음 판정과 연결 수립을 측정에서 제외
+        page_sync()
+        page_async()
+
+        print(f"요청 지연 {args.latency * 1000:.0f}ms, 동시 요청 한도 {args.concurrency}")
+        print(f"{'작업':<28}{'순차(ms)':>10}{'비동기(ms)':>11}{'배속':>7}  결과 일치")
+        for name, run_sync_side, run_async_side in (
+                ('화면 하나 (조회 7개)', page_sync, page_async),
+                (f'회사 {len(names)}곳 추천 공고', companies_sync, companies_async),
+                (f'회사 목록 {args.company_rows:,}행', sync.get_companies,
+                 lambda: run_sync(client.get_companies()))):
+            sync_seconds, expected = elapsed(run_sync_side)
+            async_seconds, actual = elapsed(run_async_side)
+            print(f"{name:<28}{sync_seconds * 1000:>10.0f}{async_seconds * 1000:>11.0f}"
+                  f"{sync_seconds / async_seconds:>6.1f}x  {expected == actual}")
+
+
+if __name__ == '__main__':
+    main()
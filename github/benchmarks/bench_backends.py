@@ -0,0 +1,75 @@
+"""데이터 백엔드 비교: Supabase(지연 스텁) 대비 SQLite 미러, 메모리 (backends.py)
+
+같은 합성 행(회사 N곳, 추천 공고)을 지연을 준 PostgREST 스텁, LocalMirror로 동기화한 SQLite 파일,
+InMemoryBackend에 올리고, 화면 한 번에 해당하는 조회(회사 목록, 회사의 추천 공고 전체/활성/신규,
+월별 공고 수, 월별 상세)의 소요 시간과 세 백엔드 결과가 같은지 확인합니다.
+스텁은 기간 뷰/집계 RPC가 없는 상태라 세 백엔드 모두 같은 클라이언트 필터링 경로를 탑니다.
+
+    python benchmarks/bench_backends.py [--companies 2000] [--rows 20000] [--latency 0.02]
+"""
+import argparse
+from datetime import datetime
+
+import _common
+from postgrest_stub import PostgrestStub
+from validate_period_view import make_period_rows
+
+
+def screen(backend, company):
+    """회사 한 곳을 선택했을 때 앱이 하는 조회 (CompanySnapshot 이전의 메서드 단위)"""
+    return {
+        'companies': backend.get_companies(),
+        'all': backend.get_recommendations(company),
+        'active': backend.get_recommendations(company, is_active_only=True),
+        'new': backend.get_recommendations(company, is_new_announcements=True),
+        'monthly_counts': backend.get_monthly_recommendations(company),
+        'monthly_details': backend.get_monthly_details(datetime.now().month, company),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--companies', type=int, default=2000)
+    parser.add_argument('--rows', type=int, default=20000, help='추천 공고 행 수')
+    parser.add_argument('--latency', type=float, default=0.02, help='스텁 요청당 지연(초)')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    import supabase_client as module
+    from backends import InMemoryBackend, InMemoryStore, RecommendationBackend
+    from local_mirror import LocalMirror, MirrorClient
+
+    companies = _common.make_company_records(args.companies)
+    recommendations = make_period_rows(args.rows, datetime.now().date())
+    for rows in (companies, recommendations):
+        for i, row in enumerate(rows):
+            row['id'], row['updated_at'] = i + 1, '2026-01-01T00:00:00+09:00'
+    tables = {'alpha_companies_final': companies, 'recommend_final': recommendations}
+    company = '회사0'
+
+    with PostgrestStub(tables) as stub, _common.temp_path('mirror.sqlite3') as mirror_path:
+        module.SUPABASE_URL, module.SUPABASE_ANON_KEY = stub.url, 'stub-anon-key'
+        supabase = module.SupabaseClient()
+        supabase._period_view_available = supabase._monthly_rpc_available = False
+        mirror = LocalMirror(mirror_path)
+        mirror.sync(supabase)
+        stub.latency = args.latency
+
+        backends = (
+            (f'supabase ({args.latency * 1000:.0f}ms)', supabase),
+            ('sqlite', MirrorClient(mirror)),
+            ('memory', InMemoryBackend(InMemoryStore(tables))),
+        )
+        print(f"회사 {args.companies:,}곳, 추천 공고 {args.rows:,}행, 화면 1회 조회 (회사 목록 포함/제외)")
+        print(f"{'백엔드':<18}{'전체(ms)':>10}{'회사 목록 제외(ms)':>20}  결과 일치")
+        expected = None
+        for name, backend in backends:
+            assert isinstance(backend, RecommendationBackend)
+            seconds, result = _common.timed(lambda: screen(backend, company), args.repeat)
+            company_seconds, _ = _common.timed(backend.get_companies, args.repeat)
+            expected = expected or result
+            print(f"{name:<18}{seconds * 1000:>10.1f}{(seconds - company_seconds) * 1000:>20.1f}  {result == expected}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""app.py 콜드 스타트: import 시간과 첫 화면 출력(time-to-first-paint)
+
+새 프로세스에서 `python -X importtime`으로 AppTest 첫 실행을 한 번 돌리고 다음을 측정합니다.
+  - 첫 화면 출력: 프로세스의 측정 시작부터 스크립트가 첫 요소(delta)를 내보낼 때까지
+  - 첫 실행 전체: 회사 목록 로드와 기본 회사 탭까지 모두 그릴 때까지
+  - importtime: 주요 패키지의 누적 import 시간과, 첫 화면 출력 시점에 이미 import되어 있었는지
+'즉시 로드'는 예전 동작(app.py 맨 위에서 plotly/supabase import, import 시점에 클라이언트 생성,
+회사 목록 전에 test_connection 왕복)을 스크립트 실행 전에 재현해 비교합니다.
+
+    python benchmarks/bench_cold_start.py [--latency 0.05] [--runs 5]
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+import _common
+from postgrest_stub import PostgrestStub
+
+APP_PATH = os.path.join(_common.ROOT, 'app.py')
+PACKAGES = ('streamlit', 'pandas', 'httpx', 'postgrest', 'supabase', 'plotly.express', 'plotly.graph_objects')
+IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def run_child(eager):
+    """AppTest로 app.py를 한 번 실행하고 [첫 화면 출력(초), 첫 실행(초), 첫 화면 시점에 import된 패키지]를 JSON으로 출력합니다."""
+    started = time.perf_counter()
+    from streamlit.runtime.scriptrunner_utils.script_run_context import ScriptRunContext
+    from streamlit.testing.v1 import AppTest
+
+    first_paint = {}
+    enqueue = ScriptRunContext.enqueue
+
+    def recording_enqueue(self, msg):
+        if not first_paint and msg.WhichOneof('type') == 'delta':
+            first_paint['seconds'] = time.perf_counter() - started
+            first_paint['packages'] = [name for name in PACKAGES if name in sys.modules]
+        return enqueue(self, msg)
+
+    ScriptRunContext.enqueue = recording_enqueue
+    if eager:
+        # 예전 app.py 맨 위의 `import plotly.express as px`, `import plotly.graph_objects as go`
+        # (사용하지 않고 import 시간만 재현하며, 두 패키지 모두 PACKAGES로 import 시간을 보고함)
+        import plotly.express  # noqa: F401
+        import plotly.graph_objects  # noqa: F401
+        import supabase_client
+        supabase_client.get_supabase_client().test_connection()
+    app = AppTest.from_file(APP_PATH, default_timeout=120).run()
+    if app.exception:
+        raise RuntimeError(app.exception)
+    print(json.dumps([first_paint['seconds'], time.perf_counter() - started, first_paint['packages']]))
+
+
+def package_import_times(stderr):
+    """-X importtime 출력에서 PACKAGES별 누적 import 시간(ms)"""
+    times = {}
+    for match in IMPORTTIME_LINE.finditer(stderr):
+        name = match.group(4)
+        if name in PACKAGES:
+            times[name] = max(times.get(name, 0), int(match.group(2)) / 1000)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--latency', type=float, default=0.05, help='요청당 지연(초)')
+    parser.add_argument('--companies', type=int, default=2000)
+    parser.add_argument('--runs', type=int, default=5, help='설정마다 실행할 프로세스 수 (가장 빠른 값 보고)')
+    parser.add_argument('--child', choices=('lazy', 'eager'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child == 'eager')
+        return
+
+    companies = _common.make_company_records(args.companies)
+    companies[0]['기업명'] = '대박드림스'
+    recommendations = _common.make_wide_recommendations(300, extra_columns=0)
+    for row in recommendations:
+        row['기업명'] = '대박드림스'
+
+    with PostgrestStub({'alpha_companies_final': companies, 'recommend_final': recommendations},
+                       latency=args.latency) as stub:
+        env = dict(os.environ, SUPABASE_URL=stub.url, SUPABASE_ANON_KEY='stub-anon-key')
+        print(f"요청 지연 {args.latency * 1000:.0f}ms, 회사 {args.companies:,}곳, 설정마다 {args.runs}회 중 최솟값")
+        for mode, label in (('eager', '즉시 로드'), ('lazy', '지연 로드')):
+            first_paints, first_runs, imports = [], [], {}
+            for _ in range(args.runs):
+                result = subprocess.run([sys.executable, '-X', 'importtime', __file__, '--child', mode],
+                                        env=env, check=True, capture_output=True, text=True)
+                first_paint, first_run, loaded = json.loads(result.stdout.strip().splitlines()[-1])
+                first_paints.append(first_paint)
+                first_runs.append(first_run)
+                for name, ms in package_import_times(result.stderr).items():
+                    imports.setdefault(name, []).append(ms)
+            print(f"\n[{label}] 첫 화면 출력 {min(first_paints) * 1000:.0f}ms, "
+                  f"첫 실행 전체 {min(first_runs) * 1000:.0f}ms")
+            print(f"  {'패키지':<22}{'import(ms)':>12}  첫 화면 전 로드")
+            for name in PACKAGES:
+                if name in imports:
+                    print(f"  {name:<22}{min(imports[name]):>12.0f}  {'예' if name in loaded else '아니오'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""select('*') 대비 컬럼 매니페스트 조회의 전송 바이트와 디코딩 시간 비교
+
+넓은 recommend_final 테이블을 로컬 PostgREST 스텁에 올린 뒤, 같은 조건으로
+전체 컬럼과 메서드별 컬럼 매니페스트를 각각 요청해 응답 크기(gzip 전송량 포함)와
+JSON 디코딩 시간을 측정합니다.
+
+    python benchmarks/bench_column_projection.py --rows 20000
+"""
+import argparse
+import json
+
+import httpx
+
+from _common import make_wide_recommendations, timed
+from postgrest_stub import PostgrestStub
+from supabase_client import COLUMN_MANIFESTS, select_clause
+
+
+def measure(base_url, select, accept_encoding):
+    headers = {'Accept-Encoding': accept_encoding}
+    with httpx.Client(base_url=base_url, headers=headers) as client:
+        response = client.get('/rest/v1/recommend_final', params={'select': select})
+        wire_bytes = int(response.headers['Content-Length'])
+        body = response.content
+    decode_seconds, rows = timed(lambda: json.loads(body))
+    return wire_bytes, len(body), decode_seconds, len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--extra-columns', type=int, default=30)
+    args = parser.parse_args()
+
+    rows = make_wide_recommendations(args.rows, extra_columns=args.extra_columns)
+    with PostgrestStub({'recommend_final': rows}) as stub:
+        print(f"recommend_final: {args.rows}행, {len(rows[0])}개 컬럼")
+        print(f"{'method':<30}{'encoding':<10}{'wire KB':>12}{'body KB':>12}{'decode ms':>12}")
+        for method in ('select(*)', 'get_recommendations', 'get_monthly_recommendations'):
+            select = '*' if method == 'select(*)' else select_clause(COLUMN_MANIFESTS[method])
+            for encoding in ('identity', 'gzip'):
+                wire, body, seconds, _ = measure(stub.url, select, encoding)
+                print(f"{method:<30}{encoding:<10}{wire / 1024:>12.1f}{body / 1024:>12.1f}{seconds * 1000:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
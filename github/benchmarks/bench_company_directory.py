@@ -0,0 +1,77 @@
+"""세션 N개의 회사 목록 비용: 세션별 조회 대비 프로세스 공용 CompanyDirectory
+
+Streamlit 세션 N개가 동시에 처음 접속하는 상황을 스레드 N개로 재현합니다.
+  - 세션별: 예전 app.py처럼 세션마다 load_company_directory로 전체를 내려받아 정규화하고 각자 보관
+  - 공용: company_directory.SharedCompanyDirectory.get (한 번 조회, 모든 세션이 같은 객체 참조)
+alpha_companies_final 요청 수, 전체 소요 시간, 세션들이 보관하는 회사 목록의 메모리(tracemalloc)를 비교합니다.
+
+    python benchmarks/bench_company_directory.py [--sessions 20] [--companies 20000]
+"""
+import argparse
+import threading
+import time
+import tracemalloc
+
+import _common
+from postgrest_stub import PostgrestStub
+
+
+def open_sessions(sessions, load):
+    """스레드 sessions개에서 동시에 load()를 호출하고 (결과 목록, 소요 시간(초), 보관 메모리(MB))를 돌려줍니다."""
+    results = [None] * sessions
+    barrier = threading.Barrier(sessions)
+
+    def session(index):
+        barrier.wait()
+        results[index] = load()
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    threads = [threading.Thread(target=session, args=(index,)) for index in range(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - started
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return results, seconds, retained / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=20)
+    parser.add_argument('--companies', type=int, default=20000)
+    parser.add_argument('--latency', type=float, default=0.05, help='요청당 지연(초)')
+    args = parser.parse_args()
+
+    import supabase_client as module
+    from company_directory import SharedCompanyDirectory, load_company_directory
+
+    companies = _common.make_company_records(args.companies)
+    with PostgrestStub({'alpha_companies_final': companies}, latency=args.latency) as stub:
+        module.SUPABASE_URL, module.SUPABASE_ANON_KEY = stub.url, 'stub-anon-key'
+        client = module.SupabaseClient()
+        # 매니페스트 컬럼 대체 판정을 측정에서 제외
+        next(client.iter_companies(), None)
+
+        def company_requests():
+            return sum(1 for _, path, _ in stub.requests if path.endswith('/alpha_companies_final'))
+
+        shared = SharedCompanyDirectory(loader=lambda on_progress=None: load_company_directory(client, on_progress))
+        setups = (
+            ('세션별', lambda: load_company_directory(client)),
+            ('공용', shared.get),
+        )
+        print(f"세션 {args.sessions}개, 회사 {args.companies:,}곳, 요청 지연 {args.latency * 1000:.0f}ms")
+        print(f"{'방식':<8}{'요청 수':>8}{'소요(ms)':>10}{'보관 메모리(MB)':>16}{'서로 다른 목록':>14}")
+        for name, load in setups:
+            before = company_requests()
+            directories, seconds, retained = open_sessions(args.sessions, load)
+            assert all(len(directory) == args.companies for directory in directories)
+            distinct = len({id(directory.companies) for directory in directories})
+            print(f"{name:<8}{company_requests() - before:>8}{seconds * 1000:>10.0f}{retained:>16.1f}{distinct:>14}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+"""회사 정규화: 행 단위 기준 구현 대비 컬럼 단위 엔진 처리 시간
+
+10k, 100k, 1M 행에서 행 단위 변환(normalize_company_record 반복)과 normalize_companies를 비교하고
+두 결과가 완전히 같은지 확인합니다. 합성 행에는 NULL 고용/기술특허가 있어 기준 구현(normalize_company)만으로는
+변환하지 못하므로, NULL을 기본값으로 채운 뒤 기준 구현을 적용하는 normalize_company_record와 비교합니다.
+
+    python benchmarks/bench_company_normalizer.py --sizes 10000 100000 1000000
+"""
+import argparse
+import gc
+
+from _common import make_company_records, timed
+from company_normalizer import normalize_companies, normalize_company_record
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10}{'row-wise s':>14}{'vectorized s':>14}{'speedup':>10}  identical")
+    for size in args.sizes:
+        records = make_company_records(size)
+        # 한쪽 결과가 살아 있으면 다른 쪽 측정 중 GC 비용이 커지므로 측정마다 결과를 버림
+        gc.collect()
+        row_seconds, _ = timed(lambda: len([normalize_company_record(item) for item in records]), args.repeat)
+        gc.collect()
+        vector_seconds, _ = timed(lambda: len(normalize_companies(records)), args.repeat)
+        identical = normalize_companies(records) == [normalize_company_record(item) for item in records]
+        print(f"{size:>10}{row_seconds:>14.3f}{vector_seconds:>14.3f}{row_seconds / vector_seconds:>9.1f}x  {identical}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""회사 선택: 목록 선형 탐색(next) 대비 CompanyDirectory id 레지스트리
+
+예전 main()은 재실행마다 기본 회사와 선택된 드롭다운 항목의 회사를 목록에서 next()로 찾고,
+선택 항목은 표시 문자열을 " ("로 잘라 회사명을 얻었으며, 세션에 회사 정보(dict)를 통째로 저장했습니다.
+회사 N곳에 대해 재실행 1회의 회사 찾기 시간, 세션에 저장되는 선택 값의 크기(pickle),
+이름에 괄호가 들어간 회사를 올바르게 찾는지를 비교합니다.
+
+    python benchmarks/bench_company_registry.py [--companies 500000]
+"""
+import argparse
+import pickle
+import time
+
+from bench_company_search import make_companies
+
+
+def timed(fn, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--companies', type=int, default=500000)
+    args = parser.parse_args()
+
+    from company_directory import CompanyDirectory
+    from company_search import company_label
+    from company_normalizer import OUTPUT_KEYS
+
+    companies = make_companies(args.companies)
+    for company in companies:
+        company.update({key: company.get(key, None if key == 'row_id' else []) for key in OUTPUT_KEYS})
+    # 기본 회사는 목록 끝쪽, 선택한 회사는 이름에 " ("가 들어간 회사
+    companies[-1]['name'] = '대박드림스'
+    companies[-2]['name'] = '알파 (베타) 랩스'
+    selected_label = company_label(companies[-2])
+    directory = CompanyDirectory(companies)
+    company_list = list(directory.companies)
+
+    def linear():
+        default_company = next((company for company in company_list if company['name'] == '대박드림스'), None)
+        selected_name = selected_label.split(" (")[0]
+        selected = next((company for company in company_list if company['name'] == selected_name), None)
+        return default_company, selected
+
+    def registry():
+        return directory.get(directory.id_for_name('대박드림스')), directory.get(companies[-2]['name'])
+
+    print(f"회사 {args.companies:,}곳, 재실행 1회 (기본 회사 + 선택 회사 찾기)")
+    print(f"{'방식':<14}{'찾기(ms)':>10}{'세션 저장(bytes)':>18}  괄호 이름 선택")
+    for name, find, stored in (
+            ('선형 탐색', linear, lambda selected: dict(selected) if selected else None),
+            ('id 레지스트리', registry, lambda selected: selected['id'])):
+        seconds, (_, selected) = timed(find)
+        size = len(pickle.dumps(stored(selected or companies[-2])))
+        ok = selected is not None and selected['name'] == companies[-2]['name']
+        print(f"{name:<14}{seconds * 1000:>10.3f}{size:>18}  {'성공' if ok else '실패'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""회사 검색: 사이드바의 선형 탐색 대비 CompanySearchIndex
+
+임의로 만든 한글/영문 회사명 N개에 대해 색인 생성 시간과 검색어 종류별(접두어, 부분 문자열, 한 글자,
+초성) 검색 시간을 비교합니다. 색인 결과가 선형 탐색과 같은 회사 집합인지도 확인합니다
+(초성 검색은 선형 탐색으로 찾을 수 없으므로 초성 키에 대한 선형 탐색과 비교).
+
+    python benchmarks/bench_company_search.py [--companies 500000] [--limit 200]
+"""
+import argparse
+import random
+import time
+
+import _common
+
+# 상위 디렉토리 모듈(company_search)은 함수 안에서 import함
+_common.setup_path()
+
+SYLLABLES = '가나다라마바사아자차카타파하대박드림스테크바이오코리아에너지솔루션랩스시스템소프트네트웍스메디칼푸드'
+WORDS = ('AI', 'Bio', 'Labs', 'Tech', 'Soft', 'Data', 'Cloud', 'Robotics')
+SUFFIXES = ('', '', '', '(주)', ' 주식회사', '테크', '바이오', '랩스')
+INDUSTRIES = ('IT/소프트웨어', '바이오/헬스케어', '제조업', '기타')
+REGIONS = ('서울특별시', '경기도', '부산광역시', '전국')
+
+
+def make_companies(count, seed=0):
+    rng = random.Random(seed)
+    companies = []
+    for i in range(count):
+        name = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5)))
+        if rng.random() < 0.2:
+            name = f"{rng.choice(WORDS)} {name}"
+        companies.append({
+            'name': name + rng.choice(SUFFIXES),
+            'industry': rng.choice(INDUSTRIES),
+            'region': rng.choice(REGIONS),
+        })
+    return companies
+
+
+def linear_search(companies, search_term):
+    """예전 app.py 사이드바 검색"""
+    return [company for company in companies if search_term.lower() in company['name'].lower()]
+
+
+def timed(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--companies', type=int, default=500000)
+    parser.add_argument('--limit', type=int, default=200, help='색인 검색 결과 수 상한 (드롭다운 표시 개수)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    from company_search import CompanySearchIndex, to_chosung
+
+    companies = make_companies(args.companies)
+    started = time.perf_counter()
+    index = CompanySearchIndex(companies)
+    build_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    index.search('ㄷㅂ')
+    chosung_seconds = time.perf_counter() - started
+    print(f"회사 {args.companies:,}곳: 색인 생성 {build_seconds * 1000:.0f}ms, "
+          f"초성 색인(첫 초성 검색 시) {chosung_seconds * 1000:.0f}ms")
+
+    queries = (
+        ('접두어', '대박'),
+        ('부분 문자열', '드림스'),
+        ('부분 문자열(영문)', 'labs'),
+        ('한 글자', '림'),
+        ('없는 이름', '가나다라마바'),
+        ('초성', 'ㄷㅂㄷㄹ'),
+        ('초성(두 글자)', 'ㅂㅇ'),
+    )
+    print(f"{'검색어':<20}{'선형(ms)':>10}{'색인 전체(ms)':>14}{f'색인 {args.limit}개(ms)':>15}{'결과 수':>9}  일치")
+    for name, query in queries:
+        if name.startswith('초성'):
+            keys = [to_chosung(company['name']) for company in companies]
+            linear_seconds, expected = timed(lambda: [i for i, key in enumerate(keys) if query in key], args.repeat)
+        else:
+            linear_seconds, expected = timed(lambda: linear_search(companies, query), args.repeat)
+            expected = [i for i, company in enumerate(companies) if query.lower() in company['name'].lower()]
+        full_seconds, found = timed(lambda: index.search(query), args.repeat)
+        limited_seconds, _ = timed(lambda: index.search(query, limit=args.limit), args.repeat)
+        print(f"{f'{name} {query!r}':<20}{linear_seconds * 1000:>10.2f}{full_seconds * 1000:>14.3f}"
+              f"{limited_seconds * 1000:>15.3f}{len(found):>9}  {sorted(found) == sorted(expected)}")
+
+
+if __name__ == '__main__':
+    main()
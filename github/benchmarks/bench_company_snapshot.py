@@ -0,0 +1,99 @@
+"""회사 선택 후 화면 갱신 1회: 탭별 개별 조회 대비 CompanySnapshot 한 번 조회
+
+지연(latency)을 준 PostgREST 스텁에 대해, 예전 탭 코드가 하던 조회 순서
+(맞춤 추천 1회, 알림 현황 2회, 신규 공고 1회, 마감 임박 1회, 월별 집계 1회)와
+CompanySnapshot.fetch 한 번 + 로컬 계산을 비교합니다. 요청 수, 전송 바이트, 소요 시간과 결과 일치를 출력합니다.
+이어서 로드맵 월 버튼 12개를 차례로 누를 때 get_monthly_details 대비 월 색인 조회 비용을 비교합니다.
+
+    python benchmarks/bench_company_snapshot.py [--rows 300] [--latency 0.05]
+"""
+import argparse
+from datetime import datetime
+
+import _common
+from postgrest_stub import PostgrestStub
+from validate_period_view import make_period_rows
+
+
+def per_tab_rerun(client, company):
+    """예전 탭 코드의 조회 순서 (기간 뷰가 없을 때의 클라이언트 필터링 경로)"""
+    return {
+        'all': client.get_recommendations(company_name=company),
+        'new': client.get_recommendations(company_name=company, is_new_announcements=True),
+        'active': client.get_recommendations(company_name=company, is_active_only=True),
+        'monthly_counts': client.get_monthly_recommendations(company_name=company),
+        # 알림 현황과 마감 임박 표가 전체 목록을 한 번씩 더 조회
+        '_notification': client.get_recommendations(company_name=company),
+        '_deadline': client.get_recommendations(company_name=company),
+    }
+
+
+def snapshot_rerun(client, company):
+    from company_snapshot import CompanySnapshot
+
+    snapshot = CompanySnapshot.fetch(client, company)
+    return {
+        'all': snapshot.records,
+        'new': snapshot.new,
+        'active': snapshot.active,
+        'monthly_counts': snapshot.monthly_counts,
+        '_urgent': snapshot.urgent,
+        '_deadline': snapshot.deadline,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=300, help='회사 한 곳의 추천 공고 수')
+    parser.add_argument('--latency', type=float, default=0.05, help='요청당 지연(초)')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = make_period_rows(args.rows * 20, datetime.now().date())
+    company = '회사0'
+
+    import supabase_client as module
+
+    with PostgrestStub({'recommend_final': rows}, latency=args.latency) as stub:
+        module.SUPABASE_URL, module.SUPABASE_ANON_KEY = stub.url, 'stub-anon-key'
+        client = module.SupabaseClient()
+        client._period_view_available = False
+
+        results = {}
+        print(f"{'방식':<14}{'요청 수':>8}{'전송 KB':>10}{'소요(ms)':>10}")
+        for name, rerun in (('탭별 개별 조회', per_tab_rerun), ('스냅샷', snapshot_rerun)):
+            before, sent_before = len(stub.requests), stub.sent_bytes
+            seconds, results[name] = _common.timed(lambda: rerun(client, company), args.repeat)
+            count = (len(stub.requests) - before) // args.repeat
+            sent = (stub.sent_bytes - sent_before) / args.repeat / 1024
+            print(f"{name:<14}{count:>8}{sent:>10.1f}{seconds * 1000:>10.1f}")
+
+        from company_snapshot import CompanySnapshot
+
+        snapshot = CompanySnapshot.fetch(client, company)
+        before = len(stub.requests)
+        details_seconds, expected = _common.timed(
+            lambda: [client.get_monthly_details(month, company_name=company) for month in range(1, 13)], args.repeat)
+        details_requests = (len(stub.requests) - before) // args.repeat
+        # 첫 클릭은 월별 표를 만들고, 이후 클릭은 보관된 표를 돌려줌
+        first_seconds, _ = _common.timed(lambda: [CompanySnapshot(company, snapshot.records).month_details(month)
+                                                  for month in range(1, 13)], args.repeat)
+        for month in range(1, 13):
+            snapshot.month_details(month)
+        repeat_seconds, actual = _common.timed(lambda: [snapshot.month_details(month) for month in range(1, 13)],
+                                               args.repeat)
+
+    shared = ('all', 'new', 'active', 'monthly_counts')
+    same = all(results['탭별 개별 조회'][key] == results['스냅샷'][key] for key in shared)
+    print(f"결과 일치 ({', '.join(shared)}): {same}")
+
+    print("\n[로드맵 월 버튼 12개 클릭]")
+    for name, requests, seconds in (('get_monthly_details', details_requests, details_seconds),
+                                    ('색인 (첫 클릭, 파싱 포함)', 0, first_seconds),
+                                    ('색인 (다시 클릭)', 0, repeat_seconds)):
+        print(f"  {name}: 요청 {requests}회, {seconds * 1000:.2f}ms")
+    print(f"결과 일치 (월별 상세): {expected == actual}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""오타 허용 회사 검색: 전체 레벤슈타인 비교 대비 BK-tree (CompanySearchIndex.fuzzy_search)
+
+bench_company_search.py와 같은 임의 회사명 N개에 대해, 실제 회사명에 오타(글자 치환/삭제/삽입)를 넣은 검색어로
+  - 전체 비교(DP): 모든 정규화 키와 동적 계획법 레벤슈타인 거리 계산
+  - 전체 비교(비트 병렬): 모든 키와 company_search의 비트 병렬 거리 계산
+  - BK-tree: 편집 거리 k 이내 가지만 탐색
+의 검색 시간과 거리를 계산한 키 비율을 비교하고, 결과(거리, 키)가 같은지 확인합니다.
+
+    python benchmarks/bench_fuzzy_search.py [--companies 100000] [--queries 50]
+"""
+import argparse
+import random
+import time
+
+from bench_company_search import SYLLABLES, make_companies
+
+
+def dp_levenshtein(a, b):
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def make_typo(name, rng):
+    """글자 하나를 치환/삭제하거나 삽입한 오타"""
+    position = rng.randrange(len(name))
+    kind = rng.choice(('replace', 'delete', 'insert'))
+    if kind == 'replace':
+        return name[:position] + rng.choice(SYLLABLES) + name[position + 1:]
+    if kind == 'delete' and len(name) > 1:
+        return name[:position] + name[position + 1:]
+    return name[:position] + rng.choice(SYLLABLES) + name[position:]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--companies', type=int, default=100000)
+    parser.add_argument('--queries', type=int, default=50)
+    args = parser.parse_args()
+
+    from company_search import CompanySearchIndex, default_fuzzy_distance, levenshtein, normalize_name
+
+    companies = make_companies(args.companies)
+    index = CompanySearchIndex(companies)
+    started = time.perf_counter()
+    tree, ids_by_key = index._fuzzy_index()
+    print(f"회사 {args.companies:,}곳 (정규화 키 {tree.size:,}개): BK-tree 생성 {time.perf_counter() - started:.2f}s")
+
+    rng = random.Random(1)
+    keys = list(ids_by_key)
+    queries = [make_typo(normalize_name(rng.choice(companies)['name']), rng) for _ in range(args.queries)]
+
+    def brute_force(distance):
+        def search(query, k):
+            return sorted((d, key) for key in keys if (d := distance(query, key)) <= k)
+        return search
+
+    setups = (
+        ('전체 비교(DP)', brute_force(dp_levenshtein)),
+        ('전체 비교(비트 병렬)', brute_force(levenshtein)),
+        ('BK-tree', lambda query, k: tree.search(query, k)[0]),
+    )
+    print(f"검색어 {len(queries)}개 (오타 1글자, k=default_fuzzy_distance)")
+    print(f"{'방식':<22}{'검색당(ms)':>12}{'거리 계산 비율':>16}  결과 일치")
+    expected = None
+    for name, search in setups:
+        started = time.perf_counter()
+        results = [search(query, default_fuzzy_distance(query)) for query in queries]
+        per_query = (time.perf_counter() - started) / len(queries)
+        if name == 'BK-tree':
+            visited = sum(tree.search(query, default_fuzzy_distance(query))[1] for query in queries)
+            ratio = visited / (len(keys) * len(queries))
+        else:
+            ratio = 1.0
+        expected = expected or results
+        print(f"{name:<22}{per_query * 1000:>12.2f}{ratio:>16.1%}  {results == expected}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""데이터 가공 핫 패스 마이크로벤치마크 (1k / 100k / 1M행, 기준값 비교)
+
+네트워크 없이 InMemoryBackend(backends.py)에 합성 행을 올리고 CPU를 쓰는 경로를 행 수별로 잽니다.
+  - get_companies: 회사 행 정규화 (iter_companies -> normalize_companies)
+  - get_recommendations 활성/신규: '사업 연도' 파싱과 기간 필터 (한 회사의 추천 공고 N행)
+  - get_monthly_recommendations / get_monthly_details: 월 분류
+  - CompanySnapshot: 앱이 쓰는 스냅샷 생성 + 탭 목록(활성/신규/마감 임박/이번 달/월별)
+  - count_high_score: 알림 탭의 고점수 공고 수
+  - recommendation_frame / display_recommendations: 추천 DataFrame 생성, 정렬, 표시용 표, 요약 지표
+
+측정값은 GC를 끈 상태로 반복한 중 가장 빠른 시간이며, 기준값 파일(benchmarks/baselines/hot_paths.json)과 비교해
+--threshold배보다 느려진 항목을 표시합니다. --check를 주면 느려진 항목이 있을 때 종료 코드 1로 끝납니다.
+기준값은 측정한 머신에서만 의미가 있으므로, 다른 머신에서는 변경 전 코드로 --save-baseline을 먼저 실행합니다.
+
+    python benchmarks/bench_hot_paths.py [--sizes 1000,100000,1000000] [--only snapshot]
+    python benchmarks/bench_hot_paths.py --save-baseline     # 현재 측정값을 기준값으로 저장
+"""
+import argparse
+import gc
+import os
+import sys
+from datetime import datetime
+
+import _common
+from validate_period_view import make_period_rows
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'hot_paths.json')
+COMPANY = '대박드림스'
+
+
+def make_backend(size):
+    """회사 size곳과, 한 회사(COMPANY)의 추천 공고 size행을 올린 InMemoryBackend"""
+    from backends import InMemoryBackend
+
+    recommendations = make_period_rows(size, datetime.now().date())
+    for row in recommendations:
+        row['기업명'] = COMPANY
+    return InMemoryBackend({
+        'alpha_companies_final': _common.make_company_records(size),
+        'recommend_final': recommendations,
+    })
+
+
+def cases(backend):
+    """(이름, 함수) 목록. 함수는 미리 만든 입력만 사용합니다."""
+    from company_snapshot import CompanySnapshot
+    from recommendation_view import (
+        count_high_score, display_frame, recommendation_frame, sort_recommendations, summarize_recommendations,
+    )
+
+    month = datetime.now().month
+    records = backend.get_recommendations(COMPANY)
+    frame = recommendation_frame(records)
+
+    def snapshot_tabs():
+        snapshot = CompanySnapshot(COMPANY, records)
+        return (snapshot.active, snapshot.new, snapshot.deadline, snapshot.this_month, snapshot.monthly_counts,
+                snapshot.month_details(month))
+
+    def display_recommendations():
+        sorted_frame = sort_recommendations(frame, "추천 점수 높은 순")
+        return display_frame(sorted_frame), summarize_recommendations(sorted_frame)
+
+    return [
+        ('get_companies', lambda: list(backend.iter_companies())),
+        ('get_recommendations_active', lambda: backend.get_recommendations(COMPANY, is_active_only=True)),
+        ('get_recommendations_new', lambda: backend.get_recommendations(COMPANY, is_new_announcements=True)),
+        ('get_monthly_recommendations', lambda: backend.get_monthly_recommendations(COMPANY)),
+        ('get_monthly_details', lambda: backend.get_monthly_details(month, COMPANY)),
+        ('snapshot', snapshot_tabs),
+        ('count_high_score', lambda: count_high_score(records)),
+        ('recommendation_frame', lambda: recommendation_frame(records, 0, 50)),
+        ('display_recommendations', display_recommendations),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='1000,100000,1000000', help='쉼표로 구분한 행 수')
+    parser.add_argument('--only', default='', help='이름에 이 문자열이 들어간 항목만 실행')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true', help='측정값을 기준값 파일에 저장')
+    parser.add_argument('--threshold', type=float, default=1.5, help='기준값 대비 이 배수보다 느리면 느려짐으로 표시')
+    parser.add_argument('--check', action='store_true', help='느려진 항목이 있으면 종료 코드 1')
+    args = parser.parse_args()
+
+    baseline = _common.load_baseline(args.baseline)
+    results, regressions = {}, []
+    print(f"{'항목':<30}{'행 수':>10}{'시간(ms)':>12}{'기준(ms)':>12}{'비율':>8}")
+    for size in (int(size) for size in args.sizes.split(',')):
+        backend = make_backend(size)
+        # 1M행은 한 번, 작은 크기는 여러 번 실행해 가장 빠른 시간을 사용 (1M행 미만은 한 번 먼저 실행해 캐시를 데움)
+        repeat = max(1, min(20, 300000 // size))
+        for name, fn in cases(backend):
+            if args.only not in name:
+                continue
+            if repeat > 1:
+                fn()
+            # 앞 항목이 남긴 객체 수에 따라 GC 시점이 달라지지 않도록 측정 중에는 GC를 끔
+            gc.collect()
+            gc.disable()
+            try:
+                seconds, _ = _common.timed(fn, repeat)
+            finally:
+                gc.enable()
+            ms = seconds * 1000
+            results.setdefault(name, {})[str(size)] = round(ms, 3)
+            expected = baseline.get(name, {}).get(str(size))
+            if expected:
+                ratio = ms / expected
+                mark = '  ⚠️ 느려짐' if ratio > args.threshold else ''
+                if mark:
+                    regressions.append((name, size, ratio))
+                print(f"{name:<30}{size:>10,}{ms:>12.2f}{expected:>12.2f}{ratio:>7.2f}x{mark}")
+            else:
+                print(f"{name:<30}{size:>10,}{ms:>12.2f}{'-':>12}{'-':>8}")
+
+    if args.save_baseline:
+        _common.save_baseline(args.baseline, results)
+        print(f"💾 기준값 저장: {args.baseline}")
+    if regressions:
+        print(f"⚠️ 기준값보다 {args.threshold}배 넘게 느려진 항목 {len(regressions)}개: "
+              + ', '.join(f"{name}@{size:,} ({ratio:.2f}x)" for name, size, ratio in regressions))
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
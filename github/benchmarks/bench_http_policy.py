@@ -0,0 +1,78 @@
+"""HTTP 정책(http_policy.HttpPolicy) 조회 지연 p50/p99와 실패율
+
+지연과 지터, 일정 비율의 503 오류를 주입한 PostgREST 스텁에 같은 조회를 반복하고 세 가지 설정을 비교합니다.
+  - supabase 기본: create_client 기본값 (postgrest 자체 재시도: 503/520에 1초, 2초... 대기)
+  - 재시도 없음: HttpPolicy(max_attempts=1)
+  - HttpPolicy 기본: 지터 지수 백오프 재시도 + deadline
+
+    python benchmarks/bench_http_policy.py [--queries 300] [--error-rate 0.1]
+"""
+import argparse
+import statistics
+import time
+
+import _common
+from postgrest_stub import PostgrestStub
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+def run(execute, queries):
+    latencies, failures = [], 0
+    for _ in range(queries):
+        started = time.perf_counter()
+        try:
+            execute()
+        except Exception:
+            failures += 1
+        latencies.append(time.perf_counter() - started)
+    return latencies, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--queries', type=int, default=300)
+    parser.add_argument('--latency', type=float, default=0.02)
+    parser.add_argument('--jitter', type=float, default=0.03)
+    parser.add_argument('--error-rate', type=float, default=0.1)
+    args = parser.parse_args()
+
+    from supabase import create_client
+
+    import supabase_client as module
+    from http_policy import HttpPolicy
+
+    rows = _common.make_wide_recommendations(200, extra_columns=0)
+    with PostgrestStub({'recommend_final': rows}, latency=args.latency, jitter=args.jitter,
+                       error_rate=args.error_rate, error_status=503, seed=1) as stub:
+        module.SUPABASE_URL, module.SUPABASE_ANON_KEY = stub.url, 'stub-anon-key'
+        company = rows[0]['기업명']
+
+        default = create_client(stub.url, 'stub-anon-key')
+        no_retry = module.SupabaseClient(http_policy=HttpPolicy(max_attempts=1))
+        policy = module.SupabaseClient(http_policy=HttpPolicy())
+
+        def select(client):
+            return lambda: client._select('recommend_final', 'get_recommendations',
+                                          lambda query: query.eq('기업명', company))
+
+        setups = (
+            ('supabase 기본', lambda: default.table('recommend_final').select('*').eq('기업명', company).execute()),
+            ('재시도 없음', select(no_retry)),
+            ('HttpPolicy 기본', select(policy)),
+        )
+        print(f"조회 {args.queries}회, 지연 {args.latency * 1000:.0f}ms + 지터 최대 {args.jitter * 1000:.0f}ms, "
+              f"503 비율 {args.error_rate:.0%}")
+        print(f"{'설정':<18}{'p50(ms)':>9}{'p99(ms)':>9}{'최대(ms)':>10}{'평균(ms)':>10}{'실패율':>8}")
+        for name, execute in setups:
+            latencies, failures = run(execute, args.queries)
+            print(f"{name:<18}{percentile(latencies, 0.5) * 1000:>9.1f}{percentile(latencies, 0.99) * 1000:>9.1f}"
+                  f"{max(latencies) * 1000:>10.1f}{statistics.mean(latencies) * 1000:>10.1f}"
+                  f"{failures / args.queries:>8.1%}")
+
+
+if __name__ == '__main__':
+    main()
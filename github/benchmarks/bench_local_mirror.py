@@ -0,0 +1,138 @@
+"""로컬 미러(local_mirror.py) 동기화: 전체 대비 증분, 100만 행 합성 테이블
+
+recommend_final 형식의 합성 행 N개(id, 30일에 걸친 updated_at 포함)를 메모리 원본(MemorySource)에 두고
+LocalMirror로 전체 동기화, 변경 없는 증분 동기화, 일부 행을 바꾼 증분 동기화 시간을 잽니다.
+MemorySource는 SupabaseClient.fetch_changes와 같은 (updated_at, id) 키셋 페이지를 돌려주고, 페이지마다
+--latency만큼 기다려 네트워크 왕복을 흉내 냅니다. 동기화 후 미러 내용이 원본과 같은지도 확인합니다.
+
+PostgREST 경로(SupabaseClient.fetch_changes의 or/order/limit 쿼리)는 --stub-rows 크기로 스텁에서 따로 확인합니다.
+
+    python benchmarks/bench_local_mirror.py [--rows 1000000] [--changed 0.01] [--latency 0.02]
+"""
+import argparse
+import json
+import os
+import random
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+
+import _common
+from validate_period_view import make_period_rows
+
+# 상위 디렉토리 모듈(supabase_client 등)은 함수 안에서 import함
+_common.setup_path()
+
+BASE_TIME = datetime(2026, 9, 1).astimezone()
+
+
+class MemorySource:
+    """(updated_at, id) 순으로 정렬된 메모리 행에서 fetch_changes 페이지를 돌려주는 원본"""
+
+    def __init__(self, rows, latency=0.0):
+        self.latency = latency
+        self.requests = 0
+        self.reset(rows)
+
+    def reset(self, rows):
+        self.rows = sorted(rows, key=lambda row: (row['updated_at'], row['id']))
+        self._keys = [(row['updated_at'], row['id']) for row in self.rows]
+
+    def fetch_changes(self, table, watermark, key, after=None, page_size=1000):
+        self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if after is None:
+            start = 0
+        elif after[1] is None:
+            start = bisect_left(self._keys, (after[0],))
+        else:
+            start = bisect_right(self._keys, (after[0], after[1]))
+        return self.rows[start:start + page_size]
+
+    def fetch_rows(self, table, start, page_size=1000, order=()):
+        return self.rows[start:start + page_size]
+
+
+def make_rows(count, seed=0):
+    rows = make_period_rows(count, datetime.now().date(), seed=seed)
+    span = 30 * 24 * 3600 / max(count, 1)
+    for i, row in enumerate(rows):
+        row['id'] = i + 1
+        row['updated_at'] = (BASE_TIME + timedelta(seconds=i * span)).isoformat()
+    return rows
+
+
+def mirror_matches(mirror, rows):
+    """미러의 recommend_final이 원본 행과 같은지"""
+    stored = {json.loads(data)['id']: data for data, in
+              mirror._connect().execute('SELECT data FROM recommend_final')}
+    return len(stored) == len(rows) and all(
+        stored.get(row['id']) == json.dumps(row, ensure_ascii=False, default=str) for row in rows)
+
+
+def check_stub(count, page_size):
+    """스텁을 통해 SupabaseClient.fetch_changes로 전체/증분 동기화한 결과가 원본과 같은지 확인합니다."""
+    import supabase_client as module
+    from local_mirror import LocalMirror, MirrorTable
+    from postgrest_stub import PostgrestStub
+
+    rows = make_rows(count, seed=1)
+    with PostgrestStub({'recommend_final': rows}) as stub, _common.temp_path('mirror.sqlite3') as path:
+        module.SUPABASE_URL, module.SUPABASE_ANON_KEY = stub.url, 'stub-anon-key'
+        source = module.SupabaseClient()
+        mirror = LocalMirror(path, tables=(MirrorTable('recommend_final'),))
+        full = mirror.sync(source, page_size=page_size)[0]
+        changed_at = (BASE_TIME + timedelta(days=31)).isoformat()
+        for row in random.Random(2).sample(rows, count // 20):
+            row['최종 점수'], row['updated_at'] = 0, changed_at
+        incremental = mirror.sync(source, page_size=page_size)[0]
+        print(f"스텁 {count:,}행: 전체 {full.rows:,}행, 증분 {incremental.rows:,}행 받음, "
+              f"미러 일치 {mirror_matches(mirror, rows)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--changed', type=float, default=0.01, help='증분 동기화 전에 바꿀 행 비율')
+    parser.add_argument('--latency', type=float, default=0.02, help='페이지 요청당 지연(초)')
+    parser.add_argument('--page-size', type=int, default=1000)
+    parser.add_argument('--stub-rows', type=int, default=5000)
+    args = parser.parse_args()
+
+    check_stub(args.stub_rows, args.page_size)
+
+    rows = make_rows(args.rows)
+    source = MemorySource(rows, latency=args.latency)
+    with _common.temp_path('mirror.sqlite3') as path:
+        sync_memory_source(source, rows, path, args)
+
+
+def sync_memory_source(source, rows, path, args):
+    """메모리 원본을 path의 미러로 전체 -> 변경 없음 -> 일부 변경 순으로 동기화하며 시간을 잽니다."""
+    from local_mirror import LocalMirror, MirrorTable
+
+    mirror = LocalMirror(path, tables=(MirrorTable('recommend_final'),))
+
+    def run(name):
+        before = source.requests
+        result = mirror.sync(source, page_size=args.page_size)[0]
+        print(f"{name:<22}{result.mode:>13}{result.rows:>12,}{source.requests - before:>8}"
+              f"{result.seconds:>10.2f}")
+        return result
+
+    print(f"원본 {args.rows:,}행, 페이지 {args.page_size}행, 페이지당 지연 {args.latency * 1000:.0f}ms")
+    print(f"{'동기화':<22}{'방식':>13}{'받은 행':>12}{'요청':>8}{'시간(s)':>10}")
+    run('처음 (전체)')
+    run('변경 없음')
+    changed_at = (BASE_TIME + timedelta(days=31)).isoformat()
+    for row in random.Random(1).sample(rows, int(args.rows * args.changed)):
+        row['최종 점수'], row['updated_at'] = 0, changed_at
+    rows.append(dict(rows[0], id=args.rows + 1, 사업명='새 공고', updated_at=changed_at))
+    source.reset(rows)
+    run(f'{args.changed:.0%} 변경 + 1행 추가')
+    print(f"미러 일치: {mirror_matches(mirror, rows)}, 미러 파일 {os.path.getsize(path) / 1024 / 1024:.0f}MB")
+
+
+if __name__ == '__main__':
+    main()
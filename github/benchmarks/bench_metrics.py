@@ -0,0 +1,102 @@
+"""조회 지표(metrics.py) 기록 비용: 지표 켬/끔의 조회 시간 비교
+
+  - track(): 빈 블록 하나를 기록하는 비용 (켬/끔, 호출당 마이크로초)
+  - 메모리 백엔드: 네트워크 없는 가장 빠른 조회 경로에서 get_recommendations/get_monthly_details 켬/끔
+  - 스텁(HTTP): 지연 없는 PostgREST 스텁 조회 켬/끔 (응답 훅의 바이트 세기 포함)과,
+    지표의 응답 바이트 합계가 스텁이 보낸 바이트와 같은지 확인
+
+    python benchmarks/bench_metrics.py [--rows 1000] [--repeat 200]
+"""
+import argparse
+import statistics
+from datetime import datetime
+
+import _common
+from postgrest_stub import PostgrestStub
+from validate_period_view import make_period_rows
+
+COMPANY = '대박드림스'
+
+
+def track_cost(metrics, calls):
+    """track() 호출당 평균 초"""
+    def run():
+        for _ in range(calls):
+            with metrics.track('get_recommendations', 'recommend_final') as call:
+                call.rows = 1
+    seconds, _ = _common.timed(run, 5)
+    return seconds / calls
+
+
+def compare(client, cases, repeat):
+    """[(이름, 끔 초, 켬 초)]. 같은 클라이언트의 metrics만 바꿔 가며 잽니다.
+
+    머신 부하 변화가 한쪽에만 몰리지 않도록 켬/끔을 호출마다 번갈아 실행하고 중앙값을 비교합니다.
+    """
+    from metrics import ClientMetrics
+
+    settings = {False: ClientMetrics(enabled=False), True: ClientMetrics()}
+    rows = []
+    for name, fn in cases:
+        fn()
+        timings = {False: [], True: []}
+        for _ in range(repeat):
+            for enabled, metrics in settings.items():
+                client.metrics = metrics
+                seconds, _ = _common.timed(fn, 1)
+                timings[enabled].append(seconds)
+        rows.append((name, statistics.median(timings[False]), statistics.median(timings[True])))
+    return rows
+
+
+def print_rows(title, rows):
+    print(title)
+    for name, off, on in rows:
+        print(f"  {name:<30}{off * 1e6:>12.1f}{on * 1e6:>12.1f}{(on - off) * 1e6:>10.1f}{(on / off - 1) * 100:>9.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1000, help=f'{COMPANY}의 추천 공고 행 수')
+    parser.add_argument('--repeat', type=int, default=200, help='켬/끔 각각의 호출 수 (스텁은 1/10)')
+    args = parser.parse_args()
+
+    import supabase_client as module
+    from backends import InMemoryBackend
+    from metrics import ClientMetrics
+
+    off, on = track_cost(ClientMetrics(enabled=False), 100000), track_cost(ClientMetrics(), 100000)
+    print(f"track() 호출당: 끔 {off * 1e6:.2f}µs, 켬 {on * 1e6:.2f}µs")
+
+    month = datetime.now().month
+    recommendations = make_period_rows(args.rows, datetime.now().date())
+    for row in recommendations:
+        row['기업명'] = COMPANY
+    tables = {'alpha_companies_final': _common.make_company_records(100), 'recommend_final': recommendations}
+
+    def cases(client):
+        return [
+            ('get_recommendations', lambda: client.get_recommendations(COMPANY)),
+            ('get_recommendations(활성)', lambda: client.get_recommendations(COMPANY, is_active_only=True)),
+            ('get_monthly_details', lambda: client.get_monthly_details(month, COMPANY)),
+        ]
+
+    print(f"{'':<32}{'끔(µs)':>12}{'켬(µs)':>12}{'차이(µs)':>10}{'비율':>10}")
+    memory = InMemoryBackend(tables)
+    print_rows(f"메모리 백엔드 ({args.rows:,}행)", compare(memory, cases(memory), args.repeat))
+
+    with PostgrestStub(tables) as stub:
+        module.SUPABASE_URL, module.SUPABASE_ANON_KEY = stub.url, 'stub-anon-key'
+        client = module.SupabaseClient()
+        client._period_view_available = client._monthly_rpc_available = False
+        print_rows(f"스텁 HTTP ({args.rows:,}행, 지연 없음)", compare(client, cases(client), max(1, args.repeat // 10)))
+
+        client.metrics = metrics = ClientMetrics()
+        sent = stub.sent_bytes
+        client.get_recommendations(COMPANY)
+        counted = sum(row['response_bytes'] for row in metrics.summary())
+        print(f"응답 바이트: 지표 {counted:,} / 스텁 전송 {stub.sent_bytes - sent:,} -> 일치 {counted == stub.sent_bytes - sent}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""'사업 연도' 기간 파싱: 호출부별 정규식/strptime 반복 대비 period_parser
+
+한 번의 화면 갱신에서 같은 추천 행을 읽는 네 호출부(활성 필터, 알림 지표, 마감 임박 표, 월별 집계)를
+기준으로, 예전처럼 호출부마다 re.search + strptime을 수행하는 방식과 parse_period를 비교합니다.
+cold는 처음 보는 문자열(캐시 비움), warm은 이미 해석한 문자열(다음 화면 갱신)입니다.
+결과는 문자열 100만 개당 처리 시간으로 환산하고, 두 방식의 결과가 같은지도 확인합니다.
+
+    python benchmarks/bench_period_parser.py [--rows 200000]
+"""
+import argparse
+import gc
+import random
+import re
+from datetime import datetime, timedelta
+
+import _common
+import period_parser
+from period_parser import parse_period
+
+
+def make_period_strings(count, seed=0):
+    """실제 데이터처럼 기간/상시/월 표기와 잘못된 형식이 섞인 '사업 연도' 문자열 목록"""
+    rng = random.Random(seed)
+    today = datetime.now().date()
+
+    def day(offset):
+        return (today + timedelta(days=offset)).strftime('%Y%m%d')
+
+    templates = [
+        lambda: f"{day(rng.randint(-60, 0))} ~ {day(rng.randint(0, 60))}",
+        lambda: f"{day(rng.randint(-10, 3))}~{day(rng.randint(-5, 30))}",
+        lambda: '예산 소진시까지',
+        lambda: f"상시 모집 ({day(0)} ~ )",
+        lambda: f'"{day(rng.randint(-30, 30))}"',
+        lambda: f"2025년 {rng.randint(1, 13)}월",
+        lambda: f"2025.{rng.randint(1, 12):02d}.{rng.randint(1, 28):02d}",
+        lambda: '20250230 ~ 20251301',
+        lambda: '2025',
+        lambda: '',
+    ]
+    return [rng.choice(templates)() for _ in range(count)]
+
+
+# 예전 호출부 코드를 그대로 옮긴 기준 구현 (get_recommendations / show_notification_tab /
+# display_deadline_announcements / get_monthly_recommendations)
+LEGACY_MONTH_PATTERNS = [
+    r'"(\d{8})"',
+    r'(\d{8})\s*~',
+    r'(\d{8})',
+    r'(\d{4})년\s*(\d{1,2})월',
+    r'(\d{4})\.(\d{1,2})\.(\d{1,2})',
+]
+
+
+def _legacy_date(pattern, period_str):
+    match = re.search(pattern, period_str)
+    if match:
+        try:
+            return datetime.strptime(match.group(1), '%Y%m%d').date()
+        except ValueError:
+            pass
+    return None
+
+
+def legacy_rerun(strings, today):
+    active = urgent = this_month = deadline = 0
+    monthly_counts = {i: 0 for i in range(1, 13)}
+    for period_str in strings:
+        if not period_str:
+            continue
+        # get_recommendations(is_active_only=True)
+        start_date = _legacy_date(r'(\d{8})\s*~', period_str)
+        end_date = _legacy_date(r'~\s*(\d{8})', period_str)
+        if '예산 소진시까지' in period_str or '상시' in period_str or (
+                start_date and end_date and start_date <= today <= end_date):
+            active += 1
+        # show_notification_tab
+        end_date = _legacy_date(r'~\s*(\d{8})', period_str)
+        if end_date and 0 <= (end_date - today).days <= 7:
+            urgent += 1
+        start_date = _legacy_date(r'(\d{8})\s*~', period_str)
+        if start_date and start_date.month == today.month and start_date.year == today.year:
+            this_month += 1
+        # display_deadline_announcements
+        end_date = _legacy_date(r'~\s*(\d{8})', period_str)
+        days_left = (end_date - today).days if end_date else None
+        if '예산 소진시까지' in period_str or '상시' in period_str or (
+                days_left is not None and 0 <= days_left <= 7):
+            deadline += 1
+        # get_monthly_recommendations
+        for pattern in LEGACY_MONTH_PATTERNS:
+            match = re.search(pattern, period_str)
+            if match:
+                try:
+                    if match.lastindex and match.lastindex >= 2:
+                        monthly_counts[int(match.group(2))] += 1
+                    else:
+                        monthly_counts[datetime.strptime(match.group(1), '%Y%m%d').month] += 1
+                    break
+                except (KeyError, ValueError):
+                    continue
+    return active, urgent, this_month, deadline, monthly_counts
+
+
+def parser_rerun(strings, today):
+    active = urgent = this_month = deadline = 0
+    monthly_counts = {i: 0 for i in range(1, 13)}
+    for period_str in strings:
+        period = parse_period(period_str)
+        if period.rolling or (period.start and period.end and period.start <= today <= period.end):
+            active += 1
+    for period_str in strings:
+        period = parse_period(period_str)
+        if period.end and 0 <= (period.end - today).days <= 7:
+            urgent += 1
+        if period.start and period.start.month == today.month and period.start.year == today.year:
+            this_month += 1
+    for period_str in strings:
+        period = parse_period(period_str)
+        if period.rolling or (period.end and 0 <= (period.end - today).days <= 7):
+            deadline += 1
+    for period_str in strings:
+        month = parse_period(period_str).month
+        if month:
+            monthly_counts[month] += 1
+    return active, urgent, this_month, deadline, monthly_counts
+
+
+def measure(fn, repeat):
+    gc.collect()
+    seconds, result = _common.timed(fn, repeat)
+    return seconds, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    today = datetime.now().date()
+    # 서로 다른 문자열 수를 캐시 크기 안으로 유지 (공고 문자열은 회사 간에 반복됨)
+    unique = make_period_strings(min(args.rows, period_parser.PERIOD_CACHE_SIZE // 2))
+    strings = [unique[i % len(unique)] for i in range(args.rows)]
+    per_million = 1_000_000 / args.rows
+
+    legacy_seconds, expected = measure(lambda: legacy_rerun(strings, today), args.repeat)
+
+    def cold():
+        period_parser._parse.cache_clear()
+        return parser_rerun(strings, today)
+
+    cold_seconds, cold_result = measure(cold, args.repeat)
+    warm_seconds, warm_result = measure(lambda: parser_rerun(strings, today), args.repeat)
+
+    print(f"행 {args.rows:,}개 (고유 문자열 {len(unique):,}개), 화면 갱신 1회 = 호출부 4곳")
+    print(f"{'방식':<22}{'100만 행당':>12}{'배속':>8}")
+    print(f"{'호출부별 정규식':<22}{legacy_seconds * per_million:>11.2f}s{1:>7.1f}x")
+    print(f"{'parse_period (cold)':<22}{cold_seconds * per_million:>11.2f}s{legacy_seconds / cold_seconds:>7.1f}x")
+    print(f"{'parse_period (warm)':<22}{warm_seconds * per_million:>11.2f}s{legacy_seconds / warm_seconds:>7.1f}x")
+    print(f"캐시: {period_parser.cache_info()}")
+    same = expected == cold_result == warm_result
+    print(f"결과 일치: {same}")
+    if not same:
+        print(f"  기준: {expected}\n  파서: {warm_result}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""결과 캐시 크기 산정: 세션 수/캐시 크기별 적중률, 내보냄 횟수, 요청 수
+
+여러 세션이 회사 목록에서 Zipf 분포로 회사를 골라 화면을 갱신하는 상황을 스레드로 흉내 내고,
+캐시 없음과 여러 캐시 크기(MB)에서 Supabase 요청 수, 적중률, 내보냄 횟수, 평균 갱신 시간을 비교합니다.
+
+    python benchmarks/bench_result_cache.py [--sessions 200] [--sizes 0.25,1,4]
+"""
+import argparse
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import _common
+from postgrest_stub import PostgrestStub
+from validate_period_view import make_period_rows
+
+# 상위 디렉토리 모듈(supabase_client 등)은 함수 안에서 import함
+_common.setup_path()
+
+
+def simulate(module, stub, cache_mb, sessions, reruns, companies, workers, seed):
+    cache = module.ResultCache(max_bytes=int(cache_mb * 1024 * 1024)) if cache_mb else None
+    client = module.SupabaseClient(result_cache=cache)
+    weights = [1 / (rank + 1) for rank in range(len(companies))]
+
+    def session(index):
+        rng = random.Random(seed + index)
+        company = rng.choices(companies, weights)[0]
+        elapsed = 0.0
+        for _ in range(reruns):
+            started = time.perf_counter()
+            client.get_recommendations(company_name=company)
+            elapsed += time.perf_counter() - started
+        return elapsed / reruns
+
+    before = len(stub.requests)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        average = sum(pool.map(session, range(sessions))) / sessions
+    return len(stub.requests) - before, average, client.cache_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=200)
+    parser.add_argument('--reruns', type=int, default=5, help='세션당 화면 갱신 횟수')
+    parser.add_argument('--companies', type=int, default=100)
+    parser.add_argument('--rows', type=int, default=60, help='회사당 추천 공고 수')
+    parser.add_argument('--latency', type=float, default=0.02)
+    parser.add_argument('--workers', type=int, default=16)
+    parser.add_argument('--sizes', default='0.25,1,4', help='비교할 캐시 크기(MB) 목록')
+    args = parser.parse_args()
+
+    rows = make_period_rows(args.companies * args.rows, datetime.now().date())
+    for i, row in enumerate(rows):
+        row['기업명'] = f"회사{i % args.companies}"
+    companies = [f"회사{i}" for i in range(args.companies)]
+
+    import supabase_client as module
+
+    with PostgrestStub({'recommend_final': rows}, latency=args.latency) as stub:
+        module.SUPABASE_URL, module.SUPABASE_ANON_KEY = stub.url, 'stub-anon-key'
+        print(f"세션 {args.sessions}개 x 갱신 {args.reruns}회, 회사 {args.companies}곳 (Zipf), 요청 지연 {args.latency * 1000:.0f}ms")
+        print(f"{'캐시':>8}{'요청 수':>9}{'적중률':>8}{'내보냄':>8}{'항목':>6}{'사용 KB':>9}{'갱신(ms)':>10}")
+        for cache_mb in [0.0] + [float(size) for size in args.sizes.split(',')]:
+            requests, average, stats = simulate(module, stub, cache_mb, args.sessions, args.reruns,
+                                                companies, args.workers, seed=0)
+            if stats is None:
+                print(f"{'없음':>8}{requests:>9}{'-':>8}{'-':>8}{'-':>6}{'-':>9}{average * 1000:>10.1f}")
+            else:
+                print(f"{cache_mb:>6.2f}MB{requests:>9}{stats['hit_rate']:>8.1%}{stats['evictions']:>8}"
+                      f"{stats['entries']:>6}{stats['bytes'] / 1024:>9.1f}{average * 1000:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""app.py 화면 갱신 시간: 탭 데이터 미리 조회(TAB_PREFETCH_WORKERS) 켬/끔
+
+Streamlit AppTest로 app.py를 지연을 준 PostgREST 스텁에 붙여 실행하고, 첫 실행(회사 목록 로드 +
+기본 회사 추천 공고)과 재실행(로드맵 월 버튼 클릭)의 소요 시간을 세션 여러 개 중 가장 빠른 값으로 비교합니다.
+설정마다 캐시된 스레드 풀이 섞이지 않도록 별도 프로세스에서 실행합니다.
+
+    python benchmarks/bench_tab_prefetch.py [--latency 0.05] [--companies 5000]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import _common
+from postgrest_stub import PostgrestStub
+
+APP_PATH = os.path.join(_common.ROOT, 'app.py')
+
+
+def run_app(runs):
+    """AppTest로 app.py를 새 세션으로 runs번 실행하고, 가장 빠른 [첫 실행, 재실행] 소요 시간(초)을 JSON으로 출력합니다.
+
+    첫 세션은 import 비용을 제외하기 위한 예열용으로 버립니다.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    first_runs, reruns = [], []
+    for _ in range(runs + 1):
+        started = time.perf_counter()
+        app = AppTest.from_file(APP_PATH, default_timeout=120).run()
+        first_runs.append(time.perf_counter() - started)
+        button = next(button for button in app.button if button.label.startswith('3월'))
+        started = time.perf_counter()
+        button.click().run()
+        reruns.append(time.perf_counter() - started)
+        if app.exception:
+            raise RuntimeError(app.exception)
+    print(json.dumps([min(first_runs[1:]), min(reruns[1:])]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--latency', type=float, default=0.05, help='요청당 지연(초)')
+    parser.add_argument('--companies', type=int, default=5000)
+    parser.add_argument('--runs', type=int, default=3, help='설정마다 실행할 세션 수')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_app(args.runs)
+        return
+
+    companies = _common.make_company_records(args.companies)
+    companies[0]['기업명'] = '대박드림스'
+    recommendations = _common.make_wide_recommendations(300, extra_columns=0)
+    for row in recommendations:
+        row['기업명'] = '대박드림스'
+
+    with PostgrestStub({'alpha_companies_final': companies, 'recommend_final': recommendations},
+                       latency=args.latency) as stub:
+        print(f"요청 지연 {args.latency * 1000:.0f}ms, 회사 {args.companies:,}곳")
+        print(f"{'TAB_PREFETCH_WORKERS':<22}{'첫 실행(ms)':>12}{'재실행(ms)':>12}")
+        for workers in ('0', '1'):
+            env = dict(os.environ, SUPABASE_URL=stub.url, SUPABASE_ANON_KEY='stub-anon-key',
+                       TAB_PREFETCH_WORKERS=workers)
+            output = subprocess.run([sys.executable, __file__, '--child', '--runs', str(args.runs)],
+                                    env=env, check=True, capture_output=True, text=True).stdout
+            first_run, rerun = json.loads(output.strip().splitlines()[-1])
+            print(f"{workers:<22}{first_run * 1000:>12.0f}{rerun * 1000:>12.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""탭별 재실행 시간 회귀 검사 (AppTest + 메모리 백엔드, 기준값 비교)
+
+위젯을 바꿀 때마다 main() 전체가 다시 실행되므로, 탭 함수 하나가 느려지면 모든 상호작용이 느려집니다.
+synthetic_data.py로 만든 고정 데이터(같은 --seed면 같은 행)를 InMemoryBackend에 올리고, 탭 함수마다
+main()이 탭 직전에 하는 준비(회사 선택, 이번 실행의 CompanySnapshot)와 탭 함수만 그리는 AppTest 세션을 만들어 잽니다.
+  - cold: 새 세션의 첫 실행 (세션 상태 없음)
+  - warm: 같은 세션에서 위젯을 바꾸지 않은 재실행
+  - show_roadmap_tab의 click: display_roadmap의 월 버튼(--month)을 누른 재실행 (월별 상세 표)
+
+측정값은 반복한 중 가장 빠른 시간이며, 각 항목은 시간을 재기 전에 한 번 실행해 import/프로세스 캐시를 채웁니다.
+기준값 파일(benchmarks/baselines/tab_reruns.json)보다 --threshold배 넘게, 그리고 --slack-ms 넘게 느려진 항목을 표시하고,
+--check를 주면 그런 항목이 있을 때 종료 코드 1로 끝납니다. 기준값은 측정한 머신에서만 의미가 있습니다.
+
+    python benchmarks/bench_tab_reruns.py [--repeat 5] [--check]
+    python benchmarks/bench_tab_reruns.py --save-baseline     # 현재 측정값을 기준값으로 저장
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+import _common
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'tab_reruns.json')
+COMPANY = '대박드림스'
+TAB_FUNCTIONS = ('show_recommendation_tab', 'show_notification_tab', 'show_roadmap_tab')
+
+
+def tab_script(tab_function):
+    """AppTest로 실행할 스크립트: main()의 탭 직전 준비 + 탭 함수 하나"""
+    import streamlit as st
+
+    import app
+    from company_directory import get_company_directory
+    from company_snapshot import CompanySnapshot
+    from supabase_client import get_supabase_client
+
+    if 'selected_company' not in st.session_state:
+        directory = get_company_directory()
+        st.session_state.company_directory = directory
+        st.session_state.selected_company = directory.id_for_name(app.DEFAULT_COMPANY_NAME)
+    company = app.get_selected_company()
+    st.session_state.company_snapshot = CompanySnapshot.fetch(
+        get_supabase_client(), company['name'], previous=st.session_state.get('company_snapshot')
+    )
+    getattr(app, tab_function)()
+
+
+def install_backend(companies, recommendations, company_rows, seed):
+    """고정 합성 데이터를 올린 InMemoryBackend를 프로세스 공용 데이터 백엔드로 설정합니다."""
+    import supabase_client
+    from backends import InMemoryBackend
+    from synthetic_data import make_tables, table_rows
+
+    tables = make_tables(companies, recommendations, seed)
+    # 탭이 그리는 표가 충분히 크도록 앞쪽 추천 공고를 기본 회사의 공고로 바꿈
+    tables['recommend_final']['기업명'][:company_rows] = COMPANY
+    supabase_client._supabase_client = InMemoryBackend({name: table_rows(table) for name, table in tables.items()})
+
+
+def measure(tab_function, month, repeat):
+    """tab_function의 {변형: 가장 빠른 ms}"""
+    from streamlit.testing.v1 import AppTest
+
+    def run(action):
+        started = time.perf_counter()
+        app = action()
+        seconds = time.perf_counter() - started
+        if app.exception:
+            raise RuntimeError(f"{tab_function}: {app.exception}")
+        return seconds
+
+    best = {}
+    # 첫 반복은 import/프로세스 캐시를 채우므로 버림
+    for attempt in range(repeat + 1):
+        app = AppTest.from_function(tab_script, args=(tab_function,), default_timeout=120)
+        timings = {'cold': run(app.run), 'warm': run(app.run)}
+        if tab_function == 'show_roadmap_tab':
+            timings['click'] = run(app.button(key=f'month_{month}').click().run)
+        if attempt:
+            for variant, seconds in timings.items():
+                best[variant] = min(best.get(variant, float('inf')), seconds * 1000)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--companies', type=int, default=2000)
+    parser.add_argument('--recommendations', type=int, default=20000)
+    parser.add_argument('--company-rows', type=int, default=500, help=f'{COMPANY}의 추천 공고 행 수')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--month', type=int, default=datetime.now().month, help='로드맵에서 누를 월')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--only', default='', help='이름에 이 문자열이 들어간 탭만 실행')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true', help='측정값을 기준값 파일에 저장')
+    parser.add_argument('--threshold', type=float, default=1.5, help='기준값 대비 이 배수보다 느리면 느려짐으로 표시')
+    parser.add_argument('--slack-ms', type=float, default=30, help='기준값보다 이만큼(ms) 넘게 느릴 때만 느려짐으로 표시')
+    parser.add_argument('--check', action='store_true', help='느려진 항목이 있으면 종료 코드 1')
+    args = parser.parse_args()
+
+    install_backend(args.companies, args.recommendations, args.company_rows, args.seed)
+    baseline = _common.load_baseline(args.baseline)
+    results, regressions = {}, []
+    print(f"회사 {args.companies:,}곳, 추천 공고 {args.recommendations:,}행 ({COMPANY} {args.company_rows:,}행), "
+          f"반복 {args.repeat}회")
+    print(f"{'탭 함수':<28}{'실행':>8}{'시간(ms)':>12}{'기준(ms)':>12}{'비율':>8}")
+    for tab_function in TAB_FUNCTIONS:
+        if args.only not in tab_function:
+            continue
+        results[tab_function] = measure(tab_function, args.month, args.repeat)
+        for variant, ms in results[tab_function].items():
+            results[tab_function][variant] = ms = round(ms, 3)
+            expected = baseline.get(tab_function, {}).get(variant)
+            if expected:
+                ratio = ms / expected
+                mark = ''
+                if ratio > args.threshold and ms - expected > args.slack_ms:
+                    mark = '  ⚠️ 느려짐'
+                    regressions.append((tab_function, variant, ratio))
+                print(f"{tab_function:<28}{variant:>8}{ms:>12.1f}{expected:>12.1f}{ratio:>7.2f}x{mark}")
+            else:
+                print(f"{tab_function:<28}{variant:>8}{ms:>12.1f}{'-':>12}{'-':>8}")
+
+    if args.save_baseline:
+        _common.save_baseline(args.baseline, results)
+        print(f"💾 기준값 저장: {args.baseline}")
+    if regressions:
+        print(f"⚠️ 기준값보다 {args.threshold}배 넘게 느려진 항목 {len(regressions)}개: "
+              + ', '.join(f"{name}/{variant} ({ratio:.2f}x)" for name, variant, ratio in regressions))
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+"""동시 세션 부하 테스트: app.py AppTest 세션 N개를 동시에 실행 (처리량, 재실행 지연 분위수, 최대 RSS)
+
+synthetic_data.py로 만든 회사/추천 공고를 지연(--latency, --jitter)을 준 PostgREST 스텁에 올리고,
+세션 수마다 Streamlit AppTest 세션 N개를 동시에 돌립니다. 세션마다 다음 시나리오를 --iterations번 반복합니다.
+  1. 첫 실행 (회사 목록 + 기본 회사 추천 공고)
+  2. 사이드바 회사 검색 -> 검색 결과의 회사 선택
+  3. 맞춤 추천 탭 옵션 변경 ('활성 공고만')
+  4. 로드맵 월 버튼 --months개 클릭
+st.tabs는 모든 탭을 한 번에 그리고 탭 전환은 브라우저에서만 일어나므로, 탭 전환 대신 탭 안의 위젯을 조작합니다.
+
+AppTest는 실행마다 프로세스 전역 Runtime을 바꿔 끼우므로 한 프로세스에서 세션을 동시에 돌릴 수 없습니다.
+그래서 세션마다 작업 프로세스를 띄우고, 모두 예열(import, 회사 목록)을 마친 뒤 한꺼번에 시작시킵니다.
+스텁과 CPU는 세션끼리 나눠 쓰지만 GIL과 프로세스 공용 캐시는 나눠 쓰지 않으므로, 처리량은 한 Streamlit
+프로세스의 상한으로 보고 세션당 메모리는 예열 뒤 RSS 증가분(세션당 MB)으로 봅니다.
+
+세션 수마다 처리량(재실행/초), 재실행 지연 p50/p95/p99, 세션 프로세스 최대 RSS와 세션당 RSS 증가분을 출력합니다.
+
+    python benchmarks/load_test.py [--sessions 1,4,16,32] [--latency 0.05] [--iterations 3]
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+
+import _common
+from postgrest_stub import PostgrestStub
+
+APP_PATH = os.path.join(_common.ROOT, 'app.py')
+
+
+def percentile(values, q):
+    """values의 q 분위수 (최근접 순위)"""
+    ordered = sorted(values)
+    if not ordered:
+        return float('nan')
+    return ordered[min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))]
+
+
+def peak_rss_mb():
+    # 리눅스의 ru_maxrss 단위는 KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def scenario(rng, search_terms, months, timings):
+    """세션 하나의 시나리오. (동작, 소요 초)를 timings에 추가합니다."""
+    from streamlit.testing.v1 import AppTest
+
+    def timed(action, run):
+        started = time.perf_counter()
+        app = run()
+        timings.append((action, time.perf_counter() - started))
+        if app.exception:
+            raise RuntimeError(f"{action}: {app.exception}")
+        return app
+
+    app = timed('첫 실행', lambda: AppTest.from_file(APP_PATH, default_timeout=300).run())
+    timed('검색', lambda: app.sidebar.text_input[0].input(rng.choice(search_terms)).run())
+    selectbox = app.sidebar.selectbox[0]
+    if len(selectbox.options) > 1:
+        timed('회사 선택', lambda: selectbox.select_index(rng.randrange(1, len(selectbox.options))).run())
+    timed('추천 옵션', lambda: app.radio[0].set_value('활성 공고만').run())
+    for _ in range(months):
+        buttons = [button for button in app.button if button.label[:3].rstrip(' (').endswith('월')]
+        if not buttons:
+            break
+        timed('월 클릭', lambda: rng.choice(buttons).click().run())
+
+
+def run_session(iterations, months, search_terms, seed):
+    """세션 하나를 실행하고 결과를 JSON으로 출력합니다 (작업 프로세스).
+
+    예열을 마치면 'ready'를 출력하고, 부모가 stdin으로 시작 신호를 줄 때까지 기다립니다.
+    """
+    # 앱의 상태 출력(print)은 버리고, stdout은 부모에게 보내는 줄에만 사용
+    channel, sys.stdout = sys.stdout, open(os.devnull, 'w')
+    # 예열: import와 프로세스 공용 캐시(회사 목록 등)를 채운 뒤의 RSS를 기준으로 삼음
+    scenario(random.Random(seed), search_terms, 0, [])
+    baseline_rss = peak_rss_mb()
+    print('ready', file=channel, flush=True)
+    sys.stdin.readline()
+
+    rng = random.Random(seed)
+    timings, errors = [], []
+    try:
+        for _ in range(iterations):
+            scenario(rng, search_terms, months, timings)
+    except Exception as e:
+        errors.append(repr(e))
+    print(json.dumps({
+        'timings': timings,
+        'errors': errors,
+        'baseline_rss': baseline_rss,
+        'peak_rss': peak_rss_mb(),
+    }, ensure_ascii=False), file=channel, flush=True)
+
+
+def read_message(worker, prefix):
+    """작업 프로세스 출력에서 prefix로 시작하는 줄을 찾습니다 (import 중에 찍힌 상태 출력은 건너뜀)."""
+    for line in worker.stdout:
+        if line.startswith(prefix):
+            return line
+    raise RuntimeError(f"작업 프로세스가 응답 없이 끝났습니다 (종료 코드 {worker.wait()})")
+
+
+def run_sessions(sessions, command, env):
+    """작업 프로세스 sessions개를 예열시킨 뒤 동시에 시작하고 (결과 목록, 경과 초)를 돌려줍니다."""
+    workers = [subprocess.Popen(command + [f'--session={index + 1}'], env=env, text=True,
+                                stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+               for index in range(sessions)]
+    try:
+        for worker in workers:
+            read_message(worker, 'ready')
+        started = time.perf_counter()
+        for worker in workers:
+            worker.stdin.write('go\n')
+            worker.stdin.flush()
+        results = [json.loads(read_message(worker, '{')) for worker in workers]
+        return results, time.perf_counter() - started
+    finally:
+        for worker in workers:
+            if worker.poll() is None and not worker.stdin.closed:
+                worker.stdin.close()
+        for worker in workers:
+            try:
+                worker.wait(timeout=60)
+            except subprocess.TimeoutExpired:
+                worker.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', default='1,4,16,32', help='쉼표로 구분한 동시 세션 수')
+    parser.add_argument('--iterations', type=int, default=3, help='세션마다 반복할 시나리오 수')
+    parser.add_argument('--months', type=int, default=3, help='시나리오마다 누를 로드맵 월 버튼 수')
+    parser.add_argument('--latency', type=float, default=0.05, help='스텁 요청당 지연(초)')
+    parser.add_argument('--jitter', type=float, default=0.02, help='스텁 요청당 추가 지연 상한(초)')
+    parser.add_argument('--companies', type=int, default=2000)
+    parser.add_argument('--recommendations', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--session', type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    from synthetic_data import make_tables, table_rows
+
+    tables = {name: table_rows(table) for name, table in
+              make_tables(args.companies, args.recommendations, args.seed).items()}
+    # 검색어: 회사명 앞 두 글자 (검색 결과에서 회사를 고름)
+    search_terms = sorted({row['기업명'][:2] for row in tables['alpha_companies_final'][:200]})
+
+    if args.session:
+        run_session(args.iterations, args.months, search_terms, args.seed * 1000 + args.session)
+        return
+
+    with PostgrestStub(tables, latency=args.latency, jitter=args.jitter, seed=args.seed) as stub:
+        print(f"회사 {args.companies:,}곳, 추천 공고 {args.recommendations:,}행, 요청 지연 "
+              f"{args.latency * 1000:.0f}+{args.jitter * 1000:.0f}ms, 세션당 시나리오 {args.iterations}회")
+        print(f"{'세션':>6}{'재실행':>8}{'처리량(/s)':>12}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}"
+              f"{'최대 RSS(MB)':>14}{'세션당(MB)':>12}  오류")
+        env = dict(os.environ, SUPABASE_URL=stub.url, SUPABASE_ANON_KEY='stub-anon-key', DATA_BACKEND='supabase')
+        command = [sys.executable, os.path.abspath(__file__)] + [
+            f'--{name}={getattr(args, name)}' for name in
+            ('iterations', 'months', 'companies', 'recommendations', 'seed')]
+        for sessions in (int(value) for value in args.sessions.split(',')):
+            results, elapsed = run_sessions(sessions, command, env)
+            seconds = [value for result in results for _, value in result['timings']]
+            errors = [error for result in results for error in result['errors']]
+            peak_rss = max(result['peak_rss'] for result in results)
+            per_session = sum(result['peak_rss'] - result['baseline_rss'] for result in results) / sessions
+            print(f"{sessions:>6}{len(seconds):>8}{len(seconds) / elapsed:>12.1f}"
+                  f"{percentile(seconds, 50) * 1000:>10.0f}{percentile(seconds, 95) * 1000:>10.0f}"
+                  f"{percentile(seconds, 99) * 1000:>10.0f}{peak_rss:>14.0f}{per_session:>12.1f}"
+                  f"  {len(errors)}")
+            for error in errors[:3]:
+                print(f"    ⚠️ {error}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,314 @@
+"""로컬 PostgREST 호환 스텁 서버
+
+Supabase 없이 SupabaseClient를 검증하고 벤치마크하기 위한 최소한의 PostgREST 구현입니다.
+메모리에 올린 테이블에 대해 select, eq/neq/gt/gte/lt/lte/is/in 필터, or=(...) 조합,
+order, offset/limit, Prefer: count=exact(Content-Range), RPC 호출(POST 또는 읽기 전용 GET)을 지원하며 지연 시간과 오류 응답을 주입할 수 있습니다.
+
+사용 예:
+    stub = PostgrestStub({'recommend_final': rows}, latency=0.05)
+    stub.start()
+    os.environ['SUPABASE_URL'] = stub.url
+"""
+import gzip
+import inspect
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+
+def _split_top_level(text, sep=','):
+    """괄호와 큰따옴표 밖에 있는 구분자로만 문자열을 나눕니다."""
+    parts, depth, quoted, current = [], 0, False, ''
+    for char in text:
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char == '(':
+            depth += 1
+        elif not quoted and char == ')':
+            depth -= 1
+        if char == sep and depth == 0 and not quoted:
+            parts.append(current)
+            current = ''
+            continue
+        current += char
+    if current:
+        parts.append(current)
+    return parts
+
+
+def _unquote_name(name):
+    name = name.strip()
+    if len(name) >= 2 and name[0] == '"' and name[-1] == '"':
+        return name[1:-1]
+    return name
+
+
+def _coerce(value, sample):
+    """필터 값을 비교 대상 컬럼 값의 타입에 맞춥니다."""
+    if isinstance(sample, bool):
+        return value == 'true'
+    if isinstance(sample, (int, float)):
+        try:
+            return type(sample)(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _compare(row_value, operator, operand):
+    if operator == 'is':
+        if operand == 'null':
+            return row_value is None
+        return row_value is (operand == 'true')
+    if operator == 'in':
+        values = [_unquote_name(v) for v in _split_top_level(operand.strip('()'))]
+        return str(row_value) in values
+    if row_value is None:
+        return False
+    operand = _coerce(operand, row_value)
+    try:
+        if operator == 'eq':
+            return row_value == operand
+        if operator == 'neq':
+            return row_value != operand
+        if operator == 'gt':
+            return row_value > operand
+        if operator == 'gte':
+            return row_value >= operand
+        if operator == 'lt':
+            return row_value < operand
+        if operator == 'lte':
+            return row_value <= operand
+    except TypeError:
+        return False
+    raise ValueError(f"지원하지 않는 연산자: {operator}")
+
+
+def _build_predicate(column, expression):
+    """`col=op.value` 형태의 조건을 행 판별 함수로 바꿉니다."""
+    negate = False
+    if expression.startswith('not.'):
+        negate, expression = True, expression[4:]
+    operator, _, operand = expression.partition('.')
+    # or=(...) 안의 값은 예약 문자(., :, ,) 때문에 큰따옴표로 감쌀 수 있음
+    operand = _unquote_name(operand)
+
+    def predicate(row):
+        result = _compare(row.get(column), operator, operand)
+        return not result if negate else result
+    return predicate
+
+
+def _build_logical(kind, body):
+    """or=(a.eq.1,and(b.gte.2,c.lte.3)) 형태의 논리 조합을 판별 함수로 바꿉니다."""
+    predicates = []
+    for term in _split_top_level(body):
+        term = term.strip()
+        match = re.match(r'^(and|or)\((.*)\)$', term)
+        if match:
+            predicates.append(_build_logical(match.group(1), match.group(2)))
+            continue
+        column, _, expression = term.partition('.')
+        predicates.append(_build_predicate(_unquote_name(column), expression))
+    combine = any if kind == 'or' else all
+    return lambda row: combine(p(row) for p in predicates)
+
+
+def _order_key(value):
+    # NULL은 맨 뒤 (PostgreSQL 오름차순 기본값)
+    return (value is None, isinstance(value, str), '' if value is None else value)
+
+
+class UndefinedColumn(Exception):
+    """존재하지 않는 컬럼을 select 했을 때 PostgREST의 42703 오류를 흉내 냅니다."""
+
+
+class PostgrestStub:
+    """테이블과 RPC를 메모리에 들고 PostgREST처럼 응답하는 HTTP 서버"""
+
+    def __init__(self, tables=None, rpcs=None, latency=0.0, jitter=0.0,
+                 error_rate=0.0, error_status=503, max_rows=None, seed=0):
+        self.tables = tables or {}
+        self.rpcs = rpcs or {}
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.max_rows = max_rows
+        self.requests = []
+        # 응답 본문으로 보낸 누적 바이트 (압축 후 기준)
+        self.sent_bytes = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                stub._handle(self, 'GET')
+
+            def do_HEAD(self):
+                stub._handle(self, 'HEAD')
+
+            def do_POST(self):
+                stub._handle(self, 'POST')
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _delay(self):
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            fail = self.error_rate and self._random.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        return fail
+
+    def _handle(self, handler, method):
+        parts = urlsplit(handler.path)
+        path = unquote(parts.path)
+        params = parse_qsl(parts.query, keep_blank_values=True)
+        with self._lock:
+            self.requests.append((method, path, params))
+        length = int(handler.headers.get('Content-Length') or 0)
+        body = handler.rfile.read(length) if length else b''
+
+        if self._delay():
+            self._send(handler, self.error_status, {'message': 'injected failure', 'code': str(self.error_status),
+                                                    'hint': None, 'details': None})
+            return
+
+        try:
+            if path.startswith('/rest/v1/rpc/'):
+                name = path[len('/rest/v1/rpc/'):]
+                if name not in self.rpcs:
+                    self._send(handler, 404, {'message': f'function {name} not found', 'code': 'PGRST202',
+                                              'hint': None, 'details': None})
+                    return
+                function = self.rpcs[name]
+                if method == 'POST':
+                    args = json.loads(body) if body else {}
+                else:
+                    # GET/HEAD 호출(읽기 전용)은 함수 인자도 쿼리 파라미터로 옴
+                    names = inspect.signature(function).parameters
+                    args = {key: value for key, value in params if key in names}
+                    params = [(key, value) for key, value in params if key not in names]
+                result = function(**args)
+                self._send_rows(handler, method, result, params)
+                return
+            if not path.startswith('/rest/v1/'):
+                self._send(handler, 404, {'message': 'not found', 'code': '404', 'hint': None, 'details': None})
+                return
+            table = path[len('/rest/v1/'):]
+            if table not in self.tables:
+                self._send(handler, 404, {'message': f'relation {table} does not exist', 'code': '42P01',
+                                          'hint': None, 'details': None})
+                return
+            rows = self.tables[table]
+            if callable(rows):
+                rows = rows()
+            self._send_rows(handler, method, rows, params)
+        except UndefinedColumn as e:
+            self._send(handler, 400, {'message': f'column {e} does not exist', 'code': '42703',
+                                      'hint': None, 'details': None})
+        except Exception as e:
+            self._send(handler, 400, {'message': str(e), 'code': '400', 'hint': None, 'details': None})
+
+    def _send_rows(self, handler, method, rows, params):
+        result, total = self._select_rows(rows, params)
+        headers = {}
+        if total is not None and 'count=exact' in (handler.headers.get('Prefer') or ''):
+            headers['Content-Range'] = f'*/{total}'
+        self._send(handler, 200, result, head=(method == 'HEAD'), headers=headers)
+
+    def _select_rows(self, rows, params):
+        """(select/필터/정렬/범위를 적용한 행, 범위 적용 전 행 수). rows가 목록이 아니면 (rows, None)"""
+        columns, order, offset, limit = None, None, 0, None
+        predicates = []
+        for key, value in params:
+            if key == 'select':
+                if value.strip() != '*':
+                    columns = [_unquote_name(c) for c in _split_top_level(value)]
+            elif key == 'order':
+                order = value
+            elif key == 'offset':
+                offset = int(value)
+            elif key == 'limit':
+                limit = int(value)
+            elif key in ('or', 'and'):
+                predicates.append(_build_logical(key, value.strip()[1:-1]))
+            else:
+                predicates.append(_build_predicate(key, value))
+
+        if not isinstance(rows, list):
+            return rows, None
+        if rows:
+            referenced = list(columns or [])
+            if order:
+                referenced += [_unquote_name(term.partition('.')[0]) for term in order.split(',')]
+            missing = [c for c in referenced if c not in rows[0]]
+            if missing:
+                raise UndefinedColumn(missing[0])
+        result = [row for row in rows if all(p(row) for p in predicates)]
+        if order:
+            for term in reversed(order.split(',')):
+                column, _, direction = term.partition('.')
+                # 실제 컬럼은 타입이 하나지만 합성 행은 숫자/문자열이 섞일 수 있어 타입별로 모아 정렬
+                result.sort(key=lambda r, c=_unquote_name(column): _order_key(r.get(c)),
+                            reverse=direction.startswith('desc'))
+        total = len(result)
+        if self.max_rows is not None:
+            limit = self.max_rows if limit is None else min(limit, self.max_rows)
+        end = None if limit is None else offset + limit
+        result = result[offset:end]
+        if columns:
+            result = [{c: row.get(c) for c in columns} for row in result]
+        return result, total
+
+    def _send(self, handler, status, payload, head=False, headers=None):
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        headers = {'Content-Type': 'application/json; charset=utf-8', **(headers or {})}
+        if 'gzip' in (handler.headers.get('Accept-Encoding') or ''):
+            body = gzip.compress(body, compresslevel=5)
+            headers['Content-Encoding'] = 'gzip'
+        handler.send_response(status)
+        for key, value in headers.items():
+            handler.send_header(key, value)
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+        if not head:
+            with self._lock:
+                self.sent_bytes += len(body)
+            handler.wfile.write(body)
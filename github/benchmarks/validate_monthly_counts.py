@@ -0,0 +1,133 @@
+"""recommend_monthly_counts RPC와 get_monthly_recommendations 서버 집계 검증
+
+1. PostgREST 스텁: RPC를 스텁에 올리고 get_monthly_recommendations가 RPC 결과를 쓸 때와
+   클라이언트 집계로 돌아갔을 때 결과가 같은지, 응답 바이트가 얼마나 줄어드는지 확인합니다.
+2. Postgres: sql/recommend_final_periods.sql과 sql/recommend_monthly_counts.sql을 실제 Postgres에 적용하고,
+   roadmap_month와 회사별/전체 월별 집계가 period_parser의 월 분류와 같은지 확인합니다.
+   --dsn으로 psql 접속 문자열을 주거나, pgserver 패키지가 설치되어 있으면 임시 서버를 띄웁니다.
+
+    python benchmarks/validate_monthly_counts.py [--dsn postgresql://...]
+"""
+import argparse
+import csv
+import io
+import os
+import random
+import sys
+from collections import Counter
+from datetime import datetime
+
+import _common
+from period_parser import parse_period
+from postgrest_stub import PostgrestStub
+from validate_period_view import SQL_PATH as PERIODS_SQL_PATH, _psql_runner, load_recommend_final, make_period_rows
+
+SQL_PATH = os.path.join(_common.ROOT, 'sql', 'recommend_monthly_counts.sql')
+
+
+def make_month_rows(count, today, seed=0):
+    """기간 행에 월 분류 전용 형식(따옴표 날짜, 범위 밖 월, 패턴이 여럿 섞인 값)을 더한 추천 행"""
+    rng = random.Random(seed)
+    rows = make_period_rows(count, today, seed)
+    extra = [
+        lambda: f'"2025{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}"',
+        lambda: f"2025년 {rng.randint(0, 14)}월",
+        lambda: f"2025.{rng.randint(0, 14)}.{rng.randint(1, 28)}",
+        lambda: f"2025년 13월 ~ 2025.{rng.randint(1, 12)}.01",
+        lambda: f'"20251399" 2025{rng.randint(1, 12):02d}15 ~',
+        lambda: f"접수 {rng.randint(10000000, 99999999)}",
+        lambda: '2025',
+    ]
+    for row in rows[::3]:
+        row['사업 연도'] = rng.choice(extra)()
+    return rows
+
+
+def monthly_counts(rows, company_name=None):
+    """클라이언트(period_parser) 규칙으로 계산한 월별 공고 수"""
+    counts = Counter(parse_period(row['사업 연도']).month for row in rows
+                     if company_name is None or row['기업명'] == company_name)
+    return {month: counts.get(month, 0) for month in range(1, 13)}
+
+
+def validate_stub(rows):
+    import supabase_client as module
+
+    def rpc(company_name=None):
+        counts = monthly_counts(rows, company_name)
+        return [{'month': month, 'count': count} for month, count in counts.items() if count]
+
+    stub = PostgrestStub({'recommend_final': rows}, rpcs={module.MONTHLY_COUNTS_RPC: rpc}).start()
+    try:
+        module.SUPABASE_URL, module.SUPABASE_ANON_KEY = stub.url, 'stub-anon-key'
+        server = module.SupabaseClient()
+        local = module.SupabaseClient()
+        local._monthly_rpc_available = False
+
+        ok = True
+        for company in [None] + sorted({row['기업명'] for row in rows}):
+            sent = stub.sent_bytes
+            actual = server.get_monthly_recommendations(company_name=company)
+            rpc_bytes, sent = stub.sent_bytes - sent, stub.sent_bytes
+            expected = local.get_monthly_recommendations(company_name=company)
+            table_bytes = stub.sent_bytes - sent
+            same = actual == expected
+            ok &= same
+            if company in (None, '회사0') or not same:
+                print(f"  {company or '전체':<6} RPC {rpc_bytes:>7,}B  클라이언트 집계 {table_bytes:>9,}B  일치={same}")
+        return ok
+    finally:
+        stub.stop()
+
+
+def validate_postgres(rows, dsn):
+    psql = _psql_runner(dsn)
+    if psql is None:
+        print("  건너뜀: --dsn을 지정하거나 pgserver를 설치하세요.")
+        return True
+
+    load_recommend_final(psql, rows)
+    for path in (PERIODS_SQL_PATH, SQL_PATH):
+        with open(path, encoding='utf-8') as f:
+            psql(f.read())
+
+    output = psql('copy (select "사업명", public.roadmap_month("사업 연도") from public.recommend_final) '
+                  'to stdout with csv')
+    by_name = {row['사업명']: row for row in rows}
+    mismatches = 0
+    for name, month in csv.reader(io.StringIO(output)):
+        expected = parse_period(by_name[name]['사업 연도']).month
+        if (int(month) if month else None) != expected:
+            mismatches += 1
+            print(f"  불일치: {by_name[name]['사업 연도']!r} 서버={month or None} 클라이언트={expected}")
+
+    for company in [None] + sorted({row['기업명'] for row in rows}):
+        argument = 'null' if company is None else f"'{company}'"
+        output = psql(f'copy (select * from public.recommend_monthly_counts({argument})) to stdout with csv')
+        actual = {month: 0 for month in range(1, 13)}
+        for month, count in csv.reader(io.StringIO(output)):
+            actual[int(month)] = int(count)
+        if actual != monthly_counts(rows, company):
+            mismatches += 1
+            print(f"  집계 불일치: {company or '전체'} 서버={actual} 클라이언트={monthly_counts(rows, company)}")
+    print(f"  {len(rows)}행 월 분류 및 회사별 집계 비교, 불일치 {mismatches}건")
+    return mismatches == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--dsn', help='psql 접속 문자열 (없으면 pgserver 사용)')
+    args = parser.parse_args()
+
+    rows = make_month_rows(args.rows, datetime.now().date())
+    print("[PostgREST 스텁] RPC 집계 vs 클라이언트 집계")
+    stub_ok = validate_stub(rows)
+    print("[Postgres] roadmap_month / recommend_monthly_counts vs period_parser")
+    postgres_ok = validate_postgres(rows, args.dsn)
+    print("통과" if stub_ok and postgres_ok else "실패")
+    sys.exit(0 if stub_ok and postgres_ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+"""recommend_final_periods 뷰와 서버 측 활성/신규 공고 필터 검증
+
+1. PostgREST 스텁: 뷰를 스텁에 올리고 get_recommendations(is_active_only / is_new_announcements)의
+   서버 필터 결과가 기존 클라이언트 필터링 결과와 같은지, 전송 행 수가 얼마나 줄어드는지 확인합니다.
+2. Postgres: sql/recommend_final_periods.sql을 실제 Postgres에 적용하고, 뷰가 계산한
+   start_date/end_date/is_rolling이 클라이언트 파싱 규칙과 같은지 확인합니다.
+   --dsn으로 psql 접속 문자열을 주거나, pgserver 패키지가 설치되어 있으면 임시 서버를 띄웁니다.
+
+    python benchmarks/validate_period_view.py [--dsn postgresql://...]
+"""
+import argparse
+import csv
+import io
+import os
+import random
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+import _common
+from postgrest_stub import PostgrestStub
+from period_parser import parse_period
+
+SQL_PATH = os.path.join(_common.ROOT, 'sql', 'recommend_final_periods.sql')
+
+
+def parse_period_columns(period_str):
+    """클라이언트 파싱 규칙(period_parser)으로 (start_date, end_date, is_rolling)을 계산합니다."""
+    period = parse_period(period_str)
+    return period.start, period.end, period.rolling
+
+
+def make_period_rows(count, today, seed=0):
+    """오늘 기준으로 활성/신규/마감/상시/잘못된 형식이 섞인 추천 행을 만듭니다."""
+    rng = random.Random(seed)
+
+    def day(offset):
+        return (today + timedelta(days=offset)).strftime('%Y%m%d')
+
+    templates = [
+        lambda: f"{day(rng.randint(-60, 0))} ~ {day(rng.randint(0, 60))}",
+        lambda: f"{day(rng.randint(-10, 3))}~{day(rng.randint(-5, 30))}",
+        lambda: f"{day(rng.randint(-90, -30))} ~ {day(rng.randint(-29, -1))}",
+        lambda: '예산 소진시까지',
+        lambda: f"상시 모집 ({day(0)} ~ )",
+        lambda: f"{day(rng.randint(-7, 7))}",
+        lambda: '20250230 ~ 20251301',
+        lambda: '2025년 3월',
+        lambda: '2025.01.15',
+        lambda: '',
+        lambda: None,
+    ]
+    rows = []
+    for i in range(count):
+        rows.append({
+            '기업명': f"회사{i % 20}",
+            '사업명': f"공고 {i}",
+            '최종 점수': round(rng.uniform(30, 100), 2),
+            '지역': '서울특별시',
+            '사업 연도': rng.choice(templates)(),
+            '상세페이지 URL': f"https://example.com/{i}",
+        })
+    return rows
+
+
+def period_view(rows):
+    """sql/recommend_final_periods.sql 뷰와 같은 컬럼을 덧붙인 행 목록"""
+    view = []
+    for row in rows:
+        start_date, end_date, is_rolling = parse_period_columns(row['사업 연도'])
+        view.append(dict(row, start_date=start_date and start_date.isoformat(),
+                         end_date=end_date and end_date.isoformat(), is_rolling=is_rolling))
+    return view
+
+
+def validate_stub(rows):
+    import supabase_client as module
+
+    stub = PostgrestStub({'recommend_final': rows, module.PERIOD_VIEW: lambda: period_view(rows)}).start()
+    try:
+        module.SUPABASE_URL, module.SUPABASE_ANON_KEY = stub.url, 'stub-anon-key'
+        server = module.SupabaseClient()
+        local = module.SupabaseClient()
+        local._period_view_available = False
+
+        ok = True
+        for company in sorted({row['기업명'] for row in rows}):
+            total = len([row for row in rows if row['기업명'] == company])
+            for flags in ({'is_active_only': True}, {'is_new_announcements': True}):
+                expected = local.get_recommendations(company, **flags)
+                actual = server.get_recommendations(company, **flags)
+                strip = lambda items: sorted((item['사업명'] for item in items))
+                same = strip(expected) == strip(actual)
+                ok &= same
+                if company == '회사0' or not same:
+                    print(f"  {company} {list(flags)[0]:<22} 전체 {total}행 -> 전송 {len(actual)}행  일치={same}")
+        return ok
+    finally:
+        stub.stop()
+
+
+def _literal(value):
+    return 'NULL' if value is None else "'" + str(value).replace("'", "''") + "'"
+
+
+def _psql_runner(dsn):
+    if dsn:
+        return lambda sql: subprocess.run(['psql', dsn, '-v', 'ON_ERROR_STOP=1', '-q', '-A', '-c', sql],
+                                          check=True, capture_output=True, text=True).stdout
+    try:
+        import pgserver
+    except ImportError:
+        return None
+    server = pgserver.get_server(tempfile.mkdtemp(prefix='pgdata-'), cleanup_mode='delete')
+    return server.psql
+
+
+def load_recommend_final(psql, rows):
+    """recommend_final 테이블과 Supabase 역할(anon, authenticated)을 만들고 rows를 넣습니다."""
+    values = ',\n'.join(
+        f"({_literal(row['기업명'])}, {_literal(row['사업명'])}, {row['최종 점수']}, {_literal(row['지역'])}, "
+        f"{_literal(row['사업 연도'])}, {_literal(row['상세페이지 URL'])})"
+        for row in rows
+    )
+    psql("""
+        do $$ begin
+            if not exists (select from pg_roles where rolname = 'anon') then create role anon; end if;
+            if not exists (select from pg_roles where rolname = 'authenticated') then create role authenticated; end if;
+        end $$;
+        drop table if exists public.recommend_final cascade;
+        create table public.recommend_final (
+            "기업명" text, "사업명" text, "최종 점수" double precision,
+            "지역" text, "사업 연도" text, "상세페이지 URL" text
+        );
+    """)
+    psql(f'insert into public.recommend_final values {values};')
+
+
+def validate_postgres(rows, dsn):
+    psql = _psql_runner(dsn)
+    if psql is None:
+        print("  건너뜀: --dsn을 지정하거나 pgserver를 설치하세요.")
+        return True
+
+    load_recommend_final(psql, rows)
+    with open(SQL_PATH, encoding='utf-8') as f:
+        psql(f.read())
+    output = psql('copy (select "사업명", start_date, end_date, is_rolling from public.recommend_final_periods) '
+                  'to stdout with csv')
+
+    by_name = {row['사업명']: row for row in rows}
+    mismatches = 0
+    for name, start_date, end_date, is_rolling in csv.reader(io.StringIO(output)):
+        expected = parse_period_columns(by_name[name]['사업 연도'])
+        actual = (start_date or None, end_date or None, is_rolling == 't')
+        expected = (expected[0] and expected[0].isoformat(), expected[1] and expected[1].isoformat(), expected[2])
+        if actual != expected:
+            mismatches += 1
+            print(f"  불일치: {by_name[name]['사업 연도']!r} 뷰={actual} 클라이언트={expected}")
+    print(f"  {len(rows)}행 비교, 불일치 {mismatches}건")
+    return mismatches == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--dsn', help='psql 접속 문자열 (없으면 pgserver 사용)')
+    args = parser.parse_args()
+
+    rows = make_period_rows(args.rows, datetime.now().date())
+    print("[PostgREST 스텁] 서버 필터 vs 클라이언트 필터")
+    stub_ok = validate_stub(rows)
+    print("[Postgres] 뷰 파싱 vs 클라이언트 파싱")
+    postgres_ok = validate_postgres(rows, args.dsn)
+    print("통과" if stub_ok and postgres_ok else "실패")
+    sys.exit(0 if stub_ok and postgres_ok else 1)
+
+
+if __name__ == '__main__':
+    main()
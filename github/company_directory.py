@@ -0,0 +1,195 @@
+"""프로세스 전체가 함께 쓰는 회사 목록
+
+alpha_companies_final 전체를 세션마다 다시 내려받아 정규화하지 않도록, 정규화된 회사 목록을
+프로세스에 하나만 두고 모든 Streamlit 세션이 같은 객체를 참조합니다.
+  - CompanyDirectory: 읽기 전용 회사 목록 (회사는 읽기 전용 매핑, 목록 값은 튜플), 회사 id 레지스트리
+    (id -> 회사, 회사명 -> id 해시 색인)와 이름 검색 색인
+  - SharedCompanyDirectory: TTL이 지나면 새로 조회. 한 세션이 새로 조회하는 동안 다른 세션은
+    기존 목록을 그대로 사용하고, 처음 조회할 때만 조회가 끝날 때까지 기다립니다.
+
+    directory = get_company_directory()
+    company_id = directory.id_for_name('대박드림스')
+    print(directory.get(company_id)['name'])
+"""
+import os
+import threading
+import time
+from types import MappingProxyType
+
+from company_search import CompanySearchIndex
+from supabase_client import COMPANY_PAGE_SIZE, get_supabase_client
+
+# 회사 목록을 다시 조회하는 주기(초)
+COMPANY_DIRECTORY_TTL = float(os.environ.get("COMPANY_DIRECTORY_TTL") or 600)
+# 조회에 실패했을 때(빈 목록) 다시 시도하기까지의 시간(초)
+COMPANY_DIRECTORY_RETRY_TTL = 30.0
+
+# CompanyDirectory.status 값
+LOADED = 'loaded'  # Supabase에서 회사 목록을 가져옴
+EMPTY = 'empty'  # 조회는 성공했지만 회사가 없음 (또는 클라이언트가 초기화되지 않음)
+CONNECTION_FAILED = 'connection_failed'  # 첫 페이지부터 실패
+FAILED = 'failed'  # 조회 도중 실패
+SAMPLE = 'sample'  # Supabase 대신 샘플 회사 목록
+
+
+def company_id(name: str, occurrence: int = 1, row_id=None) -> str:
+    """회사 id. recommend_final이 기업명으로 회사를 구분하므로 회사명을 그대로 쓰고,
+    같은 이름의 회사가 여러 개면 두 번째부터 '#<원본 행 id>'(id 컬럼이 없으면 '#2', '#3'...)를 붙입니다."""
+    if occurrence == 1:
+        return name
+    return f"{name}#{occurrence if row_id is None else row_id}"
+
+
+def duplicate_order(company):
+    """같은 이름의 회사에 id를 붙이는 순서 (원본 행 id 순, id가 없으면 회사 정보 순).
+
+    조회 순서와 무관하므로 목록을 다시 조회해도 같은 회사가 같은 id를 받습니다.
+    """
+    row_id = company.get('row_id')
+    return (row_id is None, isinstance(row_id, str), '' if row_id is None else row_id, repr(sorted(company.items())))
+
+
+def freeze_company(company, company_key: str = None):
+    """회사 정보를 읽기 전용 매핑으로 바꿉니다. 목록 값은 튜플로 바꾸고, company_key가 있으면 'id'로 넣습니다."""
+    frozen = {
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in company.items()
+    }
+    if company_key is not None:
+        frozen['id'] = company_key
+    return MappingProxyType(frozen)
+
+
+class CompanyDirectory:
+    """정규화된 회사 목록 (읽기 전용)과 회사 id 레지스트리"""
+    __slots__ = ('companies', 'status', 'error', 'loaded_at', '_positions', '_ids_by_name', '_search_index', '_lock')
+
+    def __init__(self, companies, status: str = LOADED, error: str = None, loaded_at: float = None):
+        companies = list(companies)
+        groups = {}
+        for position, company in enumerate(companies):
+            groups.setdefault(company['name'], []).append(position)
+        keys, positions, ids_by_name = [None] * len(companies), {}, {}
+        for name, group in groups.items():
+            if len(group) > 1:
+                group = sorted(group, key=lambda position: duplicate_order(companies[position]))
+            for occurrence, position in enumerate(group, 1):
+                key = keys[position] = company_id(name, occurrence, companies[position].get('row_id'))
+                positions[key] = position
+            ids_by_name[name] = keys[group[0]]
+        self.companies = tuple(freeze_company(company, key) for company, key in zip(companies, keys))
+        self.status = status
+        self.error = error
+        self.loaded_at = time.monotonic() if loaded_at is None else loaded_at
+        # id -> 목록 위치, 회사명 -> id (같은 이름이 여러 개면 duplicate_order가 가장 앞인 회사)
+        self._positions = positions
+        self._ids_by_name = ids_by_name
+        self._search_index = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.companies)
+
+    def __iter__(self):
+        return iter(self.companies)
+
+    def __contains__(self, company_id):
+        return company_id in self._positions
+
+    def get(self, company_id: str):
+        """id로 회사를 찾습니다. 목록에 없으면 None입니다."""
+        position = self._positions.get(company_id)
+        return None if position is None else self.companies[position]
+
+    def id_for_name(self, name: str):
+        """회사명의 id. 같은 이름이 여러 개면 duplicate_order가 가장 앞인 회사의 id이고, 없으면 None입니다."""
+        return self._ids_by_name.get(name)
+
+    @property
+    def search_index(self):
+        """회사명 검색 색인 (처음 사용할 때 한 번 만들고 모든 세션이 함께 사용)"""
+        if self._search_index is None:
+            with self._lock:
+                if self._search_index is None:
+                    self._search_index = CompanySearchIndex(self.companies)
+        return self._search_index
+
+
+def load_company_directory(client=None, on_progress=None):
+    """Supabase에서 회사 목록 전체를 가져와 CompanyDirectory로 만듭니다.
+
+    on_progress는 페이지를 받을 때마다 지금까지 받은 회사 수로 호출됩니다.
+    오류가 나면 받은 회사를 버리고 빈 목록과 실패 상태를 돌려줍니다.
+    """
+    client = client or get_supabase_client()
+    companies = []
+    try:
+        for company in client.iter_companies():
+            companies.append(company)
+            if on_progress and len(companies) % COMPANY_PAGE_SIZE == 0:
+                on_progress(len(companies))
+    except Exception as e:
+        status = FAILED if companies else CONNECTION_FAILED
+        print(f"❌ 회사 목록 조회 실패 ({len(companies)}개 조회 후): {e}")
+        return CompanyDirectory([], status=status, error=str(e))
+    return CompanyDirectory(companies, status=LOADED if companies else EMPTY)
+
+
+class SharedCompanyDirectory:
+    """TTL이 지나면 새로 조회하는 프로세스 공용 CompanyDirectory"""
+
+    def __init__(self, loader=load_company_directory, ttl: float = COMPANY_DIRECTORY_TTL,
+                 retry_ttl: float = COMPANY_DIRECTORY_RETRY_TTL, clock=time.monotonic):
+        self._loader = loader
+        self._ttl = ttl
+        self._retry_ttl = retry_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._directory = None
+        self._expires_at = 0.0
+        # 실제로 조회한 횟수 (벤치마크/모니터링용)
+        self.loads = 0
+
+    def get(self, on_progress=None):
+        """현재 회사 목록을 돌려줍니다.
+
+        만료되었으면 새로 조회하되, 다른 세션이 이미 조회 중이면 기존 목록을 바로 돌려줍니다.
+        on_progress는 이 호출이 실제로 조회할 때만 load_company_directory에 전달됩니다.
+        """
+        directory = self._directory
+        if directory is not None and self._clock() < self._expires_at:
+            return directory
+        # 기존 목록이 있으면 기다리지 않음 (조회 중인 세션이 끝나면 새 목록으로 바뀜)
+        if not self._lock.acquire(blocking=directory is None):
+            return directory
+        try:
+            if self._directory is None or self._clock() >= self._expires_at:
+                directory = self._loader(on_progress=on_progress)
+                self.loads += 1
+                if directory.status == LOADED:
+                    self._expires_at = self._clock() + self._ttl
+                else:
+                    self._expires_at = self._clock() + self._retry_ttl
+                # 새로 조회하다 실패하면 이전에 받은 목록을 계속 사용
+                if directory.status == LOADED or self._directory is None or self._directory.status != LOADED:
+                    self._directory = directory
+            return self._directory
+        finally:
+            self._lock.release()
+
+    def invalidate(self):
+        """다음 get에서 새로 조회하도록 만료시킵니다. 기존 목록은 조회가 끝날 때까지 계속 사용됩니다."""
+        self._expires_at = 0.0
+
+
+_shared_directory = SharedCompanyDirectory()
+
+
+def get_company_directory(on_progress=None):
+    """프로세스 공용 회사 목록 (SharedCompanyDirectory.get)"""
+    return _shared_directory.get(on_progress)
+
+
+def invalidate_company_directory():
+    """프로세스 공용 회사 목록을 만료시킵니다 (SharedCompanyDirectory.invalidate)"""
+    _shared_directory.invalidate()
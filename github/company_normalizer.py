@@ -0,0 +1,158 @@
+"""회사 레코드 정규화 엔진
+
+alpha_companies_final 레코드를 앱의 company_list 형식으로 바꿉니다.
+  - normalize_company: 기존 get_companies의 행 단위 변환 그대로 (기준 구현, 바꾸지 않음)
+  - normalize_companies: 한 페이지를 컬럼 단위로 변환. '설립일', '고용', '업력', '기술특허', '기업인증' 규칙은
+    pd.factorize로 나눈 서로 다른 값마다 normalize_company로 한 번씩만 계산해 행 순서로 펼칩니다.
+
+normalize_companies는 기준 구현과 다음 두 가지가 다르며, 행 단위로는 normalize_company_record와 같습니다.
+  - 원본 행의 id를 row_id로 더함 (회사 선택 키, company_directory.py)
+  - NULL 값을 컬럼이 없을 때와 같은 기본값으로 봄. 기준 구현은 NULL 기업명/기업형태/업종/지역을 None으로 두고,
+    NULL 고용/기술특허/기업인증에서는 AttributeError가 나서 get_companies가 빈 목록을 돌려줬음
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+# 컬럼이 없거나 NULL일 때 쓰는 값 (기준 구현의 item.get 기본값)
+COLUMN_DEFAULTS = {
+    '기업명': '알 수 없음',
+    '기업형태': '법인사업자',
+    '업종': '기타',
+    '지역': '전국',
+    '고용': '0명',
+    '기술특허': '',
+    '기업인증': '',
+}
+
+# 그대로 옮기는 컬럼: 출력 키 -> 원본 컬럼
+PASSTHROUGH_COLUMNS = {
+    'name': '기업명',
+    'business_type': '기업형태',
+    'industry': '업종',
+    'region': '지역',
+}
+
+# 값마다 규칙을 적용하는 컬럼: 출력 키 -> 원본 컬럼
+DERIVED_COLUMNS = {
+    'founding_year': '설립일',
+    'employee_count': '고용',
+    'business_stage': '업력',
+    'technology_fields': '기술특허',
+    'certifications': '기업인증',
+}
+
+OUTPUT_KEYS = ('name', 'business_type', 'industry', 'region', 'founding_year',
+               'employee_count', 'business_stage', 'technology_fields', 'certifications', 'row_id')
+
+
+def normalize_company(item):
+    """회사 레코드 하나를 변환합니다 (기존 get_companies의 행 단위 변환, normalize_companies의 기준 구현)."""
+    # '설립일' 컬럼이 연도만 있는 경우 처리
+    founding_year = None
+    if '설립일' in item and item['설립일']:
+        try:
+            # '설립일'이 숫자만 있는 경우 (예: 4)
+            if str(item['설립일']).isdigit():
+                founding_year = int(item['설립일'])
+            # '설립일'이 'YYYY.MM.DD.' 형식인 경우 (예: 2020.01.01.)
+            elif re.match(r'^\d{4}\.\d{2}\.\d{2}\.$', item['설립일']):
+                founding_year = int(item['설립일'].split('.')[0])
+            # '설립일'이 'YYYY' 형식인 경우
+            elif re.match(r'^\d{4}$', item['설립일']):
+                founding_year = int(item['설립일'])
+        except ValueError:
+            pass # 변환 실패 시 None 유지
+
+    # '고용' 컬럼 처리 (예: '6명' -> '6-10명' 범위로 매핑)
+    employee_count_str = item.get('고용', '0명').replace('명', '').strip()
+    employee_count = '0명'
+    if employee_count_str.isdigit():
+        count = int(employee_count_str)
+        if count <= 5:
+            employee_count = '1-5명'
+        elif count <= 10:
+            employee_count = '6-10명'
+        elif count <= 50:
+            employee_count = '11-50명'
+        elif count <= 100:
+            employee_count = '51-100명'
+        elif count <= 300:
+            employee_count = '101-300명'
+        else:
+            employee_count = '300명 이상'
+
+    # '업력' 컬럼을 'business_stage'로 매핑
+    business_stage = '예비창업자'
+    if '업력' in item and item['업력']:
+        if '3년 미만' in item['업력'] or '초기' in item['업력']:
+            business_stage = '초기창업(3년 미만)'
+        elif '3-7년' in item['업력'] or '성장' in item['업력']:
+            business_stage = '성장기(3-7년)'
+        elif '7년 이상' in item['업력'] or '성숙' in item['업력']:
+            business_stage = '성숙기(7년 이상)'
+        elif '예비' in item['업력']:
+            business_stage = '예비창업자'
+
+    # '기술특허'와 '기업인증'을 리스트로 변환
+    technology_fields = [f.strip() for f in item.get('기술특허', '').split(',') if f.strip()]
+    certifications = [c.strip() for c in item.get('기업인증', '').split(',') if c.strip()]
+
+    return {
+        'name': item.get('기업명', '알 수 없음'),
+        'business_type': item.get('기업형태', '법인사업자'),
+        'industry': item.get('업종', '기타'),
+        'region': item.get('지역', '전국'),
+        'founding_year': founding_year,
+        'employee_count': employee_count,
+        'business_stage': business_stage,
+        'technology_fields': technology_fields,
+        'certifications': certifications
+    }
+
+
+def fill_defaults(item):
+    """NULL 값을 COLUMN_DEFAULTS로 채운 레코드 사본"""
+    return {column: COLUMN_DEFAULTS.get(column) if value is None else value for column, value in item.items()}
+
+
+def normalize_company_record(item):
+    """normalize_companies의 행 단위 결과: NULL을 기본값으로 채워 기준 구현으로 변환하고 row_id를 더합니다."""
+    company = normalize_company(fill_defaults(item))
+    company['row_id'] = item.get('id')
+    return company
+
+
+def _column(records, column):
+    """레코드 목록에서 한 컬럼의 값 목록을 뽑습니다. 컬럼이 없거나 NULL이면 COLUMN_DEFAULTS 값입니다."""
+    default = COLUMN_DEFAULTS.get(column)
+    return [default if (value := item.get(column)) is None else value for item in records]
+
+
+def _derived(records, key, column):
+    """column 값마다 기준 구현의 key 결과를 한 번씩 계산해 행 순서로 펼칩니다.
+
+    규칙 비용이 행 수가 아니라 서로 다른 값의 수에 비례합니다.
+    """
+    codes, uniques = pd.factorize(np.asarray(_column(records, column), dtype=object), use_na_sentinel=False)
+    # factorize는 None을 NaN으로 바꾸므로 되돌림
+    values = [normalize_company({column: None if value != value else value})[key] for value in uniques]
+    if key in ('technology_fields', 'certifications'):
+        # 같은 값의 행끼리 리스트 객체를 나눠 쓰지 않도록 행마다 복사
+        return [values[code].copy() for code in codes.tolist()]
+    return [values[code] for code in codes.tolist()]
+
+
+def normalize_companies(records):
+    """회사 레코드 목록을 컬럼 단위로 한 번에 변환합니다 (행마다 normalize_company_record와 같음)."""
+    if not records:
+        return []
+
+    columns = {key: _column(records, column) for key, column in PASSTHROUGH_COLUMNS.items()}
+    for key, column in DERIVED_COLUMNS.items():
+        columns[key] = _derived(records, key, column)
+    # 원본 행의 기본 키 (sql/mirror_sync_columns.sql, 없으면 None)
+    columns['row_id'] = [item.get('id') for item in records]
+
+    return [dict(zip(OUTPUT_KEYS, row)) for row in zip(*(columns[key] for key in OUTPUT_KEYS))]
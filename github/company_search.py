@@ -0,0 +1,290 @@
+"""회사명 검색 색인
+
+사이드바 검색어가 바뀔 때마다 회사 목록 전체를 훑지 않도록 회사 목록마다 한 번 색인을 만듭니다.
+  - 소문자 회사명과 드롭다운 표시 문자열(labels)을 미리 계산
+  - 접두어 검색: 정렬된 키에서 이진 탐색
+  - 부분 문자열 검색: 2-gram 포스팅 목록 중 가장 짧은 것의 후보만 확인 (한 글자 검색어는 키를 이어 붙인
+    문자열에서 str.find로 찾음)
+  - 초성 검색: 검색어가 모두 초성(ㄱ, ㄴ, ...)이면 회사명의 한글을 초성으로 바꾼 키에서 같은 방식으로 찾음
+    (예: 'ㄷㅂㄷㄹ' -> 대박드림스)
+  - 오타 허용 검색(fuzzy_search): 정규화한 회사명의 BK-tree에서 편집 거리 k 이내인 이름만 찾음
+    (예: '대박드림수' -> 대박드림스(주))
+
+    index = CompanySearchIndex(companies)
+    for i in index.search('ㄷㅂ', limit=20):
+        print(index.labels[i])
+    for i, distance in index.fuzzy_search('대박드림수'):
+        print(index.labels[i], distance)
+"""
+import re
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+
+# 한글 음절(가-힣)의 초성 19자 (호환용 자모)
+CHOSUNG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+CHOSUNG_SET = frozenset(CHOSUNG)
+HANGUL_FIRST, HANGUL_LAST = ord('가'), ord('힣')
+# 초성 하나가 차지하는 음절 수 (중성 21 x 종성 28)
+SYLLABLES_PER_CHOSUNG = 21 * 28
+# 오타 허용 검색에서 허용하는 최대 편집 거리
+FUZZY_MAX_DISTANCE = 2
+# 오타 허용 검색 전에 회사명에서 지우는 법인 표기와 공백
+LEGAL_FORM_PATTERN = re.compile(r'\(주\)|㈜|주식회사|\s+')
+
+
+def to_chosung(text: str) -> str:
+    """한글 음절을 초성으로 바꾸고 나머지 문자는 소문자로 바꿉니다. ('대박드림스 AI' -> 'ㄷㅂㄷㄹㅅ ai')"""
+    return ''.join(
+        CHOSUNG[(ord(char) - HANGUL_FIRST) // SYLLABLES_PER_CHOSUNG]
+        if HANGUL_FIRST <= ord(char) <= HANGUL_LAST else char
+        for char in text.lower()
+    )
+
+
+def is_chosung_query(query: str) -> bool:
+    """검색어가 초성으로만 이루어졌는지 (공백 제외)"""
+    chars = query.replace(' ', '')
+    return bool(chars) and all(char in CHOSUNG_SET for char in chars)
+
+
+def normalize_name(name: str) -> str:
+    """오타 허용 검색용 회사명 키: 소문자로 바꾸고 법인 표기('(주)', '주식회사')와 공백을 지웁니다."""
+    return LEGAL_FORM_PATTERN.sub('', name.lower())
+
+
+def default_fuzzy_distance(query: str) -> int:
+    """검색어 길이에 맞는 허용 편집 거리 (세 글자 이하는 1, 그보다 길면 FUZZY_MAX_DISTANCE)"""
+    return 1 if len(query) <= 3 else FUZZY_MAX_DISTANCE
+
+
+def _pattern_masks(pattern: str):
+    """Myers 비트 병렬 편집 거리용 문자별 위치 비트마스크"""
+    masks = {}
+    for position, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    return masks
+
+
+def _myers_distance(masks, length: int, text: str) -> int:
+    """pattern(문자별 비트마스크 masks, 길이 length)과 text의 레벤슈타인 거리 (Hyyrö의 비트 병렬 알고리즘)"""
+    if not length:
+        return len(text)
+    full = (1 << length) - 1
+    high = 1 << (length - 1)
+    vp, vn, score = full, 0, length
+    for char in text:
+        eq = masks.get(char, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = vn | ~(xh | vp)
+        hn = vp & xh
+        if hp & high:
+            score += 1
+        elif hn & high:
+            score -= 1
+        hp = (hp << 1) | 1
+        hn <<= 1
+        vp = (hn | ~(xv | hp)) & full
+        vn = hp & xv & full
+    return score
+
+
+def levenshtein(a: str, b: str) -> int:
+    """두 문자열의 레벤슈타인(삽입/삭제/치환) 거리"""
+    return _myers_distance(_pattern_masks(a), len(a), b)
+
+
+class BKTree:
+    """편집 거리 기반 BK-tree. 노드마다 [키, {거리: 자식 노드}]를 저장합니다.
+
+    삼각 부등식으로 질의와의 거리가 d인 노드의 자식 중 거리 d-k ~ d+k인 가지만 내려가므로
+    모든 키와 거리를 계산하지 않고 k 이내의 키를 찾습니다.
+    """
+
+    def __init__(self, keys=()):
+        self._root = None
+        self.size = 0
+        for key in keys:
+            self.add(key)
+
+    def add(self, key: str):
+        if self._root is None:
+            self._root = [key, {}]
+            self.size = 1
+            return
+        masks, length = _pattern_masks(key), len(key)
+        node = self._root
+        while True:
+            distance = _myers_distance(masks, length, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [key, {}]
+                self.size += 1
+                return
+            node = child
+
+    def search(self, query: str, k: int):
+        """query와 편집 거리 k 이내인 (거리, 키) 목록 (거리, 키 순으로 정렬). 거리를 계산한 노드 수도 돌려줍니다."""
+        if self._root is None:
+            return [], 0
+        masks, length = _pattern_masks(query), len(query)
+        found, visited, stack = [], 0, [self._root]
+        while stack:
+            key, children = stack.pop()
+            distance = _myers_distance(masks, length, key)
+            visited += 1
+            if distance <= k:
+                found.append((distance, key))
+            for child_distance in range(max(1, distance - k), distance + k + 1):
+                child = children.get(child_distance)
+                if child is not None:
+                    stack.append(child)
+        found.sort()
+        return found, visited
+
+
+def company_label(company) -> str:
+    """회사 선택 드롭다운 표시 문자열"""
+    return f"{company['name']} ({company['industry']}, {company['region']})"
+
+
+class _KeyIndex:
+    """문자열 키 목록의 접두어/부분 문자열 색인"""
+
+    def __init__(self, keys):
+        self.keys = keys
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._sorted_keys = [keys[i] for i in order]
+        self._sorted_ids = array('I', order)
+        # 한 글자 검색용: 키를 줄바꿈으로 이어 붙인 문자열과 각 키의 시작 위치
+        self._joined = '\n'.join(keys)
+        starts, position = array('Q'), 0
+        for key in keys:
+            starts.append(position)
+            position += len(key) + 1
+        self._starts = starts
+        # 2-gram -> 그 2-gram을 포함하는 키 번호 (오름차순)
+        postings = defaultdict(list)
+        for i, key in enumerate(keys):
+            for gram in {key[j:j + 2] for j in range(len(key) - 1)}:
+                postings[gram].append(i)
+        self._postings = {gram: array('I', ids) for gram, ids in postings.items()}
+
+    def prefix(self, query: str):
+        """query로 시작하는 키 번호 (키 정렬 순)"""
+        start = bisect_left(self._sorted_keys, query)
+        for position in range(start, len(self._sorted_keys)):
+            if not self._sorted_keys[position].startswith(query):
+                break
+            yield self._sorted_ids[position]
+
+    def substring(self, query: str):
+        """query를 포함하는 키 번호 (원래 순서)"""
+        if len(query) == 1:
+            yield from self._scan(query)
+            return
+        grams = {query[j:j + 2] for j in range(len(query) - 1)}
+        candidates = min((self._postings.get(gram, ()) for gram in grams), key=len)
+        if len(grams) == 1 and len(query) == 2:
+            yield from candidates
+            return
+        keys = self.keys
+        for i in candidates:
+            if query in keys[i]:
+                yield i
+
+    def _scan(self, char: str):
+        joined, starts = self._joined, self._starts
+        position = joined.find(char)
+        while position != -1:
+            i = bisect_right(starts, position) - 1
+            yield i
+            # 같은 키 안의 나머지 위치는 건너뜀
+            position = joined.find(char, starts[i] + len(self.keys[i]) + 1)
+
+
+class CompanySearchIndex:
+    """회사 목록의 이름 검색 색인 (목록은 바뀌지 않는다고 가정)"""
+
+    def __init__(self, companies):
+        self.companies = companies
+        self.labels = [company_label(company) for company in companies]
+        self._names = _KeyIndex([company['name'].lower() for company in companies])
+        # 초성 색인과 오타 허용 검색용 BK-tree는 처음 사용할 때 만듦
+        self._chosung = None
+        self._fuzzy = None
+        self._lazy_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.companies)
+
+    def _chosung_index(self):
+        if self._chosung is None:
+            with self._lazy_lock:
+                if self._chosung is None:
+                    self._chosung = _KeyIndex([to_chosung(key) for key in self._names.keys])
+        return self._chosung
+
+    def _fuzzy_index(self):
+        """(BK-tree, 정규화 키 -> 회사 번호 목록)"""
+        if self._fuzzy is None:
+            with self._lazy_lock:
+                if self._fuzzy is None:
+                    ids_by_key = {}
+                    for i, company in enumerate(self.companies):
+                        ids_by_key.setdefault(normalize_name(company['name']), []).append(i)
+                    self._fuzzy = (BKTree(ids_by_key), ids_by_key)
+        return self._fuzzy
+
+    def search(self, query: str, limit: int = None):
+        """검색어가 회사명에 포함된 회사의 번호 목록
+
+        회사명이 검색어로 시작하는 회사를 먼저(이름 순), 그다음 나머지 포함 회사를 목록 순서대로 돌려줍니다.
+        검색어는 다듬지 않고 그대로 찾으므로 공백(' ')도 공백이 든 회사명과 맞습니다.
+        검색어가 모두 초성이면 앞뒤 공백을 떼고 회사명의 초성과 비교합니다. limit개를 찾으면 멈춥니다.
+        """
+        query = query.lower()
+        if not query or limit == 0:
+            return []
+        if is_chosung_query(query):
+            query, index = query.strip(), self._chosung_index()
+        else:
+            index = self._names
+        results, seen = [], set()
+        for i in index.prefix(query):
+            results.append(i)
+            seen.add(i)
+            if len(results) == limit:
+                return results
+        for i in index.substring(query):
+            if i not in seen:
+                results.append(i)
+                if len(results) == limit:
+                    break
+        return results
+
+    def matches(self, query: str, limit: int = None):
+        """search 결과를 회사 목록으로 돌려줍니다."""
+        return [self.companies[i] for i in self.search(query, limit)]
+
+    def fuzzy_search(self, query: str, k: int = None, limit: int = None):
+        """정규화한 회사명과 편집 거리 k 이내인 회사의 (번호, 거리) 목록 (거리가 가까운 순)
+
+        k를 지정하지 않으면 검색어 길이에 따라 default_fuzzy_distance로 정합니다.
+        """
+        key = normalize_name(query)
+        if not key or limit == 0:
+            return []
+        tree, ids_by_key = self._fuzzy_index()
+        found, _ = tree.search(key, default_fuzzy_distance(key) if k is None else k)
+        results = []
+        for distance, name in found:
+            for i in ids_by_key[name]:
+                results.append((i, distance))
+                if len(results) == limit:
+                    return results
+        return results
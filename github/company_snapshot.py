@@ -0,0 +1,111 @@
+"""회사별 추천 공고 스냅샷
+
+화면 한 번을 그릴 때 맞춤 추천/알림/로드맵 탭이 같은 회사의 recommend_final 행을 여러 번 조회하던 것을
+한 번의 조회로 줄입니다. 조회한 행의 '사업 연도'는 생성 시 한 번 해석해 두고,
+전체/활성/신규/마감 임박/이번 달/월별 목록은 모두 이 행들에서 로컬로 계산합니다.
+로드맵 월별 상세는 생성 시 만든 월 -> 행 위치 색인에서 바로 잘라 오므로 월 버튼을 눌러도 다시 파싱하지 않습니다.
+
+세션은 스냅샷을 st.session_state에 두고, 결과 캐시(SUPABASE_RESULT_CACHE_MB)를 켰으면 같은 회사와
+같은 데이터 버전(클라이언트의 data_version)의 스냅샷을 결과 캐시의 recommend_final TTL 동안 재사용합니다.
+다시 조회해도 캐시에서 같은 행을 받을 기간이므로 결과는 같습니다. 결과 캐시를 끄면 실행마다 새로 조회합니다.
+"""
+import time
+from datetime import datetime
+
+from period_parser import parse_period
+from supabase_client import NEW_ANNOUNCEMENT_DAYS, format_detail_records
+
+# 종료일까지 이 일수 이내면 마감 임박 공고
+URGENT_DAYS = 7
+
+
+class CompanySnapshot:
+    """한 회사의 추천 공고 전체와 그로부터 계산한 화면별 목록"""
+
+    def __init__(self, company_name, records, today=None, data_version=None):
+        self.company_name = company_name
+        # 조회할 때의 클라이언트 데이터 버전과 시각 (fetch가 재사용 여부를 판단하는 데 사용)
+        self.data_version = data_version
+        self.fetched_at = time.monotonic()
+        self.records = list(records or [])
+        self.today = today or datetime.now().date()
+        self._periods = [parse_period(item.get('사업 연도')) for item in self.records]
+        # 로드맵 월 -> 해당 월 행 위치 목록 (1~12월, 월을 알 수 없는 행은 제외)
+        self._month_index = {month: [] for month in range(1, 13)}
+        for position, period in enumerate(self._periods):
+            if period.month:
+                self._month_index[period.month].append(position)
+        self._month_details = {}
+
+    @classmethod
+    def fetch(cls, client, company_name, previous=None):
+        """회사의 추천 공고를 한 번 조회해 스냅샷을 만듭니다. 회사가 없으면 빈 스냅샷입니다.
+
+        previous(세션에 둔 이전 스냅샷)가 같은 회사, 같은 날짜, 같은 데이터 버전이고
+        클라이언트 결과 캐시의 recommend_final TTL이 지나지 않았으면 조회하지 않고 previous를 그대로 돌려줍니다.
+        결과 캐시가 없는 클라이언트는 TTL이 0이므로 항상 새로 조회합니다.
+        """
+        if not company_name:
+            return cls(None, [])
+        data_version = getattr(client, 'data_version', None)
+        cache_ttl = client.cache_ttl('recommend_final') if hasattr(client, 'cache_ttl') else 0
+        if (previous is not None and previous.company_name == company_name
+                and previous.data_version == data_version and previous.today == datetime.now().date()
+                and time.monotonic() - previous.fetched_at < cache_ttl):
+            return previous
+        records = client.get_recommendations(company_name=company_name)
+        return cls(company_name, records, data_version=data_version)
+
+    def _where(self, condition):
+        return [item for item, period in zip(self.records, self._periods) if condition(period)]
+
+    def _days_left(self, period):
+        return (period.end - self.today).days if period.end else None
+
+    @property
+    def active(self):
+        """상시 공고이거나 오늘이 신청 기간 안에 있는 공고"""
+        today = self.today
+        return self._where(lambda p: p.rolling or (p.start and p.end and p.start <= today <= p.end))
+
+    @property
+    def new(self):
+        """시작일이 NEW_ANNOUNCEMENT_DAYS일 이내인 신규 공고"""
+        return self._where(lambda p: p.start and (self.today - p.start).days <= NEW_ANNOUNCEMENT_DAYS)
+
+    @property
+    def urgent(self):
+        """종료일까지 URGENT_DAYS일 이내인 공고"""
+        return self._where(lambda p: p.end and 0 <= self._days_left(p) <= URGENT_DAYS)
+
+    @property
+    def deadline(self):
+        """마감 임박 표에 보여줄 (공고, 남은 일수) 목록. 상시 공고는 남은 일수가 None입니다."""
+        result = []
+        for item, period in zip(self.records, self._periods):
+            if not item.get('사업 연도'):
+                continue
+            days_left = self._days_left(period)
+            if period.rolling:
+                result.append((item, None))
+            elif days_left is not None and 0 <= days_left <= URGENT_DAYS:
+                result.append((item, days_left))
+        return result
+
+    @property
+    def this_month(self):
+        """시작일이 이번 달인 공고"""
+        today = self.today
+        return self._where(lambda p: p.start and p.start.month == today.month and p.start.year == today.year)
+
+    @property
+    def monthly_counts(self):
+        """로드맵 월별 공고 수 (get_monthly_recommendations와 같은 형식)"""
+        return {month: len(positions) for month, positions in self._month_index.items()}
+
+    def month_details(self, month):
+        """로드맵 월별 상세 공고 (get_monthly_details와 같은 형식). 월마다 한 번만 만들어 보관합니다."""
+        if month not in self._month_details:
+            positions = self._month_index.get(month, [])
+            self._month_details[month] = format_detail_records([self.records[i] for i in positions])
+        return self._month_details[month]
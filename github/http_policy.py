@@ -0,0 +1,207 @@
+"""Supabase HTTP 연결 정책
+
+SupabaseClient / AsyncSupabaseClient가 create_client에 넘기는 httpx 클라이언트를 만듭니다.
+  - 연결 풀: 최대 연결 수와 keep-alive 연결 수/유지 시간
+  - 타임아웃: 연결(connect)과 읽기(read)를 따로 지정
+  - 압축: gzip (brotli 패키지가 설치되어 있으면 br도) 응답 요청
+  - 재시도: 일시적 오류(429, 5xx, 연결/읽기 실패)를 지터가 들어간 지수 백오프로 재시도하되,
+    첫 시도부터 deadline 초가 지나면 더 이상 재시도하지 않음. 서버의 Retry-After는 그대로 따르고,
+    남은 시간보다 길면 포기. 각 시도의 타임아웃도 deadline까지 남은 시간으로 줄임
+
+재시도는 전송(transport) 계층에서 처리하므로 모든 조회에 똑같이 적용됩니다.
+읽기 전용 요청(GET/HEAD)만 재시도합니다. 월별 집계 RPC는 GET으로 호출합니다.
+"""
+import asyncio
+import os
+import random
+import time
+from typing import NamedTuple
+
+import httpx
+
+from metrics import acount_response_bytes, count_response_bytes
+
+# 재시도할 HTTP 상태 코드 (요청 과다, 게이트웨이/서버 일시 오류, Cloudflare 520)
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504, 520})
+# 재시도할 전송 오류 (연결 실패, 타임아웃, 연결이 중간에 끊김)
+RETRYABLE_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+RETRYABLE_METHODS = frozenset({'GET', 'HEAD'})
+
+
+class HttpPolicy(NamedTuple):
+    """연결 풀/타임아웃/재시도 설정"""
+    pool_size: int = 20  # 최대 동시 연결 수
+    keepalive_connections: int = 10  # 유지할 유휴 연결 수
+    keepalive_expiry: float = 30.0  # 유휴 연결 유지 시간(초)
+    connect_timeout: float = 3.0
+    read_timeout: float = 15.0
+    max_attempts: int = 4  # 첫 시도를 포함한 최대 시도 횟수 (1이면 재시도하지 않음)
+    backoff_base: float = 0.2  # n번째 재시도 대기 상한 = backoff_base * 2^(n-1)
+    backoff_cap: float = 2.0  # 재시도 한 번의 최대 백오프 대기(초, Retry-After는 제한하지 않음)
+    deadline: float = 20.0  # 첫 시도부터 이 시간(초) 안에 모든 시도와 대기를 끝냄
+
+    @classmethod
+    def from_env(cls):
+        """SUPABASE_POOL_SIZE, SUPABASE_CONNECT_TIMEOUT, SUPABASE_READ_TIMEOUT,
+        SUPABASE_RETRY_ATTEMPTS, SUPABASE_RETRY_DEADLINE 환경변수로 기본값을 덮어씁니다."""
+        default = cls()
+        env = os.environ.get
+        pool_size = int(env('SUPABASE_POOL_SIZE') or default.pool_size)
+        return cls(
+            pool_size=pool_size,
+            keepalive_connections=min(pool_size, default.keepalive_connections),
+            connect_timeout=float(env('SUPABASE_CONNECT_TIMEOUT') or default.connect_timeout),
+            read_timeout=float(env('SUPABASE_READ_TIMEOUT') or default.read_timeout),
+            max_attempts=int(env('SUPABASE_RETRY_ATTEMPTS') or default.max_attempts),
+            deadline=float(env('SUPABASE_RETRY_DEADLINE') or default.deadline),
+        )
+
+    @property
+    def limits(self):
+        return httpx.Limits(max_connections=self.pool_size,
+                            max_keepalive_connections=self.keepalive_connections,
+                            keepalive_expiry=self.keepalive_expiry)
+
+    @property
+    def timeout(self):
+        return httpx.Timeout(self.read_timeout, connect=self.connect_timeout)
+
+
+def accept_encoding():
+    """httpx가 풀 수 있는 압축 방식. br은 brotli(또는 brotlicffi)가 설치된 경우에만 요청합니다."""
+    for module in ('brotli', 'brotlicffi'):
+        try:
+            __import__(module)
+            return 'br, gzip'
+        except ImportError:
+            continue
+    return 'gzip'
+
+
+def retry_delay(attempt: int, policy: HttpPolicy, response: httpx.Response = None, rng=random):
+    """attempt번째 재시도 전 대기 시간(초). 0~상한 사이 균등 지터를 쓰고, Retry-After(초)가 있으면 그대로 따릅니다.
+
+    Retry-After가 deadline까지 남은 시간보다 길면 _RetryState가 재시도를 포기합니다.
+    """
+    if response is not None:
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.replace('.', '', 1).isdigit():
+            return float(retry_after)
+    return rng.uniform(0, min(policy.backoff_cap, policy.backoff_base * 2 ** (attempt - 1)))
+
+
+class _RetryState:
+    """요청 하나의 재시도 판단 (시도 횟수, deadline)과 시도별 타임아웃"""
+
+    def __init__(self, policy: HttpPolicy, request: httpx.Request, clock):
+        self.policy = policy
+        self.request = request
+        self.clock = clock
+        self.attempt = 0
+        self.deadline = clock() + policy.deadline
+        self.enabled = request.method in RETRYABLE_METHODS and policy.max_attempts > 1
+        # 클라이언트가 정한 타임아웃 (connect/read/write/pool, None은 제한 없음)
+        self.timeout = dict(request.extensions.get('timeout') or {})
+
+    def start_attempt(self):
+        """이번 시도의 타임아웃을 deadline까지 남은 시간으로 줄여 요청에 넣습니다."""
+        remaining = max(self.deadline - self.clock(), 0.0)
+        timeout = {key: remaining if value is None else min(value, remaining) for key, value in self.timeout.items()}
+        self.request.extensions = {**self.request.extensions, 'timeout': timeout}
+
+    def next_delay(self, response=None):
+        """재시도하면 대기 시간을, 포기하면 None을 돌려줍니다."""
+        self.attempt += 1
+        if not self.enabled or self.attempt >= self.policy.max_attempts:
+            return None
+        delay = retry_delay(self.attempt, self.policy, response)
+        if self.clock() + delay >= self.deadline:
+            return None
+        return delay
+
+
+class RetryTransport(httpx.BaseTransport):
+    """일시적 오류를 HttpPolicy에 따라 재시도하는 동기 전송 계층"""
+
+    def __init__(self, policy: HttpPolicy, transport: httpx.BaseTransport = None, sleep=time.sleep,
+                 clock=time.monotonic):
+        self.policy = policy
+        self._transport = transport or httpx.HTTPTransport(limits=policy.limits)
+        self._sleep = sleep
+        self._clock = clock
+        # 재시도한 횟수 (벤치마크/모니터링용)
+        self.retries = 0
+
+    def handle_request(self, request):
+        state = _RetryState(self.policy, request, self._clock)
+        while True:
+            state.start_attempt()
+            try:
+                response = self._transport.handle_request(request)
+            except RETRYABLE_ERRORS:
+                delay = state.next_delay()
+                if delay is None:
+                    raise
+            else:
+                if response.status_code not in RETRYABLE_STATUSES:
+                    return response
+                delay = state.next_delay(response)
+                if delay is None:
+                    return response
+                response.close()
+            self.retries += 1
+            self._sleep(delay)
+
+    def close(self):
+        self._transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """RetryTransport의 비동기 버전"""
+
+    def __init__(self, policy: HttpPolicy, transport: httpx.AsyncBaseTransport = None, sleep=asyncio.sleep,
+                 clock=time.monotonic):
+        self.policy = policy
+        self._transport = transport or httpx.AsyncHTTPTransport(limits=policy.limits)
+        self._sleep = sleep
+        self._clock = clock
+        self.retries = 0
+
+    async def handle_async_request(self, request):
+        state = _RetryState(self.policy, request, self._clock)
+        while True:
+            state.start_attempt()
+            try:
+                response = await self._transport.handle_async_request(request)
+            except RETRYABLE_ERRORS:
+                delay = state.next_delay()
+                if delay is None:
+                    raise
+            else:
+                if response.status_code not in RETRYABLE_STATUSES:
+                    return response
+                delay = state.next_delay(response)
+                if delay is None:
+                    return response
+                await response.aclose()
+            self.retries += 1
+            await self._sleep(delay)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+def build_http_client(policy: HttpPolicy = None):
+    """정책을 적용한 httpx.Client (supabase ClientOptions의 httpx_client로 전달)"""
+    policy = policy or HttpPolicy.from_env()
+    return httpx.Client(transport=RetryTransport(policy), timeout=policy.timeout,
+                        headers={'Accept-Encoding': accept_encoding()}, follow_redirects=True,
+                        event_hooks={'response': [count_response_bytes]})
+
+
+def build_async_http_client(policy: HttpPolicy = None):
+    """정책을 적용한 httpx.AsyncClient (supabase AsyncClientOptions의 httpx_client로 전달)"""
+    policy = policy or HttpPolicy.from_env()
+    return httpx.AsyncClient(transport=AsyncRetryTransport(policy), timeout=policy.timeout,
+                             headers={'Accept-Encoding': accept_encoding()}, follow_redirects=True,
+                             event_hooks={'response': [acount_response_bytes]})
@@ -0,0 +1,283 @@
+"""Supabase 테이블의 로컬 SQLite 미러
+
+Supabase가 느리거나 불안정해도 앱이 같은 속도로 동작하도록 alpha_companies_final과 recommend_final을
+로컬 SQLite 파일로 복사하고, DATA_BACKEND=sqlite이면 get_supabase_client()가 MirrorClient를 돌려줍니다.
+
+동기화
+  - 처음(또는 --full)에는 테이블 전체를 (updated_at, id) 순으로 받아 미러 테이블을 통째로 바꿉니다.
+  - 이후에는 마지막으로 받은 (updated_at, id) 다음 행만 받아 덮어씁니다(upsert).
+    늦게 커밋된 행을 놓치지 않도록 마지막 updated_at보다 SYNC_OVERLAP초 앞에서부터 다시 받습니다.
+  - 테이블에 updated_at/id 컬럼이 없으면(sql/mirror_sync_columns.sql 미적용) 매번 전체를 복사합니다.
+  - 증분 동기화는 삭제된 행을 알 수 없으므로, 삭제를 반영하려면 주기적으로 --full을 실행합니다.
+
+    python local_mirror.py            # 증분 동기화 (처음이면 전체)
+    python local_mirror.py --full     # 전체 동기화
+    DATA_BACKEND=sqlite streamlit run app.py
+"""
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+from postgrest.exceptions import APIError
+
+from backends import StoreBackend
+from supabase_client import COMPANY_PAGE_SIZE, SupabaseClient
+
+# 미러 파일 경로
+MIRROR_PATH = os.environ.get("SUPABASE_MIRROR_PATH") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'supabase_mirror.sqlite3')
+# 동기화할 때 한 번에 받는 행 수
+SYNC_PAGE_SIZE = COMPANY_PAGE_SIZE
+# 증분 동기화를 마지막 updated_at보다 이만큼(초) 앞에서 시작
+SYNC_OVERLAP = 300
+
+
+class MirrorTable(NamedTuple):
+    """미러링할 테이블 설정"""
+    name: str
+    key: str = 'id'  # 기본 키 컬럼
+    watermark: str = 'updated_at'  # 행이 바뀔 때 갱신되는 시각 컬럼
+    company_column: str = '기업명'  # 미러에서 색인해 둘 회사명 컬럼
+
+
+MIRROR_TABLES = (
+    MirrorTable('alpha_companies_final'),
+    MirrorTable('recommend_final'),
+)
+
+# 동기화 방식 (mirror_state.mode)
+FULL, INCREMENTAL, COPY = 'full', 'incremental', 'copy'
+
+
+class SyncResult(NamedTuple):
+    table: str
+    mode: str  # full / incremental / copy (watermark 컬럼이 없어 전체 복사)
+    rows: int  # 이번에 받은 행 수
+    total: int  # 동기화 후 미러의 행 수
+    seconds: float
+
+
+def _shift(watermark, seconds):
+    """ISO 형식 시각 문자열을 seconds초 앞당깁니다. 시각으로 읽을 수 없으면 그대로 돌려줍니다."""
+    try:
+        return (datetime.fromisoformat(str(watermark)) - timedelta(seconds=seconds)).isoformat()
+    except ValueError:
+        return watermark
+
+
+class LocalMirror:
+    """미러 SQLite 파일. 스레드마다 연결을 따로 열고, WAL 모드라 동기화 중에도 읽을 수 있습니다."""
+
+    def __init__(self, path: str = MIRROR_PATH, tables=MIRROR_TABLES):
+        self.path = path
+        self.tables = {table.name: table for table in tables}
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS mirror_state (table_name TEXT PRIMARY KEY, mode TEXT, '
+                         'watermark, key, rows INTEGER, synced_at TEXT)')
+            for table in tables:
+                self._create_table(conn, table.name)
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path)
+            conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    @staticmethod
+    def _create_table(conn, name):
+        # key는 원본 기본 키(없으면 복사 순번), data는 원본 행 전체(JSON)
+        conn.execute(f'CREATE TABLE IF NOT EXISTS "{name}" (key PRIMARY KEY, watermark, company TEXT, data TEXT NOT NULL)')
+        conn.execute(f'CREATE INDEX IF NOT EXISTS "{name}_company" ON "{name}" (company)')
+
+    def state(self, table: str):
+        """마지막 동기화 상태 (mode, watermark, key, rows, synced_at). 동기화한 적이 없으면 None"""
+        return self._connect().execute(
+            'SELECT mode, watermark, key, rows, synced_at FROM mirror_state WHERE table_name = ?', (table,)
+        ).fetchone()
+
+    def count(self, table: str) -> int:
+        return self._connect().execute(f'SELECT count(*) FROM "{table}"').fetchone()[0]
+
+    # ---- 동기화 ----
+
+    def sync(self, source, full: bool = False, page_size: int = SYNC_PAGE_SIZE):
+        """source(SupabaseClient.fetch_changes / fetch_rows 제공)에서 모든 미러 테이블을 동기화합니다."""
+        return [self.sync_table(source, table, full, page_size) for table in self.tables.values()]
+
+    def sync_table(self, source, table: MirrorTable, full: bool = False, page_size: int = SYNC_PAGE_SIZE):
+        started = time.perf_counter()
+        state = self.state(table.name)
+        # 처음이거나, 지난번에 전체 복사했거나(watermark 없음), 받은 행이 없었으면 전체 동기화
+        full = full or state is None or state[0] == COPY or state[1] is None
+        try:
+            mode, rows = self._sync_changes(source, table, None if full else state, page_size)
+        except APIError as e:
+            if e.code != '42703':
+                raise
+            print(f"⚠️ {table.name}에 {table.watermark}/{table.key} 컬럼이 없어 전체를 복사합니다 "
+                  f"(sql/mirror_sync_columns.sql 참고).")
+            mode, rows = COPY, self._copy(source, table, page_size)
+        return SyncResult(table.name, mode, rows, self.count(table.name), time.perf_counter() - started)
+
+    def _sync_changes(self, source, table: MirrorTable, state, page_size):
+        """state가 None이면 전체, 아니면 마지막 watermark 이후 행만 받습니다. (방식, 받은 행 수)를 돌려줍니다."""
+        conn = self._connect()
+        after = None if state is None else (_shift(state[1], SYNC_OVERLAP), None)
+        # 행은 (watermark, key) 순으로 오므로 마지막으로 받은 행이 다음 동기화의 시작점
+        last = (None, None) if state is None else (state[1], state[2])
+        received = 0
+        with conn:
+            if state is None:
+                conn.execute(f'DELETE FROM "{table.name}"')
+            while True:
+                rows = source.fetch_changes(table.name, table.watermark, table.key, after, page_size)
+                if rows:
+                    self._upsert(conn, table, rows)
+                    received += len(rows)
+                    after = last = (rows[-1][table.watermark], rows[-1][table.key])
+                if len(rows) < page_size:
+                    break
+            self._save_state(conn, table.name, FULL if state is None else INCREMENTAL, last)
+        return (FULL if state is None else INCREMENTAL), received
+
+    def _copy(self, source, table: MirrorTable, page_size):
+        """watermark 없이 테이블 전체를 복사합니다 (키는 복사 순번).
+
+        페이지가 겹치거나 빠지지 않도록 키 컬럼 순으로 받고, 키 컬럼도 없으면 전체 컬럼 순으로 받습니다.
+        """
+        conn = self._connect()
+        start = 0
+        order = (table.key,)
+        with conn:
+            conn.execute(f'DELETE FROM "{table.name}"')
+            while True:
+                try:
+                    rows = source.fetch_rows(table.name, start, page_size, order)
+                except APIError as e:
+                    # 정렬은 첫 페이지에서만 바꿀 수 있음 (중간에 바꾸면 페이지가 어긋남)
+                    if e.code != '42703' or start or order != (table.key,):
+                        raise
+                    order = source.table_columns(table.name)
+                    continue
+                conn.executemany(
+                    f'INSERT INTO "{table.name}" (key, watermark, company, data) VALUES (?, NULL, ?, ?)',
+                    [(start + i, row.get(table.company_column), json.dumps(row, ensure_ascii=False, default=str))
+                     for i, row in enumerate(rows)]
+                )
+                start += len(rows)
+                if not rows:
+                    break
+            # 다음 동기화도 전체 복사가 되도록 mode를 COPY로 기록
+            self._save_state(conn, table.name, COPY, (None, None))
+        return start
+
+    def load(self, table_name: str, rows):
+        """미러 테이블을 rows로 바꾸고 전체 동기화한 것처럼 상태를 기록합니다 (synthetic_data.py의 sqlite 출력).
+
+        rows는 (watermark, key) 순이어야 이후 증분 동기화가 마지막 행부터 이어집니다.
+        """
+        table = self.tables[table_name]
+        conn = self._connect()
+        with conn:
+            # 회사명 색인은 행을 모두 넣은 뒤 한 번에 만듦 (행마다 갱신하는 것보다 빠름)
+            conn.execute(f'DROP INDEX IF EXISTS "{table.name}_company"')
+            conn.execute(f'DELETE FROM "{table.name}"')
+            self._upsert(conn, table, rows)
+            self._create_table(conn, table.name)
+            last = (rows[-1][table.watermark], rows[-1][table.key]) if rows else (None, None)
+            self._save_state(conn, table.name, FULL, last)
+        return self.count(table.name)
+
+    @staticmethod
+    def _upsert(conn, table: MirrorTable, rows):
+        conn.executemany(
+            f'INSERT INTO "{table.name}" (key, watermark, company, data) VALUES (?, ?, ?, ?) '
+            f'ON CONFLICT (key) DO UPDATE SET watermark = excluded.watermark, company = excluded.company, '
+            f'data = excluded.data',
+            [(row[table.key], row[table.watermark], row.get(table.company_column),
+              json.dumps(row, ensure_ascii=False, default=str)) for row in rows]
+        )
+
+    def _save_state(self, conn, table, mode, last):
+        conn.execute(
+            'INSERT OR REPLACE INTO mirror_state (table_name, mode, watermark, key, rows, synced_at) '
+            'VALUES (?, ?, ?, ?, (SELECT count(*) FROM "{0}"), ?)'.format(table),
+            (table, mode, last[0], last[1], datetime.now().isoformat(timespec='seconds'))
+        )
+
+    # ---- 읽기 ----
+
+    def select(self, table: str, columns=None, filters=(), order=(), offset: int = 0, limit: int = None):
+        """미러 테이블 행을 원본 행(dict) 목록으로 돌려줍니다. columns가 있으면 그 컬럼만 남깁니다.
+
+        filters는 (컬럼, 값) 같음 조건이며, 회사명 컬럼 조건은 색인된 company 컬럼으로 찾습니다.
+        order는 'column.asc|desc' 목록으로 앞의 키부터 적용하고, 모두 같으면 동기화해 넣은 순서
+        (원본의 updated_at, id 순)입니다. 기본 키 컬럼 정렬은 JSON을 풀지 않고 key 컬럼(기본 키 색인)으로 하므로
+        iter_companies처럼 id 순으로 페이지를 나눠 읽어도 페이지마다 테이블 전체를 정렬하지 않습니다
+        (전체 복사한 테이블의 key는 원본을 키 컬럼 순으로 받은 복사 순번이라 순서가 같음).
+        """
+        spec = self.tables.get(table)
+        sql, args = f'SELECT data FROM "{table}"', []
+        conditions = []
+        for column, value in filters:
+            if spec is not None and column == spec.company_column:
+                conditions.append('company = ?')
+                args.append(value)
+            else:
+                conditions.append('json_extract(data, ?) = ?')
+                args.extend((f'$."{column}"', value))
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        terms = []
+        for spec_order in order:
+            column, _, direction = spec_order.rpartition('.')
+            direction = 'DESC' if direction == 'desc' else 'ASC'
+            if spec is not None and column == spec.key:
+                terms.append(f'key {direction}')
+            else:
+                terms.append(f'json_extract(data, ?) {direction}')
+                args.append(f'$."{column}"')
+        sql += ' ORDER BY ' + ', '.join(terms + ['rowid'])
+        if limit is not None or offset:
+            sql += ' LIMIT ? OFFSET ?'
+            args.extend((-1 if limit is None else limit, offset))
+        rows = [json.loads(data) for data, in self._connect().execute(sql, args)]
+        if columns:
+            rows = [{column: row.get(column) for column in columns} for row in rows]
+        return rows
+
+
+class MirrorClient(StoreBackend):
+    """SupabaseClient와 같은 메서드를 로컬 미러에서 읽어 제공합니다 (DATA_BACKEND=sqlite, backends.py 참고)."""
+
+    def __init__(self, mirror: LocalMirror = None):
+        super().__init__(mirror or LocalMirror())
+        print("MirrorClient initialized.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Supabase 테이블을 로컬 SQLite 미러로 동기화합니다.")
+    parser.add_argument('--path', default=MIRROR_PATH, help=f'미러 파일 경로 (기본: {MIRROR_PATH})')
+    parser.add_argument('--full', action='store_true', help='증분 대신 전체 동기화 (삭제된 행 반영)')
+    parser.add_argument('--page-size', type=int, default=SYNC_PAGE_SIZE)
+    args = parser.parse_args()
+
+    source = SupabaseClient()
+    if not source._client:
+        raise SystemExit("❌ Supabase 클라이언트가 초기화되지 않았습니다. SUPABASE_URL/SUPABASE_ANON_KEY를 확인하세요.")
+    mirror = LocalMirror(args.path)
+    for result in mirror.sync(source, full=args.full, page_size=args.page_size):
+        print(f"✅ {result.table}: {result.mode} 동기화 {result.rows:,}행 받음, 미러 {result.total:,}행 "
+              f"({result.seconds:.1f}초)")
+
+
+if __name__ == '__main__':
+    main()
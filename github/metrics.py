@@ -0,0 +1,335 @@
+"""Supabase 조회 지표와 Prometheus 텍스트 내보내기
+
+SupabaseClient/AsyncSupabaseClient(backends.py의 저장소 백엔드 포함)의 모든 조회는 _execute를 지나므로,
+거기서 (메서드, 테이블)별로 다음을 기록합니다.
+  - supabase_request_duration_seconds: 조회 지연 히스토그램 (결과 캐시 적중 포함)
+  - supabase_requests_total, supabase_errors_total{code}: 조회 수, 오류 수 (APIError 코드 또는 예외 이름)
+  - supabase_rows_total: 받은 행 수
+  - supabase_response_bytes_total: 받은 응답 본문 바이트 (압축된 전송 크기, httpx 응답 훅에서 셈)
+  - supabase_cache_hits_total, supabase_cache_misses_total: 결과 캐시 적중/미스
+
+render()가 Prometheus 텍스트 형식을 만들고, start_exporters()가 환경변수에 따라 내보냅니다.
+  - SUPABASE_METRICS_PORT: 이 포트의 /metrics로 제공 (데몬 스레드의 http.server).
+    기본은 127.0.0.1에만 열고, 다른 호스트에서 수집하려면 SUPABASE_METRICS_HOST=0.0.0.0처럼 직접 지정
+  - SUPABASE_METRICS_FILE: SUPABASE_METRICS_INTERVAL초마다 이 파일에 씀 (node_exporter textfile 수집기용)
+SUPABASE_METRICS=0이면 기록하지 않습니다. 기록 비용은 조회당 perf_counter 두 번과 잠금 한 번이며,
+benchmarks/bench_metrics.py로 켬/끔을 비교합니다.
+
+    metrics = get_client_metrics()
+    with metrics.track('get_recommendations', 'recommend_final') as call:
+        response = call.response(query.execute())
+    print(metrics.render())
+"""
+import bisect
+import contextvars
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+SUPABASE_METRICS = os.environ.get("SUPABASE_METRICS", "1") != "0"
+SUPABASE_METRICS_PORT = int(os.environ.get("SUPABASE_METRICS_PORT") or 0)
+# /metrics 서버가 바인딩할 주소 (기본: 로컬에서만 접근)
+SUPABASE_METRICS_HOST = os.environ.get("SUPABASE_METRICS_HOST") or '127.0.0.1'
+SUPABASE_METRICS_FILE = os.environ.get("SUPABASE_METRICS_FILE")
+SUPABASE_METRICS_INTERVAL = float(os.environ.get("SUPABASE_METRICS_INTERVAL") or 15)
+
+# 조회 지연 히스토그램 구간 상한(초)
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# 진행 중인 조회가 받은 응답 바이트 ([합계], 조회 밖에서는 None). 스레드와 asyncio 작업마다 따로 유지됨
+_received = contextvars.ContextVar('supabase_response_bytes', default=None)
+
+
+class Call:
+    """track() 블록 안에서 조회 결과(행 수, 캐시 적중)를 적는 객체"""
+    __slots__ = ('rows', 'cache')
+
+    def __init__(self):
+        self.rows = 0
+        # 'hit', 'miss', 또는 결과 캐시를 쓰지 않으면 None
+        self.cache = None
+
+    def response(self, response):
+        """응답의 행 수를 적고 응답을 그대로 돌려줍니다."""
+        data = getattr(response, 'data', None)
+        self.rows = len(data) if isinstance(data, list) else int(data is not None)
+        return response
+
+
+class _Series:
+    """(메서드, 테이블) 하나의 누적 값"""
+    __slots__ = ('buckets', 'duration', 'requests', 'rows', 'bytes', 'cache_hits', 'cache_misses', 'errors')
+
+    def __init__(self, bucket_count):
+        # 마지막 칸은 +Inf 구간
+        self.buckets = [0] * (bucket_count + 1)
+        self.duration = 0.0
+        self.requests = self.rows = self.bytes = self.cache_hits = self.cache_misses = 0
+        self.errors = {}
+
+
+def error_code(error: Exception) -> str:
+    """오류 지표의 code 값: PostgREST 오류 코드, 없으면 예외 클래스 이름"""
+    return getattr(error, 'code', None) or type(error).__name__
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels) -> str:
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+
+class ClientMetrics:
+    """(메서드, 테이블)별 조회 지표. 여러 세션의 스레드가 함께 쓰므로 갱신은 잠금 안에서 합니다."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS, enabled: bool = True):
+        self.buckets = tuple(buckets)
+        self.enabled = enabled
+        self._series = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def track(self, method: str, table: str):
+        """블록 실행 시간과 그동안 받은 응답 바이트를 기록합니다. 블록에서 난 예외는 오류로 세고 그대로 전달합니다."""
+        call = Call()
+        if not self.enabled:
+            yield call
+            return
+        received = [0]
+        token = _received.set(received)
+        started = time.perf_counter()
+        try:
+            yield call
+        except Exception as e:
+            self.observe(method, table, time.perf_counter() - started,
+                         response_bytes=received[0], cache=call.cache, error=error_code(e))
+            raise
+        finally:
+            _received.reset(token)
+        self.observe(method, table, time.perf_counter() - started, call.rows, received[0], call.cache)
+
+    def observe(self, method: str, table: str, seconds: float, rows: int = 0, response_bytes: int = 0,
+                cache: str = None, error: str = None):
+        """조회 한 번을 기록합니다."""
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get((method, table))
+            if series is None:
+                series = self._series[(method, table)] = _Series(len(self.buckets))
+            series.buckets[index] += 1
+            series.duration += seconds
+            series.requests += 1
+            series.rows += rows
+            series.bytes += response_bytes
+            if cache == 'hit':
+                series.cache_hits += 1
+            elif cache == 'miss':
+                series.cache_misses += 1
+            if error is not None:
+                series.errors[error] = series.errors.get(error, 0) + 1
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+    def _copy(self):
+        """잠금 안에서 복사한 [((메서드, 테이블), 값)] (메서드, 테이블 순)"""
+        with self._lock:
+            copies = []
+            for key, series in self._series.items():
+                copy = _Series(0)
+                copy.buckets = list(series.buckets)
+                copy.errors = dict(series.errors)
+                for name in ('duration', 'requests', 'rows', 'bytes', 'cache_hits', 'cache_misses'):
+                    setattr(copy, name, getattr(series, name))
+                copies.append((key, copy))
+        return sorted(copies, key=lambda item: item[0])
+
+    def quantile(self, buckets, q: float):
+        """히스토그램 구간 개수로 추정한 q 분위수(초). Prometheus histogram_quantile처럼 구간 안을 선형 보간합니다."""
+        total = sum(buckets)
+        if not total:
+            return None
+        rank = q * total
+        cumulative, lower = 0, 0.0
+        for upper, count in zip(self.buckets, buckets):
+            if count and cumulative + count >= rank:
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+            lower = upper
+        # +Inf 구간이면 가장 큰 유한 상한
+        return self.buckets[-1]
+
+    def summary(self):
+        """(메서드, 테이블)별 요약 목록 (관리자 패널용)"""
+        rows = []
+        for (method, table), series in self._copy():
+            p50, p95 = self.quantile(series.buckets, 0.5), self.quantile(series.buckets, 0.95)
+            rows.append({
+                'method': method,
+                'table': table,
+                'requests': series.requests,
+                'errors': sum(series.errors.values()),
+                'rows': series.rows,
+                'response_bytes': series.bytes,
+                'cache_hits': series.cache_hits,
+                'cache_misses': series.cache_misses,
+                'mean_ms': series.duration / series.requests * 1000,
+                'p50_ms': p50 * 1000,
+                'p95_ms': p95 * 1000,
+            })
+        return rows
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        series = self._copy()
+        lines = [
+            '# HELP supabase_request_duration_seconds Supabase 조회 지연 (결과 캐시 적중 포함)',
+            '# TYPE supabase_request_duration_seconds histogram',
+        ]
+        for (method, table), values in series:
+            cumulative = 0
+            for upper, count in zip(self.buckets + (float('inf'),), values.buckets):
+                cumulative += count
+                le = '+Inf' if upper == float('inf') else repr(upper)
+                lines.append(f'supabase_request_duration_seconds_bucket'
+                             f'{_labels(method=method, table=table, le=le)} {cumulative}')
+            lines.append(f'supabase_request_duration_seconds_sum{_labels(method=method, table=table)} '
+                         f'{values.duration!r}')
+            lines.append(f'supabase_request_duration_seconds_count{_labels(method=method, table=table)} '
+                         f'{values.requests}')
+        for name, attribute, help_text in (
+            ('supabase_requests_total', 'requests', 'Supabase 조회 수'),
+            ('supabase_rows_total', 'rows', '조회로 받은 행 수'),
+            ('supabase_response_bytes_total', 'bytes', '조회로 받은 응답 본문 바이트 (압축된 전송 크기)'),
+            ('supabase_cache_hits_total', 'cache_hits', '결과 캐시 적중 수'),
+            ('supabase_cache_misses_total', 'cache_misses', '결과 캐시 미스 수'),
+        ):
+            lines += [f'# HELP {name} {help_text}', f'# TYPE {name} counter']
+            lines += [f'{name}{_labels(method=method, table=table)} {getattr(values, attribute)}'
+                      for (method, table), values in series]
+        lines += ['# HELP supabase_errors_total Supabase 조회 오류 수 (PostgREST 오류 코드 또는 예외 이름)',
+                  '# TYPE supabase_errors_total counter']
+        for (method, table), values in series:
+            lines += [f'supabase_errors_total{_labels(method=method, table=table, code=code)} {count}'
+                      for code, count in sorted(values.errors.items())]
+        return '\n'.join(lines) + '\n'
+
+
+class _CountingStream(httpx.SyncByteStream):
+    def __init__(self, stream, received):
+        self._stream = stream
+        self._received = received
+
+    def __iter__(self):
+        for chunk in self._stream:
+            self._received[0] += len(chunk)
+            yield chunk
+
+    def close(self):
+        self._stream.close()
+
+
+class _AsyncCountingStream(httpx.AsyncByteStream):
+    def __init__(self, stream, received):
+        self._stream = stream
+        self._received = received
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            self._received[0] += len(chunk)
+            yield chunk
+
+    async def aclose(self):
+        await self._stream.aclose()
+
+
+def count_response_bytes(response: httpx.Response):
+    """httpx.Client 응답 훅: track() 블록 안의 응답이면 본문을 읽을 때 받은 바이트 수를 셉니다."""
+    received = _received.get()
+    if received is not None:
+        response.stream = _CountingStream(response.stream, received)
+
+
+async def acount_response_bytes(response: httpx.Response):
+    """httpx.AsyncClient 응답 훅 (count_response_bytes의 비동기 버전)"""
+    received = _received.get()
+    if received is not None:
+        response.stream = _AsyncCountingStream(response.stream, received)
+
+
+def write_textfile(metrics: ClientMetrics, path: str):
+    """render() 결과를 path에 씁니다. 수집기가 쓰다 만 파일을 읽지 않도록 임시 파일을 바꿔치기합니다."""
+    temporary = f'{path}.{os.getpid()}.tmp'
+    with open(temporary, 'w', encoding='utf-8') as f:
+        f.write(metrics.render())
+    os.replace(temporary, path)
+
+
+def serve(metrics: ClientMetrics, port: int, host: str = '127.0.0.1'):
+    """데몬 스레드에서 /metrics를 제공하는 HTTP 서버를 띄우고 돌려줍니다 (port=0이면 빈 포트)."""
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = metrics.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', PROMETHEUS_CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='metrics-exporter', daemon=True).start()
+    return server
+
+
+def _write_periodically(metrics: ClientMetrics, path: str, interval: float):
+    while True:
+        try:
+            write_textfile(metrics, path)
+        except OSError as e:
+            print(f"⚠️ 지표 파일을 쓰지 못했습니다 ({path}): {e}")
+        time.sleep(interval)
+
+
+_client_metrics = ClientMetrics(enabled=SUPABASE_METRICS)
+_exporters_lock = threading.Lock()
+_exporters_started = False
+
+
+def get_client_metrics():
+    """프로세스 공용 조회 지표 (모든 클라이언트가 함께 기록)"""
+    return _client_metrics
+
+
+def start_exporters(metrics: ClientMetrics = None):
+    """SUPABASE_METRICS_PORT/SUPABASE_METRICS_FILE이 설정되어 있으면 지표 내보내기를 시작합니다 (프로세스당 한 번)."""
+    global _exporters_started
+    metrics = metrics or _client_metrics
+    with _exporters_lock:
+        if _exporters_started:
+            return
+        _exporters_started = True
+    if SUPABASE_METRICS_PORT:
+        try:
+            serve(metrics, SUPABASE_METRICS_PORT, SUPABASE_METRICS_HOST)
+            print(f"📈 조회 지표를 {SUPABASE_METRICS_HOST}:{SUPABASE_METRICS_PORT}/metrics 로 제공합니다.")
+        except OSError as e:
+            print(f"⚠️ 지표 서버를 시작하지 못했습니다 (포트 {SUPABASE_METRICS_PORT}): {e}")
+    if SUPABASE_METRICS_FILE:
+        threading.Thread(target=_write_periodically, name='metrics-textfile', daemon=True,
+                         args=(metrics, SUPABASE_METRICS_FILE, SUPABASE_METRICS_INTERVAL)).start()
+        print(f"📈 조회 지표를 {SUPABASE_METRICS_INTERVAL:g}초마다 {SUPABASE_METRICS_FILE}에 씁니다.")
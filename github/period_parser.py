@@ -0,0 +1,91 @@
+"""'사업 연도' 기간 문자열 파서
+
+추천 공고의 '사업 연도' 값(예: '20250101 ~ 20250131', '예산 소진시까지', '2025년 3월')을
+한 번만 해석해 Period로 돌려줍니다. 정규식은 모듈 로드 시 한 번 컴파일하고,
+같은 문자열은 LRU 캐시에서 바로 꺼내므로 여러 화면에서 반복 호출해도 비용이 작습니다.
+"""
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+# 같은 공고 문자열이 화면마다 반복되므로 이 개수만큼 해석 결과를 보관
+PERIOD_CACHE_SIZE = 65536
+
+START_PATTERN = re.compile(r'(\d{8})\s*~')
+END_PATTERN = re.compile(r'~\s*(\d{8})')
+DATE_PATTERN = re.compile(r'(\d{8})')
+ROLLING_KEYWORDS = ('예산 소진시까지', '상시')
+
+# 로드맵 월 분류 패턴 (위에서부터 처음으로 해석에 성공한 패턴의 월을 사용)
+YYYYMMDD_MONTH_PATTERNS = (
+    re.compile(r'"(\d{8})"'),  # "yyyymmdd" 형식
+    START_PATTERN,  # yyyymmdd ~ 형식
+    DATE_PATTERN,  # 일반 yyyymmdd 형식
+)
+YEAR_MONTH_PATTERNS = (
+    re.compile(r'(\d{4})년\s*(\d{1,2})월'),  # 2025년 1월 형식
+    re.compile(r'(\d{4})\.(\d{1,2})\.(\d{1,2})'),  # 2025.01.15 형식
+)
+
+
+class Period(NamedTuple):
+    """'사업 연도' 해석 결과"""
+    start: Optional[date]  # 'yyyymmdd ~'의 시작일
+    end: Optional[date]  # '~ yyyymmdd'의 종료일
+    rolling: bool  # '예산 소진시까지' 또는 '상시' 공고
+    month: Optional[int]  # 로드맵 월별 분류에 쓰는 월 (1~12)
+
+
+EMPTY_PERIOD = Period(None, None, False, None)
+
+
+def _to_date(match):
+    if not match:
+        return None
+    try:
+        return datetime.strptime(match.group(1), '%Y%m%d').date()
+    except ValueError:
+        return None
+
+
+def _month(period_str):
+    for pattern in YYYYMMDD_MONTH_PATTERNS:
+        parsed = _to_date(pattern.search(period_str))
+        if parsed:
+            return parsed.month
+    for pattern in YEAR_MONTH_PATTERNS:
+        match = pattern.search(period_str)
+        if match and 1 <= int(match.group(2)) <= 12:
+            return int(match.group(2))
+    # 연도만 있는 경우 (예: "2025")는 제외
+    return None
+
+
+@lru_cache(maxsize=PERIOD_CACHE_SIZE)
+def _parse(period_str):
+    return Period(
+        start=_to_date(START_PATTERN.search(period_str)),
+        end=_to_date(END_PATTERN.search(period_str)),
+        rolling=any(keyword in period_str for keyword in ROLLING_KEYWORDS),
+        month=_month(period_str),
+    )
+
+
+def parse_period(period_str):
+    """'사업 연도' 문자열을 Period로 해석합니다. 비어 있거나 문자열이 아니면 EMPTY_PERIOD입니다."""
+    if not period_str or not isinstance(period_str, str):
+        return EMPTY_PERIOD
+    return _parse(period_str)
+
+
+def first_date(period_str):
+    """문자열에서 처음 나오는 8자리 숫자를 yyyymmdd 날짜로 읽습니다. 없거나 날짜가 아니면 None입니다."""
+    if not period_str or not isinstance(period_str, str):
+        return None
+    return _to_date(DATE_PATTERN.search(period_str))
+
+
+def cache_info():
+    """파서 LRU 캐시 적중/미스 통계"""
+    return _parse.cache_info()
@@ -0,0 +1,103 @@
+"""맞춤 추천/알림 탭의 표 가공
+
+app.py의 탭 함수가 st.* 호출 사이에서 하던 데이터 가공(추천 DataFrame 생성, 정렬, 표시용 표, 요약 지표,
+고점수 공고 수)을 Streamlit 없이 호출할 수 있도록 모았습니다. 벤치마크(benchmarks/bench_hot_paths.py)도
+같은 함수를 측정합니다.
+"""
+import pandas as pd
+
+# 이 점수 이상이면 고점수 공고
+HIGH_SCORE = 80
+
+# recommend_final 컬럼 -> 추천 표 컬럼
+RECOMMENDATION_COLUMN_NAMES = {
+    '사업명': '공고명',
+    '최종 점수': '총점수',
+    '지역': '지역명',
+    '사업 연도': '신청기간',
+    '상세페이지 URL': '공고URL'
+}
+
+DISPLAY_COLUMNS = ['순위', '공고명', '지원분야', '지원대상', '지역명', '소관기관', '신청기간', '총점수', '데이터소스']
+
+# 정렬 기준 -> (컬럼, 오름차순)
+SORT_OPTIONS = {
+    "추천 점수 높은 순": ('총점수', False),
+    "신청 마감일 빠른 순": ('신청기간', True),
+    "공고 등록일 최신 순": ('공고명', False),
+}
+
+
+def count_high_score(records) -> int:
+    """최종 점수가 HIGH_SCORE 이상인 공고 수 (숫자가 아닌 점수는 제외)"""
+    count = 0
+    for item in records:
+        score = item.get('최종 점수', 0)
+        if isinstance(score, (int, float)) and score >= HIGH_SCORE:
+            count += 1
+    return count
+
+
+def recommendation_frame(recommendations, min_score: int = 0, max_results: int = 0):
+    """추천 공고 목록을 점수 순 추천 표(DataFrame)로 만듭니다."""
+    df = pd.DataFrame(recommendations)
+
+    # 최종 점수 기준으로 정렬
+    df = df.sort_values('최종 점수', ascending=False)
+
+    # 최소 점수 필터링
+    if min_score > 0:
+        df = df[df['최종 점수'] >= min_score]
+
+    # 최대 결과 수 제한
+    if max_results > 0:
+        df = df.head(max_results)
+
+    # 컬럼명을 기존 형식에 맞게 변경
+    df = df.rename(columns=RECOMMENDATION_COLUMN_NAMES)
+
+    # 순위 추가
+    df['순위'] = range(1, len(df) + 1)
+
+    # 데이터소스 컬럼 추가 (기본값)
+    df['데이터소스'] = 'recommend_final'
+
+    # 지원분야, 지원대상, 소관기관 컬럼 추가 (기본값)
+    df['지원분야'] = '기타'
+    df['지원대상'] = '중소기업'
+    df['소관기관'] = '정부기관'
+    return df
+
+
+def sort_recommendations(recommendations, sort_option: str):
+    """추천 표를 화면의 정렬 기준으로 정렬합니다. 알 수 없는 기준이면 그대로 돌려줍니다."""
+    if sort_option not in SORT_OPTIONS:
+        return recommendations
+    column, ascending = SORT_OPTIONS[sort_option]
+    return recommendations.sort_values(column, ascending=ascending)
+
+
+def display_frame(recommendations):
+    """상세 추천 공고 표: 표시 컬럼만 남기고 공고 URL을 링크로 바꿉니다."""
+    display_columns = list(DISPLAY_COLUMNS)
+    if '공고URL' in recommendations.columns:
+        display_columns.append('공고URL')
+
+    display_df = recommendations[display_columns].copy()
+
+    # URL을 클릭 가능한 링크로 변환
+    if '공고URL' in display_df.columns:
+        display_df['공고URL'] = display_df['공고URL'].apply(
+            lambda x: f'<a href="{x}" target="_blank">🔗 링크</a>' if pd.notna(x) and x else ''
+        )
+    return display_df
+
+
+def summarize_recommendations(recommendations):
+    """추천 결과 요약 지표 (총 추천 수, 평균 점수, 고점수 공고 수, 데이터 소스 수)"""
+    return (
+        len(recommendations),
+        recommendations['총점수'].mean(),
+        len(recommendations[recommendations['총점수'] >= HIGH_SCORE]),
+        recommendations['데이터소스'].nunique(),
+    )
@@ -0,0 +1,130 @@
+"""SupabaseClient 조회 결과 캐시
+
+(메서드, 테이블 또는 RPC, 필터/컬럼/인자) 단위로 조회 결과를 보관하는 TTL + LRU 캐시입니다.
+테이블마다 TTL을 따로 두고, 전체 크기는 결과의 JSON 직렬화 바이트 수로 제한합니다.
+여러 Streamlit 세션이 모듈 전역 클라이언트를 함께 쓰므로 모든 연산은 잠금 안에서 수행합니다.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional
+
+# 테이블별 결과 유지 시간(초). 목록에 없는 테이블은 DEFAULT_TTL을 사용
+DEFAULT_TTL = 60
+TABLE_TTLS = {
+    'alpha_companies_final': 600,  # 회사 목록은 거의 바뀌지 않음
+    'recommend_final': 120,
+    'recommend_final_periods': 120,
+    'recommend_monthly_counts': 120,
+}
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    size: int
+    expires_at: float
+    table: str
+    company: Optional[str]
+
+
+def estimate_size(value):
+    """결과가 차지하는 크기를 JSON 직렬화 바이트 수로 추정합니다."""
+    data = getattr(value, 'data', value)
+    try:
+        return len(json.dumps(data, ensure_ascii=False, default=str).encode('utf-8'))
+    except (TypeError, ValueError):
+        return len(repr(data).encode('utf-8'))
+
+
+class ResultCache:
+    """바이트 크기 상한이 있는 TTL/LRU 캐시
+
+    반환값은 캐시에 보관된 객체 그대로이므로 호출부에서 수정하면 안 됩니다.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float = DEFAULT_TTL, table_ttls: dict = None, clock=time.monotonic):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.table_ttls = dict(TABLE_TTLS if table_ttls is None else table_ttls)
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        """(적중 여부, 값)을 돌려줍니다. 만료된 항목은 지우고 미스로 셉니다."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= self._clock():
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry.value
+
+    def table_ttl(self, table: str) -> float:
+        """table 조회 결과를 보관하는 시간(초)"""
+        return self.table_ttls.get(table, self.ttl)
+
+    def put(self, key, value, table: str, company: str = None):
+        """결과를 저장합니다. 상한보다 큰 결과는 저장하지 않고, 자리가 부족하면 오래 안 쓴 항목부터 내보냅니다."""
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        expires_at = self._clock() + self.table_ttl(table)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            while self._entries and self._bytes + size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+            self._entries[key] = CacheEntry(value, size, expires_at, table, company)
+            self._bytes += size
+
+    def invalidate(self, company: str = None, table: str = None):
+        """조건에 맞는 항목을 지우고 지운 개수를 돌려줍니다.
+
+        company를 주면 그 회사로 필터링한 결과와, 회사 필터 없이 테이블 전체를 조회한 결과
+        (그 회사의 행이 들어 있을 수 있음)를 지웁니다. table을 주면 해당 테이블로 범위를 좁힙니다.
+        둘 다 없으면 전체를 비웁니다.
+        """
+        with self._lock:
+            keys = [
+                key for key, entry in self._entries.items()
+                if (table is None or entry.table == table)
+                and (company is None or entry.company in (company, None))
+            ]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self):
+        self.invalidate()
+
+    def stats(self):
+        """적중/미스/내보냄/만료 횟수와 현재 항목 수, 사용 바이트"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
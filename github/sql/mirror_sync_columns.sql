@@ -0,0 +1,34 @@
+-- 로컬 미러(local_mirror.py) 증분 동기화용 컬럼
+--
+-- alpha_companies_final과 recommend_final에 기본 키 id와, 행을 넣거나 바꿀 때마다 갱신되는 updated_at을 추가합니다.
+-- local_mirror.py는 마지막으로 받은 (updated_at, id) 이후의 행만 가져옵니다.
+-- 이 파일을 실행하지 않으면 동기화할 때마다 테이블 전체를 복사합니다.
+--
+-- Supabase SQL Editor에서 한 번 실행하면 됩니다. 다시 실행해도 안전합니다.
+-- (이미 다른 기본 키가 있는 테이블이면 id 대신 그 컬럼을 local_mirror.MIRROR_TABLES의 key로 지정하세요.)
+
+create or replace function public.touch_updated_at()
+returns trigger
+language plpgsql
+as $$
+begin
+    new.updated_at := now();
+    return new;
+end;
+$$;
+
+do $$
+declare
+    table_name text;
+begin
+    foreach table_name in array array['alpha_companies_final', 'recommend_final'] loop
+        execute format('alter table public.%I add column if not exists id bigint generated by default as identity', table_name);
+        execute format('alter table public.%I add column if not exists updated_at timestamptz not null default now()', table_name);
+        execute format('create unique index if not exists %I on public.%I (id)', table_name || '_id_key', table_name);
+        execute format('create index if not exists %I on public.%I (updated_at, id)', table_name || '_updated_at_id', table_name);
+        execute format('drop trigger if exists touch_updated_at on public.%I', table_name);
+        execute format('create trigger touch_updated_at before insert or update on public.%I '
+                       'for each row execute function public.touch_updated_at()', table_name);
+    end loop;
+end;
+$$;
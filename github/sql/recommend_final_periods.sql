@@ -0,0 +1,41 @@
+-- recommend_final의 '사업 연도' 문자열을 파싱한 기간 컬럼을 노출하는 뷰
+--
+-- SupabaseClient.get_recommendations(is_active_only / is_new_announcements)가
+-- 활성/신규 공고를 서버에서 gte/lte로 거를 수 있도록 start_date, end_date, is_rolling을 제공합니다.
+-- 파싱 규칙은 클라이언트와 같습니다.
+--   start_date: 'yyyymmdd ~' 앞의 날짜
+--   end_date:   '~ yyyymmdd' 뒤의 날짜
+--   is_rolling: '예산 소진시까지' 또는 '상시'를 포함
+-- 존재하지 않는 날짜(예: 20250230)는 NULL로 처리합니다.
+--
+-- Supabase SQL Editor에서 한 번 실행하면 됩니다. 다시 실행해도 안전합니다.
+
+create or replace function public.parse_yyyymmdd(value text)
+returns date
+language plpgsql
+immutable
+parallel safe
+as $$
+begin
+    -- 파이썬 strptime처럼 0년은 허용하지 않음 (to_date는 기원전 1년으로 해석)
+    if value is null or left(value, 4) = '0000' then
+        return null;
+    end if;
+    -- to_date는 범위를 넘는 월/일을 오류로 처리하므로 NULL로 바꿈
+    return to_date(value, 'YYYYMMDD');
+exception when others then
+    return null;
+end;
+$$;
+
+create or replace view public.recommend_final_periods
+with (security_invoker = true)
+as
+select
+    r.*,
+    public.parse_yyyymmdd(substring(r."사업 연도" from '(\d{8})\s*~')) as start_date,
+    public.parse_yyyymmdd(substring(r."사업 연도" from '~\s*(\d{8})')) as end_date,
+    coalesce(strpos(r."사업 연도", '예산 소진시까지') > 0 or strpos(r."사업 연도", '상시') > 0, false) as is_rolling
+from public.recommend_final r;
+
+grant select on public.recommend_final_periods to anon, authenticated;
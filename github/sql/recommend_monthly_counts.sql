@@ -0,0 +1,59 @@
+-- 로드맵 월별 공고 수를 서버에서 집계하는 RPC
+--
+-- SupabaseClient.get_monthly_recommendations가 recommend_final 전체를 내려받아 세는 대신
+-- 월별 (month, count) 최대 12행만 받도록 합니다. 회사명을 주면 해당 회사의 공고만 셉니다.
+-- 월 분류 규칙은 클라이언트(period_parser)와 같습니다. 위에서부터 처음으로 해석에 성공한 패턴의 월을 사용합니다.
+--   1. "yyyymmdd"   2. yyyymmdd ~   3. yyyymmdd
+--   4. yyyy년 m월    5. yyyy.m.d  (4, 5는 월이 1~12일 때만)
+--
+-- recommend_final_periods.sql의 parse_yyyymmdd를 사용하므로 그 파일을 먼저 실행해야 합니다.
+-- Supabase SQL Editor에서 한 번 실행하면 됩니다. 다시 실행해도 안전합니다.
+
+create or replace function public.roadmap_month(period text)
+returns integer
+language plpgsql
+immutable
+parallel safe
+as $$
+declare
+    pattern text;
+    parts text[];
+    parsed date;
+begin
+    if period is null or period = '' then
+        return null;
+    end if;
+    foreach pattern in array array['"(\d{8})"', '(\d{8})\s*~', '(\d{8})'] loop
+        parts := regexp_match(period, pattern);
+        parsed := public.parse_yyyymmdd(parts[1]);
+        if parsed is not null then
+            return extract(month from parsed)::integer;
+        end if;
+    end loop;
+    foreach pattern in array array['(\d{4})년\s*(\d{1,2})월', '(\d{4})\.(\d{1,2})\.(\d{1,2})'] loop
+        parts := regexp_match(period, pattern);
+        if parts is not null and parts[2]::integer between 1 and 12 then
+            return parts[2]::integer;
+        end if;
+    end loop;
+    -- 연도만 있는 경우 (예: "2025")는 제외
+    return null;
+end;
+$$;
+
+create or replace function public.recommend_monthly_counts(company_name text default null)
+returns table (month integer, count bigint)
+language sql
+stable
+security invoker
+as $$
+    select m.month, count(*) as count
+    from public.recommend_final r
+    cross join lateral (select public.roadmap_month(r."사업 연도") as month) m
+    where (company_name is null or r."기업명" = company_name)
+      and m.month is not null
+    group by m.month
+    order by m.month;
+$$;
+
+grant execute on function public.recommend_monthly_counts(text) to anon, authenticated;
@@ -1,29 +1,246 @@
 import os
-from supabase import create_client, Client
+import threading
+from postgrest.exceptions import APIError
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
-import re
 import pandas as pd
 
+from company_normalizer import normalize_companies
+from period_parser import parse_period, EMPTY_PERIOD
+from result_cache import ResultCache
+from http_policy import HttpPolicy, build_http_client
+from metrics import ClientMetrics, get_client_metrics
+from tracing import span, traced
+
 load_dotenv()
 
 SUPABASE_URL = os.environ.get("SUPABASE_URL")
 SUPABASE_ANON_KEY = os.environ.get("SUPABASE_ANON_KEY")
 SUPABASE_SERVICE_ROLE_KEY = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
+# 조회 결과 캐시 크기(MB). 설정하지 않거나 0이면 캐시를 사용하지 않음
+SUPABASE_RESULT_CACHE_MB = float(os.environ.get("SUPABASE_RESULT_CACHE_MB") or 0)
 
-class SupabaseClient:
-    def __init__(self):
-        if not SUPABASE_URL or not SUPABASE_ANON_KEY:
-            print("⚠️ Supabase 환경변수가 설정되지 않았습니다. Streamlit Cloud에서 환경변수를 설정해주세요.")
-            self._client = None
-            return
+# PostgREST 기본 max-rows와 같은 크기로 한 번에 가져올 회사 수
+COMPANY_PAGE_SIZE = 1000
+
+# 회사 목록을 range로 나눠 받을 때의 정렬 (페이지 사이에 행이 겹치거나 빠지지 않도록 고유 키로 정렬).
+# id(sql/mirror_sync_columns.sql)가 없는 테이블은 전체 컬럼 순으로 정렬합니다.
+COMPANY_PAGE_ORDER = ('id',)
+
+# 메서드별로 호출부가 실제로 읽는 컬럼 목록 (select('*') 대신 이 컬럼만 전송/디코딩)
+COMPANY_COLUMNS = ('id', '기업명', '기업형태', '업종', '지역', '설립일', '고용', '업력', '기술특허', '기업인증')
+RECOMMENDATION_COLUMNS = ('기업명', '사업명', '최종 점수', '지역', '사업 연도', '상세페이지 URL')
+COLUMN_MANIFESTS = {
+    'test_connection': ('기업명',),
+    'get_companies': COMPANY_COLUMNS,
+    'get_recommendations': RECOMMENDATION_COLUMNS,
+    'get_monthly_recommendations': ('사업 연도',),
+    'get_monthly_details': RECOMMENDATION_COLUMNS,
+}
+
+# start_date, end_date, is_rolling 컬럼을 제공하는 기간 뷰 (sql/recommend_final_periods.sql)
+PERIOD_VIEW = 'recommend_final_periods'
+# PostgREST가 테이블/뷰를 찾지 못했을 때 돌려주는 오류 코드
+MISSING_RELATION_CODES = {'42P01', 'PGRST205'}
+# 월별 공고 수를 서버에서 집계하는 RPC (sql/recommend_monthly_counts.sql)
+MONTHLY_COUNTS_RPC = 'recommend_monthly_counts'
+# PostgREST가 RPC 함수를 찾지 못했을 때 돌려주는 오류 코드
+MISSING_FUNCTION_CODES = {'42883', 'PGRST202'}
+# 시작일로부터 이 일수 이내면 신규 공고
+NEW_ANNOUNCEMENT_DAYS = 5
+
+
+def quote_column(column: str) -> str:
+    """공백이나 쉼표가 있는 컬럼명을 PostgREST 파라미터에 쓸 수 있게 따옴표로 감쌉니다."""
+    return f'"{column}"' if ' ' in column or ',' in column else column
+
+
+def select_clause(columns):
+    """컬럼 목록을 PostgREST select 파라미터 문자열로 만듭니다."""
+    return ','.join(quote_column(column) for column in columns)
+
+
+def order_by_columns(query, columns):
+    """columns 순(오름차순)으로 정렬하는 쿼리를 돌려줍니다."""
+    for column in columns:
+        query = query.order(quote_column(column))
+    return query
+
+
+def cache_key(table: str, method: str, query):
+    """쿼리의 결과 캐시 키와 캐시 항목에 붙일 회사명을 만듭니다."""
+    # select 컬럼, 필터, 정렬, 범위는 쿼리 파라미터에, RPC 인자는 요청 본문에 들어 있음
+    params = tuple(query.request.params.multi_items())
+    body = tuple(sorted((query.request.json or {}).items()))
+    company = dict(body).get('company_name') or dict(params).get('company_name') or next(
+        (value[3:] for name, value in params if name == '기업명' and value.startswith('eq.')), None)
+    return (method, table, params, body), company
+
+
+def filter_period_query(query, is_active_only: bool, today):
+    """기간 뷰 쿼리에 활성/신규 공고 조건을 붙입니다."""
+    if is_active_only:
+        # 상시 공고이거나 오늘이 시작일과 종료일 사이인 공고
+        return query.or_(f"is_rolling.is.true,and(start_date.lte.{today.isoformat()},end_date.gte.{today.isoformat()})")
+    # 시작일이 NEW_ANNOUNCEMENT_DAYS일 이내인 신규 공고
+    return query.gte('start_date', (today - timedelta(days=NEW_ANNOUNCEMENT_DAYS)).isoformat())
+
+
+def filter_periods(records, is_active_only: bool, today):
+    """'사업 연도'를 파싱해 활성 공고(is_active_only) 또는 신규 공고만 남깁니다."""
+    filtered_data = []
+    for item in records:
+        period = parse_period(item.get('사업 연도'))
+        if period is EMPTY_PERIOD:
+            continue
+
+        if is_active_only:
+            if period.rolling or (period.start and period.end and period.start <= today <= period.end):
+                filtered_data.append(item)
+        elif period.start and (today - period.start).days <= NEW_ANNOUNCEMENT_DAYS: # 5일 이내 신규 공고
+            filtered_data.append(item)
+    return filtered_data
+
+
+def count_months(records):
+    """'사업 연도'의 로드맵 월별 공고 수"""
+    monthly_counts = {i: 0 for i in range(1, 13)}
+    for item in records:
+        month = parse_period(item.get('사업 연도')).month
+        if month:
+            monthly_counts[month] += 1
+    return monthly_counts
+
+
+def monthly_counts_args(company_name):
+    """월별 집계 RPC 인자. 읽기 전용 GET 호출이므로 회사명이 없으면 인자를 빼서 SQL 기본값(NULL)을 씀"""
+    return {'company_name': company_name} if company_name else {}
+
+
+def monthly_counts_from_rpc(rows):
+    """recommend_monthly_counts RPC 결과(month, count 행)를 월별 공고 수로 바꿉니다."""
+    monthly_counts = {i: 0 for i in range(1, 13)}
+    for row in rows:
+        monthly_counts[row['month']] = row['count']
+    return monthly_counts
+
+
+def format_detail_records(records):
+    """추천 공고 행을 로드맵 상세 표 형식(컬럼명 변경, 순위/기본값 컬럼 추가)으로 바꿉니다."""
+    # 컬럼명 변경
+    df = pd.DataFrame(records)
+    if not df.empty:
+        df = df.rename(columns={
+            '사업명': '공고명',
+            '최종 점수': '총점수',
+            '지역': '지역명',
+            '사업 연도': '신청기간',
+            '상세페이지 URL': '공고URL'
+        })
+        # 순위 추가
+        df['순위'] = range(1, len(df) + 1)
+        # 데이터소스 컬럼 추가 (기본값)
+        df['데이터소스'] = 'recommend_final'
+        # 지원분야, 지원대상, 소관기관 컬럼 추가 (기본값)
+        df['지원분야'] = '기타'
+        df['지원대상'] = '중소기업'
+        df['소관기관'] = '정부기관'
+        return df.to_dict('records')
+    return []
+
+
+class RecommendationClient:
+    """앱이 쓰는 조회 메서드(회사 목록, 추천 공고, 월별 집계)와 결과 캐시/지표 기록
+
+    PostgREST 쿼리 빌더 형식(table().select().eq().order().range())으로 조회하며, 서브클래스가 다음을 제공합니다.
+      - _connect(): 쿼리를 만들 클라이언트 (SupabaseClient는 supabase 클라이언트, backends.StoreBackend는 저장소)
+      - table_columns(table): 테이블의 컬럼 목록 (iter_companies가 id 없는 테이블을 전체 컬럼 순으로 나눌 때 사용)
+    """
+
+    def __init__(self, result_cache: ResultCache = None, http_policy: HttpPolicy = None,
+                 metrics: ClientMetrics = None):
+        # 조회 결과 캐시 (None이면 매번 Supabase를 조회)
+        self._cache = result_cache
+        # 조회 지연/행 수/응답 바이트/캐시 적중/오류 지표 (metrics.py, 기본: 프로세스 공용)
+        self.metrics = metrics or get_client_metrics()
+        # 연결 풀/타임아웃/압축/재시도 정책 (http_policy.py)
+        self.http_policy = http_policy or HttpPolicy.from_env()
+        # 매니페스트 컬럼이 테이블에 없어 전체 컬럼으로 대체한 (table, method) 조합
+        self._select_fallbacks = set()
+        # iter_companies가 페이지를 나눌 정렬 (id가 없으면 전체 컬럼으로 바뀜)
+        self._company_order = COMPANY_PAGE_ORDER
+        # 기간 뷰가 없는 것으로 확인되면 False로 바꾸고 클라이언트 필터링을 사용
+        self._period_view_available = True
+        # 월별 집계 RPC가 없는 것으로 확인되면 False로 바꾸고 클라이언트에서 집계
+        self._monthly_rpc_available = True
+        # invalidate()마다 1씩 늘어나는 데이터 버전 (세션의 CompanySnapshot 재사용 판단, company_snapshot.py)
+        self.data_version = 0
+        self._client = self._connect()
+
+    def _select(self, table: str, method: str, build=None):
+        """메서드의 컬럼 매니페스트로 select 쿼리를 만들어 실행합니다.
+
+        build는 select 빌더를 받아 필터/정렬/범위를 덧붙여 돌려주는 함수입니다.
+        매니페스트 컬럼 중 테이블에 없는 컬럼이 있으면(42703) 해당 조합은 이후 select('*')로 조회합니다.
+        select('*')도 42703이면 build가 쓴 필터/정렬 컬럼이 없는 것이므로 기록하지 않고 오류를 전달합니다.
+        """
+        build = build or (lambda query: query)
+        if (table, method) in self._select_fallbacks:
+            return self._execute(table, method, build(self._client.table(table).select('*')))
         try:
-            self._client: Client = create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
-            print("SupabaseClient initialized.")
-        except Exception as e:
-            print(f"❌ Supabase 연결 실패: {e}")
-            self._client = None
+            query = self._client.table(table).select(select_clause(COLUMN_MANIFESTS[method]))
+            return self._execute(table, method, build(query))
+        except APIError as e:
+            if e.code != '42703':
+                raise
+            message = e.message
+        response = self._execute(table, method, build(self._client.table(table).select('*')))
+        print(f"⚠️ {table} 테이블에 없는 컬럼이 있어 전체 컬럼으로 조회합니다: {message}")
+        self._select_fallbacks.add((table, method))
+        return response
+
+    def _execute(self, table: str, method: str, query):
+        """쿼리를 실행합니다. 결과 캐시가 있으면 같은 (메서드, 테이블, 필터/컬럼) 조회는 캐시에서 돌려줍니다.
+
+        조회마다 지연, 행 수, 응답 바이트, 캐시 적중, 오류를 (method, table)별로 self.metrics에 기록하고,
+        추적을 켰으면(tracing.py) supabase.query span을 남깁니다.
+        """
+        # 재시도는 http_policy의 전송 계층이 담당하므로 postgrest 자체 재시도(503/520, 최대 수 초 대기)는 끔
+        query = query.retry(False)
+        with span('supabase.query', method=method, table=table) as query_span, \
+                self.metrics.track(method, table) as call:
+            if self._cache is None:
+                response = query.execute()
+            else:
+                key, company = cache_key(table, method, query)
+                hit, response = self._cache.get(key)
+                call.cache = 'hit' if hit else 'miss'
+                if not hit:
+                    response = query.execute()
+                    self._cache.put(key, response, table, company)
+            call.response(response)
+            query_span.set_attributes({'rows': call.rows, 'cache': call.cache or 'none'})
+            return response
 
+    def invalidate(self, company: str = None, table: str = None):
+        """결과 캐시에서 회사/테이블에 해당하는 항목을 지웁니다. 둘 다 없으면 캐시 전체를 비웁니다.
+
+        결과 캐시가 없어도 data_version을 올려 세션에 둔 스냅샷을 다음 실행에서 새로 조회하게 합니다.
+        """
+        self.data_version += 1
+        if self._cache is None:
+            return 0
+        return self._cache.invalidate(company=company, table=table)
+
+    def cache_stats(self):
+        """결과 캐시 적중/미스/내보냄 통계. 캐시를 사용하지 않으면 None입니다."""
+        return self._cache.stats() if self._cache is not None else None
+
+    def cache_ttl(self, table: str) -> float:
+        """결과 캐시가 table 조회 결과를 보관하는 시간(초). 캐시를 사용하지 않으면 0입니다."""
+        return self._cache.table_ttl(table) if self._cache is not None else 0
+
+    @traced()
     def test_connection(self):
         """Supabase 연결을 테스트합니다."""
         if not self._client:
@@ -31,13 +248,14 @@ class SupabaseClient:
             return False
         try:
             print("🔍 Supabase 연결을 테스트합니다...")
-            response = self._client.table('alpha_companies_final').select('count').execute()
+            response = self._select('alpha_companies_final', 'test_connection', lambda query: query.limit(1))
             print(f"✅ Supabase 연결 성공! 테이블 접근 가능")
             return True
         except Exception as e:
             print(f"❌ Supabase 연결 테스트 실패: {e}")
             return False
 
+    @traced()
     def get_companies(self):
         """alpha_companies_final 테이블에서 회사 목록을 가져옵니다."""
         if not self._client:
@@ -45,204 +263,117 @@ class SupabaseClient:
             return []
         try:
             print("🔍 alpha_companies_final 테이블에서 데이터를 조회합니다...")
-            response = self._client.table('alpha_companies_final').select('*').execute()
-            print(f"📊 조회 결과: {len(response.data) if response.data else 0}개 레코드")
-            if response.data:
-                # Supabase에서 가져온 데이터를 앱의 company_list 형식에 맞게 변환
-                companies = []
-                for item in response.data:
-                    # '설립일' 컬럼이 연도만 있는 경우 처리
-                    founding_year = None
-                    if '설립일' in item and item['설립일']:
-                        try:
-                            # '설립일'이 숫자만 있는 경우 (예: 4)
-                            if str(item['설립일']).isdigit():
-                                founding_year = int(item['설립일'])
-                            # '설립일'이 'YYYY.MM.DD.' 형식인 경우 (예: 2020.01.01.)
-                            elif re.match(r'^\d{4}\.\d{2}\.\d{2}\.$', item['설립일']):
-                                founding_year = int(item['설립일'].split('.')[0])
-                            # '설립일'이 'YYYY' 형식인 경우
-                            elif re.match(r'^\d{4}$', item['설립일']):
-                                founding_year = int(item['설립일'])
-                        except ValueError:
-                            pass # 변환 실패 시 None 유지
-
-                    # '고용' 컬럼 처리 (예: '6명' -> '6-10명' 범위로 매핑)
-                    employee_count_str = item.get('고용', '0명').replace('명', '').strip()
-                    employee_count = '0명'
-                    if employee_count_str.isdigit():
-                        count = int(employee_count_str)
-                        if count <= 5:
-                            employee_count = '1-5명'
-                        elif count <= 10:
-                            employee_count = '6-10명'
-                        elif count <= 50:
-                            employee_count = '11-50명'
-                        elif count <= 100:
-                            employee_count = '51-100명'
-                        elif count <= 300:
-                            employee_count = '101-300명'
-                        else:
-                            employee_count = '300명 이상'
-                    
-                    # '업력' 컬럼을 'business_stage'로 매핑
-                    business_stage = '예비창업자'
-                    if '업력' in item and item['업력']:
-                        if '3년 미만' in item['업력'] or '초기' in item['업력']:
-                            business_stage = '초기창업(3년 미만)'
-                        elif '3-7년' in item['업력'] or '성장' in item['업력']:
-                            business_stage = '성장기(3-7년)'
-                        elif '7년 이상' in item['업력'] or '성숙' in item['업력']:
-                            business_stage = '성숙기(7년 이상)'
-                        elif '예비' in item['업력']:
-                            business_stage = '예비창업자'
-                    
-                    # '기술특허'와 '기업인증'을 리스트로 변환
-                    technology_fields = [f.strip() for f in item.get('기술특허', '').split(',') if f.strip()]
-                    certifications = [c.strip() for c in item.get('기업인증', '').split(',') if c.strip()]
-
-                    companies.append({
-                        'name': item.get('기업명', '알 수 없음'),
-                        'business_type': item.get('기업형태', '법인사업자'),
-                        'industry': item.get('업종', '기타'),
-                        'region': item.get('지역', '전국'),
-                        'founding_year': founding_year,
-                        'employee_count': employee_count,
-                        'business_stage': business_stage,
-                        'technology_fields': technology_fields,
-                        'certifications': certifications
-                    })
-                return companies
-            return []
+            companies = list(self.iter_companies())
+            print(f"📊 조회 결과: {len(companies)}개 레코드")
+            return companies
         except Exception as e:
             print(f"❌ Supabase에서 회사 데이터 조회 실패: {e}")
             print(f"❌ 오류 타입: {type(e)}")
             return []
 
+    def iter_companies(self, page_size: int = COMPANY_PAGE_SIZE, order_by: str = None):
+        """alpha_companies_final 테이블을 페이지 단위로 조회하며 정규화된 회사 정보를 하나씩 반환합니다.
+
+        PostgREST는 max-rows 설정을 넘는 응답을 조용히 잘라내므로 range 요청으로 끊어서 가져옵니다.
+        서버가 page_size보다 적은 행을 돌려줄 수 있으므로 빈 페이지가 나올 때까지 조회합니다.
+        정렬하지 않은 range 요청은 페이지마다 순서가 달라질 수 있으므로 order_by 뒤에 항상 고유 키(id)로 정렬하고,
+        id 컬럼이 없으면 전체 컬럼 순으로 정렬합니다 (값이 모두 같은 행은 서로 바뀌어도 결과가 같음).
+        조회 중 오류가 발생하면 예외를 그대로 전달합니다.
+        """
+        if not self._client:
+            print("❌ Supabase 클라이언트가 초기화되지 않았습니다.")
+            return
+        start = 0
+        while True:
+            order = ((order_by,) if order_by else ()) + self._company_order
+
+            def build(query, start=start, order=order):
+                return order_by_columns(query, order).range(start, start + page_size - 1)
+            try:
+                response = self._select('alpha_companies_final', 'get_companies', build)
+            except APIError as e:
+                # 정렬은 첫 페이지에서만 바꿀 수 있음 (중간에 바꾸면 페이지가 어긋남)
+                if e.code != '42703' or start or self._company_order != COMPANY_PAGE_ORDER:
+                    raise
+                print("⚠️ alpha_companies_final에 id 컬럼이 없어 전체 컬럼 순으로 나눠 조회합니다 "
+                      "(sql/mirror_sync_columns.sql 참고).")
+                self._company_order = self.table_columns('alpha_companies_final')
+                if not self._company_order:
+                    self._company_order = COMPANY_PAGE_ORDER
+                    return
+                continue
+            rows = response.data or []
+            if not rows:
+                break
+            yield from normalize_companies(rows)
+            start += len(rows)
+
+    @traced()
     def get_recommendations(self, company_name: str, is_active_only: bool = False, is_new_announcements: bool = False):
         """recommend_final 테이블에서 추천 공고를 가져옵니다."""
         if not self._client:
             return []
         try:
-            query = self._client.table('recommend_final').select('*').eq('기업명', company_name)
+            def build(query):
+                return query.eq('기업명', company_name)
 
             if is_active_only or is_new_announcements:
                 today = datetime.now().date()
+                # 기간 뷰가 있으면 조건에 맞는 행만 서버에서 걸러서 받음
+                if self._period_view_available:
+                    try:
+                        response = self._select(
+                            PERIOD_VIEW, 'get_recommendations',
+                            lambda query: filter_period_query(build(query), is_active_only, today)
+                        )
+                        return response.data
+                    except APIError as e:
+                        if e.code not in MISSING_RELATION_CODES:
+                            raise
+                        print(f"⚠️ {PERIOD_VIEW} 뷰가 없어 클라이언트에서 기간을 필터링합니다.")
+                        self._period_view_available = False
+
                 # '사업 연도' 컬럼에서 시작일과 종료일 파싱
-                response = query.execute()
-                filtered_data = []
-                for item in response.data:
-                    period_str = item.get('사업 연도')
-                    if not period_str:
-                        continue
-
-                    start_date_match = re.search(r'(\d{8})\s*~', period_str)
-                    end_date_match = re.search(r'~\s*(\d{8})', period_str)
-
-                    start_date = None
-                    end_date = None
-
-                    if start_date_match:
-                        try:
-                            start_date = datetime.strptime(start_date_match.group(1), '%Y%m%d').date()
-                        except ValueError:
-                            pass
-                    if end_date_match:
-                        try:
-                            end_date = datetime.strptime(end_date_match.group(1), '%Y%m%d').date()
-                        except ValueError:
-                            pass
-                    
-                    # '예산 소진시까지' 또는 '상시' 처리
-                    if '예산 소진시까지' in period_str or '상시' in period_str:
-                        is_always_active = True
-                    else:
-                        is_always_active = False
-
-                    if is_active_only:
-                        if is_always_active or (start_date and end_date and start_date <= today <= end_date):
-                            filtered_data.append(item)
-                    elif is_new_announcements:
-                        if start_date and (today - start_date).days <= 5: # 5일 이내 신규 공고
-                            filtered_data.append(item)
-                    else: # 전체 공고
-                        filtered_data.append(item)
-                return filtered_data
+                response = self._select('recommend_final', 'get_recommendations', build)
+                return filter_periods(response.data, is_active_only, today)
             
-            response = query.execute()
+            response = self._select('recommend_final', 'get_recommendations', build)
             return response.data
         except Exception as e:
             print(f"Error fetching recommendations from Supabase: {e}")
             return []
 
+    @traced()
     def get_monthly_recommendations(self, company_name: str = None):
         """월별 공고 수를 가져옵니다. 회사명이 지정되면 해당 회사의 추천 공고만 대상으로 합니다."""
         if not self._client:
             return {i: 0 for i in range(1, 13)}
         try:
+            # 집계 RPC가 있으면 서버에서 월별로 센 결과(최대 12행)만 받음
+            if self._monthly_rpc_available:
+                try:
+                    response = self._execute(MONTHLY_COUNTS_RPC, 'get_monthly_recommendations',
+                                             self._client.rpc(MONTHLY_COUNTS_RPC, monthly_counts_args(company_name), get=True))
+                    return monthly_counts_from_rpc(response.data)
+                except APIError as e:
+                    if e.code not in MISSING_FUNCTION_CODES:
+                        raise
+                    print(f"⚠️ {MONTHLY_COUNTS_RPC} 함수가 없어 클라이언트에서 월별 공고 수를 집계합니다.")
+                    self._monthly_rpc_available = False
+
             if company_name:
                 # 특정 회사의 추천 공고만 가져오기 (전체 데이터 가져온 후 필터링)
-                response = self._client.table('recommend_final').select('*').eq('기업명', company_name).execute()
+                response = self._select('recommend_final', 'get_monthly_recommendations', lambda query: query.eq('기업명', company_name))
             else:
                 # 모든 공고 가져오기 (전체 데이터 가져온 후 필터링)
-                response = self._client.table('recommend_final').select('*').execute()
-            
-            monthly_counts = {i: 0 for i in range(1, 13)}
-            
-            for item in response.data:
-                period_str = item.get('사업 연도', '')
-                if not period_str:
-                    continue
-                
-                # 더 포괄적인 날짜 패턴 시도
-                date_patterns = [
-                    r'"(\d{8})"',  # "yyyymmdd" 형식
-                    r'(\d{8})\s*~',  # yyyymmdd ~ 형식  
-                    r'(\d{8})',  # 일반 yyyymmdd 형식
-                    r'(\d{4})년\s*(\d{1,2})월',  # 2025년 1월 형식
-                    r'(\d{4})\.(\d{1,2})\.(\d{1,2})',  # 2025.01.15 형식
-                ]
-                
-                parsed = False
-                for pattern in date_patterns:
-                    match = re.search(pattern, period_str)
-                    if match:
-                        try:
-                            if pattern == r'(\d{4})년\s*(\d{1,2})월':
-                                # 2025년 1월 형식
-                                year = int(match.group(1))
-                                month = int(match.group(2))
-                                monthly_counts[month] += 1
-                                parsed = True
-                                break
-                            elif pattern == r'(\d{4})\.(\d{1,2})\.(\d{1,2})':
-                                # 2025.01.15 형식
-                                year = int(match.group(1))
-                                month = int(match.group(2))
-                                monthly_counts[month] += 1
-                                parsed = True
-                                break
-                            else:
-                                # yyyymmdd 형식
-                                start_date_str = match.group(1)
-                                start_date = datetime.strptime(start_date_str, '%Y%m%d').date()
-                                month = start_date.month
-                                monthly_counts[month] += 1
-                                parsed = True
-                                break
-                        except:
-                            continue
-                
-                # 연도만 있는 경우 (예: "2025")는 제외 - yyyymmdd ~ yyyymmdd 형식만 사용
-                # if not parsed and period_str.isdigit() and len(period_str) == 4:
-                #     # 연도만 있는 데이터는 제외
-                #     pass
+                response = self._select('recommend_final', 'get_monthly_recommendations')
             
-            return monthly_counts
+            return count_months(response.data)
         except Exception as e:
             print(f"Error fetching monthly recommendations from Supabase: {e}")
             return {i: 0 for i in range(1, 13)}
 
+    @traced()
     def get_monthly_details(self, month: int, company_name: str = None):
         """특정 월의 상세 공고 목록을 가져옵니다. 회사명이 지정되면 해당 회사의 추천 공고만 대상으로 합니다."""
         if not self._client:
@@ -250,85 +381,101 @@ class SupabaseClient:
         try:
             if company_name:
                 # 특정 회사의 추천 공고만 가져오기
-                response = self._client.table('recommend_final').select('*').eq('기업명', company_name).execute()
+                response = self._select('recommend_final', 'get_monthly_details', lambda query: query.eq('기업명', company_name))
             else:
                 # 모든 공고 가져오기
-                response = self._client.table('recommend_final').select('*').execute()
+                response = self._select('recommend_final', 'get_monthly_details')
             
-            monthly_details = []
-            for item in response.data:
-                period_str = item.get('사업 연도', '')
-                if not period_str:
-                    continue
-                
-                # 더 포괄적인 날짜 패턴 시도
-                date_patterns = [
-                    r'"(\d{8})"',  # "yyyymmdd" 형식
-                    r'(\d{8})\s*~',  # yyyymmdd ~ 형식  
-                    r'(\d{8})',  # 일반 yyyymmdd 형식
-                    r'(\d{4})년\s*(\d{1,2})월',  # 2025년 1월 형식
-                    r'(\d{4})\.(\d{1,2})\.(\d{1,2})',  # 2025.01.15 형식
-                ]
-                
-                parsed = False
-                for pattern in date_patterns:
-                    match = re.search(pattern, period_str)
-                    if match:
-                        try:
-                            if pattern == r'(\d{4})년\s*(\d{1,2})월':
-                                # 2025년 1월 형식
-                                year = int(match.group(1))
-                                item_month = int(match.group(2))
-                                if item_month == month:
-                                    monthly_details.append(item)
-                                parsed = True
-                                break
-                            elif pattern == r'(\d{4})\.(\d{1,2})\.(\d{1,2})':
-                                # 2025.01.15 형식
-                                year = int(match.group(1))
-                                item_month = int(match.group(2))
-                                if item_month == month:
-                                    monthly_details.append(item)
-                                parsed = True
-                                break
-                            else:
-                                # yyyymmdd 형식
-                                start_date_str = match.group(1)
-                                start_date = datetime.strptime(start_date_str, '%Y%m%d').date()
-                                if start_date.month == month:
-                                    monthly_details.append(item)
-                                parsed = True
-                                break
-                        except:
-                            continue
-                
-                # 연도만 있는 경우 (예: "2025")는 제외 - yyyymmdd ~ yyyymmdd 형식만 사용
-                # if not parsed and period_str.isdigit() and len(period_str) == 4:
-                #     # 연도만 있는 데이터는 제외
-                #     pass
+            monthly_details = [item for item in response.data if parse_period(item.get('사업 연도')).month == month]
             
-            # 컬럼명 변경
-            df = pd.DataFrame(monthly_details)
-            if not df.empty:
-                df = df.rename(columns={
-                    '사업명': '공고명',
-                    '최종 점수': '총점수',
-                    '지역': '지역명',
-                    '사업 연도': '신청기간',
-                    '상세페이지 URL': '공고URL'
-                })
-                # 순위 추가
-                df['순위'] = range(1, len(df) + 1)
-                # 데이터소스 컬럼 추가 (기본값)
-                df['데이터소스'] = 'recommend_final'
-                # 지원분야, 지원대상, 소관기관 컬럼 추가 (기본값)
-                df['지원분야'] = '기타'
-                df['지원대상'] = '중소기업'
-                df['소관기관'] = '정부기관'
-                return df.to_dict('records')
-            return []
+            return format_detail_records(monthly_details)
         except Exception as e:
             print(f"Error fetching monthly details from Supabase: {e}")
             return []
 
-supabase_client = SupabaseClient()
+
+class SupabaseClient(RecommendationClient):
+    """Supabase(PostgREST)에서 직접 조회하는 클라이언트. local_mirror 동기화의 원본(fetch_changes, fetch_rows)도 됩니다."""
+
+    def _connect(self):
+        """조회에 쓸 supabase 클라이언트를 만듭니다. 환경변수가 없거나 연결에 실패하면 None입니다."""
+        if not SUPABASE_URL or not SUPABASE_ANON_KEY:
+            print("⚠️ Supabase 환경변수가 설정되지 않았습니다. Streamlit Cloud에서 환경변수를 설정해주세요.")
+            return None
+        try:
+            # supabase 패키지(auth/storage/realtime 포함)는 import가 무거우므로 클라이언트를 만들 때 불러옴
+            from supabase import create_client, ClientOptions
+            options = ClientOptions(httpx_client=build_http_client(self.http_policy))
+            client = create_client(SUPABASE_URL, SUPABASE_ANON_KEY, options)
+            print("SupabaseClient initialized.")
+            return client
+        except Exception as e:
+            print(f"❌ Supabase 연결 실패: {e}")
+            return None
+
+    def fetch_changes(self, table: str, watermark: str, key: str, after=None, page_size: int = COMPANY_PAGE_SIZE):
+        """(watermark, key) 순으로 정렬한 테이블 행을 after 다음부터 page_size개 가져옵니다 (local_mirror 동기화용).
+
+        after는 마지막으로 받은 행의 (watermark 값, key 값)입니다. key 값이 None이면 watermark 값 이상인 행부터 가져옵니다.
+        결과 캐시를 거치지 않고, 오류(컬럼이 없으면 42703 등)는 그대로 전달합니다.
+        """
+        query = self._client.table(table).select('*').order(watermark).order(key).limit(page_size)
+        if after is not None:
+            after_watermark, after_key = after
+            if after_key is None:
+                query = query.gte(watermark, after_watermark)
+            else:
+                query = query.or_(f'{watermark}.gt."{after_watermark}",'
+                                  f'and({watermark}.eq."{after_watermark}",{key}.gt."{after_key}")')
+        with self.metrics.track('fetch_changes', table) as call:
+            return call.response(query.retry(False).execute()).data
+
+    def fetch_rows(self, table: str, start: int, page_size: int = COMPANY_PAGE_SIZE, order=()):
+        """테이블 전체 컬럼을 order 순으로 start번째 행부터 page_size개 가져옵니다 (watermark 컬럼이 없을 때의 전체 복사용).
+
+        페이지가 겹치거나 빠지지 않으려면 order가 행 순서를 하나로 정해야 합니다 (고유 키 또는 table_columns()).
+        """
+        query = order_by_columns(self._client.table(table).select('*'), order).range(start, start + page_size - 1)
+        with self.metrics.track('fetch_rows', table) as call:
+            return call.response(query.retry(False).execute()).data
+
+    def table_columns(self, table: str):
+        """테이블 한 행을 읽어 컬럼 목록을 돌려줍니다. 행이 없으면 빈 튜플입니다."""
+        query = self._client.table(table).select('*').limit(1)
+        with self.metrics.track('table_columns', table) as call:
+            rows = call.response(query.retry(False).execute()).data
+        return tuple(rows[0]) if rows else ()
+
+
+def default_result_cache():
+    """SUPABASE_RESULT_CACHE_MB 환경변수로 결과 캐시를 만듭니다. 설정하지 않았으면 None입니다."""
+    if SUPABASE_RESULT_CACHE_MB <= 0:
+        return None
+    return ResultCache(max_bytes=int(SUPABASE_RESULT_CACHE_MB * 1024 * 1024))
+
+
+_supabase_client = None
+_supabase_client_lock = threading.Lock()
+
+
+def get_supabase_client():
+    """프로세스에 하나뿐인 데이터 백엔드(기본: SupabaseClient)를 돌려줍니다. 처음 호출할 때 만듭니다."""
+    global _supabase_client
+    if _supabase_client is None:
+        with _supabase_client_lock:
+            if _supabase_client is None:
+                _supabase_client = _create_default_client()
+    return _supabase_client
+
+
+def _create_default_client():
+    """DATA_BACKEND 환경변수로 고른 백엔드 (기본: SupabaseClient, backends.py 참고)"""
+    from backends import create_backend
+    return create_backend()
+
+
+def __getattr__(name):
+    # 기존 코드의 `from supabase_client import supabase_client`도 처음 사용할 때 클라이언트를 만들도록 함
+    if name == 'supabase_client':
+        return get_supabase_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,268 @@
+"""합성 데이터셋 생성기 (alpha_companies_final, recommend_final)
+
+운영 규모로 벤치마크/부하 테스트를 할 수 있도록 두 테이블과 같은 모양의 행을 만들어 파일로 씁니다.
+값은 정규화/파서가 처리하는 형식을 모두 섞습니다.
+  - 기업명: 한글 음절 + 업종 접미어 + 법인 표기('(주)', '주식회사', '㈜'). 첫 회사는 항상 '대박드림스'
+  - 설립일: 'YYYY.MM.DD.', 'YYYY', 업력 연수('4'), 전각 숫자, 해석하지 않는 'YYYY-MM-DD', 빈 값
+  - 고용: 'N명', ' N 명', '미상', 빈 값 / 업력: '3년 미만', '성장기', '7년 이상', '예비창업' 등
+  - 사업 연도: 'yyyymmdd ~ yyyymmdd', 'yyyymmdd ~', '"yyyymmdd"', '예산 소진시까지', '상시 모집',
+    '2025년 1월', '2025.01.15', 빈 값 (날짜는 --today 기준)
+두 테이블 모두 local_mirror 증분 동기화용 id, updated_at 컬럼을 가집니다.
+
+열 단위(numpy)로 만들므로 100만 행도 몇 초 안에 만들고, 같은 --seed와 --today면 같은 데이터가 나옵니다.
+출력 형식
+  - parquet: 디렉토리에 테이블별 .parquet 파일
+  - sqlite: local_mirror 미러 파일 (DATA_BACKEND=sqlite, SUPABASE_MIRROR_PATH로 바로 사용)
+  - json: {테이블명: 행 목록} 파일 (DATA_BACKEND=memory, MEMORY_BACKEND_PATH로 바로 사용)
+
+    python synthetic_data.py --companies 100000 --recommendations 1000000 --format sqlite --out synthetic.sqlite3
+"""
+import argparse
+import json
+import os
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+COMPANY_TABLE = 'alpha_companies_final'
+RECOMMENDATION_TABLE = 'recommend_final'
+FORMATS = ('parquet', 'sqlite', 'json')
+
+# 앱이 처음에 선택하는 회사 (app.DEFAULT_COMPANY_NAME)
+FIRST_COMPANY_NAME = '대박드림스'
+NAME_SYLLABLES = list('가나다라마바사아자차카타파하한대민국서울부산새빛별솔늘온누리해달강산숲샘알찬참빛결담')
+NAME_SUFFIXES = ['테크', '랩스', '바이오', '솔루션', '드림스', '에너지', '로보틱스', '소프트', '네트웍스', '헬스케어',
+                 '푸드', '모빌리티', '디자인', '커머스', '파트너스', '시스템즈', '메디컬', '에듀', 'AI', '인더스트리']
+LEGAL_FORMS = ['', '', '', '(주)', '주식회사 ', '㈜']
+BUSINESS_TYPES = ['법인사업자', '개인사업자', None]
+INDUSTRIES = ['IT/소프트웨어', '바이오/헬스케어', '제조', '유통/서비스', '에너지/환경', '콘텐츠/미디어', '교육', None]
+REGIONS = ['서울특별시', '부산광역시', '대구광역시', '인천광역시', '광주광역시', '대전광역시', '울산광역시',
+           '세종특별자치시', '경기도', '강원도', '충청북도', '충청남도', '전라북도', '전라남도', '경상북도',
+           '경상남도', '제주특별자치도', '전국']
+STAGES = ['3년 미만', '초기 단계', '3-7년', '성장기', '7년 이상', '성숙', '예비창업', '기타', '', None]
+TECHNOLOGIES = ['AI', '바이오', '데이터분석', '로봇', '반도체', 'IoT', '블록체인', '클라우드', '신소재', '핀테크']
+CERTIFICATIONS = ['벤처기업확인서', '이노비즈', '메인비즈', '기업부설연구소', '여성기업', '사회적기업']
+PROGRAM_TOPICS = ['창업도약패키지', 'AI 허브 멤버십', '해외진출 지원사업', '기술혁신 지원사업', '스마트공장 구축',
+                  '청년창업사관학교', '수출바우처', 'R&D 바우처', '사업화 지원', '판로개척 지원', '투자유치 IR',
+                  '디지털 전환 지원']
+PROGRAM_HOSTS = ['서울', '경기', '부산', '중소벤처기업부', '창업진흥원', 'K-스타트업', '정보통신산업진흥원']
+
+# 설립일 형식별 비율: YYYY.MM.DD. / YYYY / 업력 연수 / 전각 YYYY / YYYY-MM-DD / 빈 문자열 / NULL
+FOUNDING_FORMAT_WEIGHTS = [0.55, 0.15, 0.08, 0.02, 0.1, 0.05, 0.05]
+# 사업 연도 형식별 비율: 기간 / 시작일만 / "yyyymmdd" / 예산 소진시까지 / 상시 모집 / yyyy년 m월 / yyyy.mm.dd / 빈 값 / NULL
+PERIOD_FORMAT_WEIGHTS = [0.55, 0.05, 0.03, 0.1, 0.07, 0.07, 0.07, 0.03, 0.03]
+FULLWIDTH_DIGITS = str.maketrans('0123456789', '０１２３４５６７８９')
+
+
+def _pick(rng, choices, size, weights=None):
+    """choices에서 size개를 뽑은 object 배열 (None 포함 가능)"""
+    index = rng.choice(len(choices), size=size, p=weights)
+    return np.asarray(choices, dtype=object)[index]
+
+
+def _join(*parts):
+    """문자열 배열(또는 문자열)을 원소별로 이어 붙입니다."""
+    result = parts[0]
+    for part in parts[1:]:
+        result = result + part
+    return result
+
+
+def _date_strings(base, low, high, separator=''):
+    """base(datetime64[D])에서 low~high-1일 떨어진 날짜 문자열 표 ('yyyymmdd' 또는 구분자 포함)
+
+    날짜 종류가 적으므로 행마다 문자열을 만들지 않고, 이 표를 오프셋으로 인덱싱해 씁니다.
+    """
+    days = base + np.arange(low, high).astype('timedelta64[D]')
+    return np.array([text.replace('-', separator) for text in np.datetime_as_string(days, unit='D')], dtype=object)
+
+
+def _mixed(kind, size, formats):
+    """kind[i]번째 형식의 값을 고른 object 배열. formats는 (형식 번호, 값 또는 값을 만드는 함수(mask)) 목록
+
+    값을 만드는 함수는 해당 형식인 행(mask)에 대해서만 호출하므로 필요한 행만 문자열을 만듭니다.
+    """
+    result = np.full(size, None, dtype=object)
+    for index, value in formats:
+        mask = kind == index
+        result[mask] = value(mask) if callable(value) else value
+    return result
+
+
+def _comma_lists(rng, words, size, max_items=3):
+    """쉼표로 구분한 0~max_items개 단어 목록 문자열 (빈 문자열, NULL 포함)"""
+    counts = rng.integers(0, max_items + 1, size)
+    picks = rng.integers(0, len(words), (size, max_items))
+    vocabulary = np.asarray(words, dtype=object)
+    result = np.full(size, '', dtype=object)
+    for position in range(max_items):
+        has = counts > position
+        separator = np.where(has & (position > 0), ',', '')
+        result = np.where(has, result + separator + vocabulary[picks[:, position]], result)
+    result[rng.random(size) < 0.05] = None
+    return result
+
+
+def _watermarks(rng, size, today):
+    """최근 30일 사이의 updated_at (ISO 형식, 행 순서대로 증가)"""
+    base = np.datetime64(today) - np.timedelta64(30, 'D')
+    seconds = np.sort(rng.integers(0, 30 * 24 * 3600, size))
+    stamps = np.datetime_as_string(base + seconds.astype('timedelta64[s]'), unit='s')
+    return (stamps.astype(object) + '+09:00')
+
+
+def company_names(count, seed=0):
+    """한글 회사명 count개. 첫 번째는 FIRST_COMPANY_NAME이고, 드물게 같은 이름이 반복될 수 있습니다."""
+    rng = np.random.default_rng(seed)
+    syllables = np.asarray(NAME_SYLLABLES, dtype=object)
+    lengths = rng.choice([2, 3], size=count, p=[0.6, 0.4])
+    stems = _join(*(syllables[rng.integers(0, len(syllables), count)] for _ in range(2)))
+    third = syllables[rng.integers(0, len(syllables), count)]
+    stems = np.where(lengths == 3, stems + third, stems)
+    names = _join(stems, _pick(rng, NAME_SUFFIXES, count))
+    forms = _pick(rng, LEGAL_FORMS, count)
+    prefix = np.char.endswith(forms.astype(str), ' ')
+    names = np.where(prefix, forms + names, names + forms)
+    if count:
+        names[0] = FIRST_COMPANY_NAME
+    return names
+
+
+def make_companies(count, seed=0, today=None):
+    """alpha_companies_final 모양의 테이블 ({컬럼명: 값 배열})"""
+    today = today or date.today()
+    rng = np.random.default_rng(seed + 1)
+    years = rng.integers(1990, today.year + 1, count)
+    founded = _date_strings(np.datetime64(f'{today.year - 35}-01-01'), 0, 35 * 365, '.')[
+        rng.integers(0, 35 * 365, count)]
+    year_text = years.astype(str).astype(object)
+    founding = _mixed(rng.choice(7, size=count, p=FOUNDING_FORMAT_WEIGHTS), count, [
+        (0, lambda mask: founded[mask] + '.'),
+        (1, lambda mask: year_text[mask]),
+        (2, lambda mask: (today.year - years[mask]).astype(str).astype(object)),
+        (3, lambda mask: np.array([text.translate(FULLWIDTH_DIGITS) for text in year_text[mask]], dtype=object)),
+        (4, lambda mask: np.array([text.replace('.', '-') for text in founded[mask]], dtype=object)),
+        (5, ''),
+    ])
+    employees = np.minimum(rng.lognormal(2.3, 1.2, count).astype(int), 2000).astype(str).astype(object)
+    # 고용 형식별 비율: N명 / ' N 명' / 미상 / 빈 문자열 / NULL
+    employment = _mixed(rng.choice(5, size=count, p=[0.85, 0.05, 0.05, 0.02, 0.03]), count, [
+        (0, lambda mask: employees[mask] + '명'),
+        (1, lambda mask: ' ' + employees[mask] + ' 명'),
+        (2, '미상'),
+        (3, ''),
+    ])
+    return {
+        'id': np.arange(1, count + 1),
+        '기업명': company_names(count, seed),
+        '기업형태': _pick(rng, BUSINESS_TYPES, count, [0.7, 0.25, 0.05]),
+        '업종': _pick(rng, INDUSTRIES, count),
+        '지역': _pick(rng, REGIONS, count),
+        '설립일': founding,
+        '고용': employment,
+        '업력': _pick(rng, STAGES, count),
+        '기술특허': _comma_lists(rng, TECHNOLOGIES, count),
+        '기업인증': _comma_lists(rng, CERTIFICATIONS, count),
+        'updated_at': _watermarks(rng, count, today),
+    }
+
+
+def make_recommendations(count, names, seed=0, today=None):
+    """recommend_final 모양의 테이블. 회사는 names에서 고르되 앞쪽 회사일수록 공고가 많습니다."""
+    today = today or date.today()
+    rng = np.random.default_rng(seed + 2)
+    names = np.asarray(names, dtype=object) if len(names) else np.array([FIRST_COMPANY_NAME], dtype=object)
+    # 회사별 공고 수가 고르지 않도록 지수 분포로 회사를 고름 (첫 회사는 항상 공고가 있음)
+    company_index = rng.exponential(len(names) / 4, count).astype(int) % len(names)
+    company_index[:1] = 0
+    # 시작일은 오늘 -90 ~ +14일, 종료일은 -30 ~ +89일, 'yyyy.mm.dd'는 -180 ~ +179일
+    days = _date_strings(np.datetime64(today), -180, 180)
+    dotted = _date_strings(np.datetime64(today), -180, 180, '.')
+    start = days[rng.integers(90, 195, count)]
+    end = days[rng.integers(150, 270, count)]
+    months = np.array([f'{today.year}년 {month}월' for month in range(1, 13)], dtype=object)
+    period = _mixed(rng.choice(9, size=count, p=PERIOD_FORMAT_WEIGHTS), count, [
+        (0, lambda mask: start[mask] + ' ~ ' + end[mask]),
+        (1, lambda mask: start[mask] + ' ~'),
+        (2, lambda mask: '"' + start[mask] + '"'),
+        (3, '예산 소진시까지'),
+        (4, lambda mask: '상시 모집 (' + start[mask] + ' ~ )'),
+        (5, lambda mask: months[rng.integers(0, 12, mask.sum())]),
+        (6, lambda mask: dotted[rng.integers(0, 360, mask.sum())]),
+        (7, ''),
+    ])
+    titles = np.array([f'{today.year}년 {host} {topic} 공고 ' for host in PROGRAM_HOSTS for topic in PROGRAM_TOPICS],
+                      dtype=object)
+    ids = np.arange(1, count + 1)
+    id_text = ids.astype(str).astype(object)
+    return {
+        'id': ids,
+        '기업명': names[company_index],
+        '사업명': titles[rng.integers(0, len(titles), count)] + id_text,
+        '최종 점수': np.round(rng.uniform(30, 100, count), 2),
+        '지역': _pick(rng, REGIONS, count),
+        '사업 연도': period,
+        '상세페이지 URL': 'https://example.com/announcements/' + id_text,
+        'updated_at': _watermarks(rng, count, today),
+    }
+
+
+def make_tables(companies, recommendations, seed=0, today=None):
+    """{테이블명: {컬럼명: 값 배열}}"""
+    company_table = make_companies(companies, seed, today)
+    return {
+        COMPANY_TABLE: company_table,
+        RECOMMENDATION_TABLE: make_recommendations(recommendations, company_table['기업명'], seed, today),
+    }
+
+
+def table_rows(table):
+    """테이블({컬럼명: 값 배열})을 행(dict) 목록으로 바꿉니다."""
+    columns = list(table)
+    return [dict(zip(columns, values)) for values in zip(*(table[column].tolist() for column in columns))]
+
+
+def write_tables(tables, fmt: str, out: str):
+    """tables를 fmt 형식으로 out에 씁니다."""
+    if fmt == 'parquet':
+        os.makedirs(out, exist_ok=True)
+        for name, table in tables.items():
+            pd.DataFrame(table).to_parquet(os.path.join(out, f'{name}.parquet'), index=False)
+    elif fmt == 'json':
+        # json.dump(f)는 조각마다 파이썬 인코더를 거치므로 C 인코더(json.dumps)로 한 번에 만들어 씀
+        text = json.dumps({name: table_rows(table) for name, table in tables.items()}, ensure_ascii=False)
+        with open(out, 'w', encoding='utf-8') as f:
+            f.write(text)
+    elif fmt == 'sqlite':
+        from local_mirror import LocalMirror
+        if os.path.exists(out):
+            os.remove(out)
+        mirror = LocalMirror(out)
+        for name, table in tables.items():
+            mirror.load(name, table_rows(table))
+    else:
+        raise ValueError(f"알 수 없는 형식: {fmt}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="alpha_companies_final / recommend_final 합성 데이터를 만듭니다.")
+    parser.add_argument('--companies', type=int, default=10000)
+    parser.add_argument('--recommendations', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--today', type=date.fromisoformat, default=None, help='날짜 기준일 (YYYY-MM-DD, 기본: 오늘)')
+    parser.add_argument('--format', choices=FORMATS, default='parquet')
+    parser.add_argument('--out', required=True, help='parquet는 디렉토리, sqlite/json은 파일 경로')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    tables = make_tables(args.companies, args.recommendations, args.seed, args.today)
+    generated = time.perf_counter() - started
+    write_tables(tables, args.format, args.out)
+    print(f"✅ 회사 {args.companies:,}곳, 추천 공고 {args.recommendations:,}행 생성 {generated:.1f}초, "
+          f"{args.format} 저장 {time.perf_counter() - started - generated:.1f}초 -> {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+"""재실행 추적 (선택, OpenTelemetry)
+
+느린 재실행에서 시간이 어디에 쓰였는지(Supabase 조회, pandas 가공, Styler, st.dataframe 직렬화) 보려고
+재실행 -> 탭 함수 -> 표시 단계 -> 클라이언트 메서드 -> Supabase 조회 순으로 중첩된 span을 남깁니다.
+
+TRACING_EXPORTER로 켭니다 (opentelemetry-api, opentelemetry-sdk 패키지 필요).
+  - console: 끝난 span을 표준 출력에 JSON으로 출력
+  - file: 끝난 span을 TRACING_FILE(기본 traces.jsonl)에 한 줄에 하나씩 추가
+설정하지 않았거나 패키지가 없으면 traced()는 함수를 그대로 돌려주고 span()은 아무것도 하지 않으므로
+추적을 끈 상태의 비용은 span() 블록마다 함수 호출 한 번입니다.
+
+파일로 남긴 추적은 이 모듈로 span 트리(가장 최근 재실행)를 볼 수 있습니다.
+
+    TRACING_EXPORTER=file streamlit run app.py
+    python tracing.py traces.jsonl [--trace 2]   # 최근 두 번째 추적
+"""
+import argparse
+import atexit
+import functools
+import json
+import os
+from contextlib import nullcontext
+
+TRACING_EXPORTER = os.environ.get("TRACING_EXPORTER", "").lower()
+TRACING_FILE = os.environ.get("TRACING_FILE", "traces.jsonl")
+SERVICE_NAME = "startup-recommendation-app"
+
+
+class _NoopSpan:
+    """추적을 끈 상태의 span (속성 기록을 무시)"""
+
+    def set_attribute(self, key, value):
+        pass
+
+    def set_attributes(self, attributes):
+        pass
+
+
+_NOOP_SPAN = nullcontext(_NoopSpan())
+
+
+def _create_tracer():
+    """TRACING_EXPORTER에 맞는 tracer. 끄거나 패키지가 없으면 None입니다."""
+    if not TRACING_EXPORTER:
+        return None
+    if TRACING_EXPORTER not in ('console', 'file'):
+        print(f"⚠️ 알 수 없는 TRACING_EXPORTER '{TRACING_EXPORTER}'입니다 (console, file). 추적을 끕니다.")
+        return None
+    try:
+        from opentelemetry import trace
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+    except ImportError:
+        print("⚠️ opentelemetry-sdk 패키지가 없어 추적을 끕니다. `pip install opentelemetry-api opentelemetry-sdk`")
+        return None
+
+    # 다른 곳(opentelemetry-instrument 등)에서 이미 전역 provider를 정했으면 그쪽을 따름
+    if not isinstance(trace.get_tracer_provider(), trace.ProxyTracerProvider):
+        print("🧭 이미 설정된 OpenTelemetry tracer provider로 추적합니다.")
+        return trace.get_tracer(__name__)
+
+    out = None
+    if TRACING_EXPORTER == 'file':
+        out = open(TRACING_FILE, 'a', encoding='utf-8')
+        exporter = ConsoleSpanExporter(out=out, formatter=lambda span: span.to_json(indent=None) + '\n')
+        print(f"🧭 추적을 {TRACING_FILE}에 기록합니다.")
+    else:
+        exporter = ConsoleSpanExporter()
+    # 종료 시 남은 span을 내보낸 뒤 파일을 닫도록 shutdown은 직접 등록함
+    provider = TracerProvider(resource=Resource.create({'service.name': SERVICE_NAME}), shutdown_on_exit=False)
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    atexit.register(_shutdown, provider, out)
+    return trace.get_tracer(__name__)
+
+
+def _shutdown(provider, out=None):
+    """남은 span을 내보내고 추적 파일을 닫습니다."""
+    provider.shutdown()
+    if out is not None:
+        out.close()
+
+
+_tracer = _create_tracer()
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+def span(name: str, **attributes):
+    """name span을 여는 컨텍스트 관리자. 현재 span의 자식이 되고, 블록의 예외는 span에 기록됩니다."""
+    if _tracer is None:
+        return _NOOP_SPAN
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
+
+def traced(name: str = None):
+    """함수 호출마다 span을 여는 데코레이터 (이름 기본값: 함수의 __qualname__). 추적을 끄면 함수를 그대로 돌려줍니다."""
+    def decorate(fn):
+        if _tracer is None:
+            return fn
+        span_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with _tracer.start_as_current_span(span_name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def bind(fn):
+    """현재 추적 컨텍스트를 fn에 묶습니다. 스레드 풀에 넘긴 작업의 span도 제출한 span의 자식이 됩니다."""
+    if _tracer is None:
+        return fn
+    from opentelemetry import context
+
+    parent = context.get_current()
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        token = context.attach(parent)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            context.detach(token)
+    return wrapper
+
+
+def _read_spans(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _print_tree(spans):
+    """한 추적의 span을 부모-자식 트리로, 시작 순서대로 출력합니다 (시작 시각, 소요 시간)."""
+    from datetime import datetime
+
+    def parse(value):
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+    children = {}
+    ids = {item['context']['span_id'] for item in spans}
+    for item in spans:
+        parent = item.get('parent_id')
+        children.setdefault(parent if parent in ids else None, []).append(item)
+    origin = min(parse(item['start_time']) for item in spans)
+
+    def walk(parent, depth):
+        for item in sorted(children.get(parent, []), key=lambda item: item['start_time']):
+            start, end = parse(item['start_time']), parse(item['end_time'])
+            attributes = ', '.join(f'{key}={value}' for key, value in item.get('attributes', {}).items())
+            print(f"{(start - origin).total_seconds() * 1000:>9.1f}ms {(end - start).total_seconds() * 1000:>9.1f}ms  "
+                  f"{'  ' * depth}{item['name']}" + (f"  ({attributes})" if attributes else ''))
+            walk(item['context']['span_id'], depth + 1)
+
+    print(f"{'시작':>11} {'소요':>11}  span")
+    walk(None, 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추적 파일(TRACING_EXPORTER=file)의 span 트리 출력")
+    parser.add_argument('path', nargs='?', default=TRACING_FILE)
+    parser.add_argument('--trace', type=int, default=1, help='최근 몇 번째 추적을 볼지 (1: 가장 최근)')
+    args = parser.parse_args()
+
+    traces = {}
+    for item in _read_spans(args.path):
+        traces.setdefault(item['context']['trace_id'], []).append(item)
+    if not traces:
+        print(f"⚠️ {args.path}에 추적이 없습니다.")
+        return
+    ordered = sorted(traces.values(), key=lambda spans: min(item['start_time'] for item in spans))
+    spans = ordered[-min(args.trace, len(ordered))]
+    print(f"🧭 추적 {spans[0]['context']['trace_id']} (span {len(spans)}개, 전체 추적 {len(traces)}개)")
+    _print_tree(spans)
+
+
+if __name__ == '__main__':
+    main()